@@ -1,16 +1,48 @@
 #!/usr/bin/env python3
 
 import pytest
+import contextlib
+import io
 import os
+import signal
 import sys
 import logging
-import tempfile
+import time
 from unittest.mock import Mock, patch, MagicMock, mock_open, call
 import base64
 
 # Import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from main import VisionClipGenerator, setup_logging
+import main as main_module
+from main import VisionClipGenerator, main, setup_logging
+
+# Minimal dialog used by the write-failure tests
+_DIALOG_BYTES = b"<ringback>\nIVA: Test\n<hangup>\n"
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep():
+    """Make time.sleep a no-op for every test in this module"""
+    mp = pytest.MonkeyPatch()
+    mp.setattr(time, "sleep", lambda *args, **kwargs: None)
+    yield
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def _silence_print(request, mocker):
+    """Silence print() unless the test is marked with ``needs_print``"""
+    if 'needs_print' not in request.keywords:
+        mocker.patch('builtins.print')
+
+
+def _run_main_with_kb_guard(fn):
+    """Replay the ``__main__`` block of main.py around ``fn``"""
+    try:
+        raise SystemExit(fn())
+    except KeyboardInterrupt:
+        print("\n\nExiting...")
+        raise SystemExit(130)
 
 
 class TestVisionClipGeneratorInit:
@@ -101,7 +133,8 @@ class TestTextToWav:
         generator.text_to_wav('en-US-Journey-O', 1.0, 'en-US', 'Hello world', 'test.wav')
 
         # Verify synthesize was called with correct parameters
-        mock_synthesize.assert_called_once_with(
+        assert mock_synthesize.call_count == 1
+        assert mock_synthesize.call_args == call(
             text='Hello world',
             voice='en-US-Journey-O',
             locale='en-US',
@@ -141,7 +174,6 @@ class TestProcessIvaLine:
         """Test processing of IVA line"""
         mocker.patch.object(generator, 'text_to_wav')
         mocker.patch.object(generator, 'play_audio')
-        mocker.patch('time.sleep')
 
         generator.fnum = 5
         generator.final_audio = 'existing.wav '
@@ -150,12 +182,14 @@ class TestProcessIvaLine:
         generator.process_iva_line(line)
 
         # Verify text_to_wav was called with correct parameters
-        generator.text_to_wav.assert_called_once_with(
+        assert generator.text_to_wav.call_count == 1
+        assert generator.text_to_wav.call_args == call(
             generator.va_voice, 1, generator.va_locale, ' Hello, how can I help you?', '.temp/005_va.wav'
         )
 
         # Verify play_audio was called
-        generator.play_audio.assert_called_once_with('.temp/005_va.wav')
+        assert generator.play_audio.call_count == 1
+        assert generator.play_audio.call_args == call('.temp/005_va.wav')
 
         # Verify state was updated
         assert generator.fnum == 6
@@ -181,7 +215,8 @@ class TestProcessCallerLine:
         generator.process_caller_line(line, record_mode=False)
 
         # Verify TTS was called
-        generator.text_to_wav.assert_called_once_with(
+        assert generator.text_to_wav.call_count == 1
+        assert generator.text_to_wav.call_args == call(
             generator.caller_voice, 1, generator.caller_locale, ' I need help with my reservation', '.temp/003_caller.wav'
         )
 
@@ -278,7 +313,6 @@ IVA: Let me help you with that.
         mocker.patch.object(generator, 'text_to_wav')
         mocker.patch.object(generator, 'play_audio')
         mocker.patch.object(generator, 'concatenate_audio_files')
-        mocker.patch('time.sleep')
 
         output_file = generator.process_dialog_file(sample_dialog, record_mode=False)
 
@@ -300,7 +334,6 @@ IVA: Let me help you with that.
         mocker.patch.object(generator, 'text_to_wav')
         mocker.patch.object(generator, 'play_audio')
         mocker.patch.object(generator, 'concatenate_audio_files')
-        mocker.patch('time.sleep')
 
         # Set initial state
         generator.fnum = 10
@@ -317,7 +350,6 @@ IVA: Let me help you with that.
         mocker.patch.object(generator, 'text_to_wav')
         mocker.patch.object(generator, 'play_audio')
         mocker.patch.object(generator, 'concatenate_audio_files')
-        mocker.patch('time.sleep')
         mock_rmtree = mocker.patch('shutil.rmtree')
 
         generator.process_dialog_file(sample_dialog, record_mode=False)
@@ -333,7 +365,6 @@ IVA: Let me help you with that.
         mocker.patch.object(generator, 'text_to_wav')
         mocker.patch.object(generator, 'play_audio')
         mocker.patch.object(generator, 'concatenate_audio_files')
-        mocker.patch('time.sleep')
         mock_rmtree = mocker.patch('shutil.rmtree')
 
         generator.process_dialog_file(sample_dialog, record_mode=False)
@@ -680,17 +711,21 @@ class TestOutputDirectoryValidation:
             'tmp_path': tmp_path
         }
 
-    def test_output_directory_exists(self, mocker, mock_main_setup):
-        """Test when output directory already exists"""
-        from main import main
+    @pytest.fixture
+    def set_argv(self, monkeypatch):
+        """Return a helper that replaces sys.argv with the given CLI arguments"""
+        def _set(*args):
+            monkeypatch.setattr(sys, 'argv', ['main.py', *args])
+        return _set
 
+    def test_output_directory_exists(self, mocker, mock_main_setup, set_argv):
+        """Test when output directory already exists"""
         output_dir = mock_main_setup['tmp_path'] / "existing"
         output_dir.mkdir()
         output_file = output_dir / "output.wav"
 
-        # Mock sys.argv
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', str(output_file)])
+        # Set CLI arguments
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', str(output_file))
 
         # Should succeed without prompting
         result = main()
@@ -698,13 +733,10 @@ class TestOutputDirectoryValidation:
         assert result == 0
         mock_main_setup['mock_generator'].generate.assert_called_once()
 
-    def test_output_no_directory_specified(self, mocker, mock_main_setup):
+    def test_output_no_directory_specified(self, mocker, mock_main_setup, set_argv):
         """Test when output is just a filename (no directory)"""
-        from main import main
-
-        # Mock sys.argv with simple filename
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', 'simple.wav'])
+        # Set CLI arguments with simple filename
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', 'simple.wav')
 
         # Should succeed without any directory checks
         result = main()
@@ -712,20 +744,16 @@ class TestOutputDirectoryValidation:
         assert result == 0
         mock_main_setup['mock_generator'].generate.assert_called_once()
 
-    def test_output_directory_not_exists_user_confirms(self, mocker, mock_main_setup):
+    def test_output_directory_not_exists_user_confirms(self, mocker, mock_main_setup, set_argv):
         """Test creating directory when user confirms"""
-        from main import main
-
         output_dir = mock_main_setup['tmp_path'] / "newdir" / "subdir"
         output_file = output_dir / "output.wav"
 
         # Mock user input to confirm
         mocker.patch('builtins.input', return_value='y')
-        mocker.patch('builtins.print')
 
-        # Mock sys.argv
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', str(output_file)])
+        # Set CLI arguments
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', str(output_file))
 
         result = main()
 
@@ -733,20 +761,16 @@ class TestOutputDirectoryValidation:
         assert output_dir.exists()  # Directory should be created
         mock_main_setup['mock_generator'].generate.assert_called_once()
 
-    def test_output_directory_not_exists_user_declines(self, mocker, mock_main_setup):
+    def test_output_directory_not_exists_user_declines(self, mocker, mock_main_setup, set_argv):
         """Test when user declines directory creation"""
-        from main import main
-
         output_dir = mock_main_setup['tmp_path'] / "newdir"
         output_file = output_dir / "output.wav"
 
         # Mock user input to decline
         mocker.patch('builtins.input', return_value='n')
-        mocker.patch('builtins.print')
 
-        # Mock sys.argv
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', str(output_file)])
+        # Set CLI arguments
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', str(output_file))
 
         result = main()
 
@@ -754,10 +778,8 @@ class TestOutputDirectoryValidation:
         assert not output_dir.exists()  # Directory should NOT be created
         mock_main_setup['mock_generator'].generate.assert_not_called()
 
-    def test_output_directory_no_write_permission(self, mocker, mock_main_setup):
+    def test_output_directory_no_write_permission(self, mocker, mock_main_setup, set_argv):
         """Test when no write permission on parent directory"""
-        from main import main
-
         output_file = "/root/restricted/output.wav"
 
         # Mock os.path.exists to return False for output_dir
@@ -772,50 +794,40 @@ class TestOutputDirectoryValidation:
 
         # Mock os.access to deny write permission
         mocker.patch('os.access', return_value=False)
-        mocker.patch('builtins.print')
 
-        # Mock sys.argv
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', output_file])
+        # Set CLI arguments
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', output_file)
 
         result = main()
 
         assert result == 1  # Should exit with error
         mock_main_setup['mock_generator'].generate.assert_not_called()
 
-    def test_output_directory_creation_fails(self, mocker, mock_main_setup):
+    def test_output_directory_creation_fails(self, mocker, mock_main_setup, set_argv):
         """Test when directory creation fails due to OS error"""
-        from main import main
-
         output_dir = mock_main_setup['tmp_path'] / "newdir"
         output_file = output_dir / "output.wav"
 
         # Mock user input to confirm
         mocker.patch('builtins.input', return_value='y')
-        mocker.patch('builtins.print')
 
         # Mock os.makedirs to raise PermissionError
         mocker.patch('os.makedirs', side_effect=PermissionError("Permission denied"))
 
-        # Mock sys.argv
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', str(output_file)])
+        # Set CLI arguments
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', str(output_file))
 
         result = main()
 
         assert result == 1  # Should exit with error
         mock_main_setup['mock_generator'].generate.assert_not_called()
 
-    def test_output_directory_various_user_responses(self, mocker, mock_main_setup):
+    def test_output_directory_various_user_responses(self, mocker, mock_main_setup, set_argv):
         """Test various user input responses"""
-        from main import main
-
         output_dir = mock_main_setup['tmp_path'] / "newdir"
         output_file = output_dir / "output.wav"
 
-        mocker.patch('builtins.print')
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', str(output_file)])
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', str(output_file))
 
         # Test 'Y' (uppercase) - should succeed because input is converted to lowercase
         mocker.patch('builtins.input', return_value='Y')
@@ -826,19 +838,16 @@ class TestOutputDirectoryValidation:
         # Test 'no' response
         output_dir2 = mock_main_setup['tmp_path'] / "newdir2"
         output_file2 = output_dir2 / "output.wav"
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                   '--output', str(output_file2)])
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', str(output_file2))
         mocker.patch('builtins.input', return_value='no')
         result = main()
         assert result == 1  # Should fail because 'no' != 'y'
         assert not output_dir2.exists()
 
-    def test_smart_output_path_with_directory_creation(self, mocker, mock_main_setup):
+    def test_smart_output_path_with_directory_creation(self, mocker, mock_main_setup, set_argv):
         """Test smart output path derivation doesn't trigger directory creation"""
-        from main import main
-
         # When no --output specified, smart path uses basename only (no directory)
-        mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file']])
+        set_argv('--file', mock_main_setup['dialog_file'])
 
         result = main()
 
@@ -849,37 +858,24 @@ class TestOutputDirectoryValidation:
         output_file_arg = call_args[0][2]  # Third positional argument
         assert output_file_arg == 'test.wav'
 
-    def test_relative_path_directory_creation(self, mocker, mock_main_setup):
+    def test_relative_path_directory_creation(self, mocker, mock_main_setup, set_argv, fs):
         """Test creating directory with relative path (e.g., 'output/demo.wav')"""
-        from main import main
-        import tempfile
+        # pyfakefs provides an isolated in-memory filesystem, so no chdir is needed
+        fs.create_file(mock_main_setup['dialog_file'], contents="<ringback>\nIVA: Test\n<hangup>")
+        output_file = 'output/demo.wav'
 
-        # Use a temporary directory for testing
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Change to temp directory
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-
-                output_file = 'output/demo.wav'
-
-                # Mock user input to confirm
-                mocker.patch('builtins.input', return_value='y')
-                mocker.patch('builtins.print')
-
-                # Mock sys.argv
-                mocker.patch('sys.argv', ['main.py', '--file', mock_main_setup['dialog_file'],
-                                           '--output', output_file])
+        # Mock user input to confirm
+        mocker.patch('builtins.input', return_value='y')
 
-                result = main()
+        # Set CLI arguments
+        set_argv('--file', mock_main_setup['dialog_file'], '--output', output_file)
 
-                assert result == 0
-                # Verify directory was created in current directory (not root)
-                assert os.path.exists('output')
-                assert os.path.isdir('output')
+        result = main()
 
-            finally:
-                os.chdir(original_cwd)
+        assert result == 0
+        # Verify directory was created in current directory (not root)
+        assert os.path.exists('output')
+        assert os.path.isdir('output')
 
 
 class TestOutputFileWriteExceptionHandling:
@@ -891,89 +887,56 @@ class TestOutputFileWriteExceptionHandling:
         mocker.patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'}, clear=True)
         return VisionClipGenerator()
 
-    @pytest.fixture
-    def sample_dialog(self, tmp_path):
-        """Create a minimal dialog file"""
-        dialog_content = """<ringback>
-IVA: Test
-<hangup>
-"""
-        dialog_file = tmp_path / "test_dialog.txt"
-        dialog_file.write_text(dialog_content)
+    @pytest.fixture(scope="module")
+    def sample_dialog(self, tmp_path_factory):
+        """Create a minimal dialog file shared by all tests in this class"""
+        dialog_file = tmp_path_factory.mktemp("dialog") / "test_dialog.txt"
+        dialog_file.write_bytes(_DIALOG_BYTES)
         return str(dialog_file)
 
-    def test_concatenate_permission_error(self, generator, sample_dialog, mocker):
-        """Test handling of PermissionError during file write"""
-        mocker.patch.object(generator, 'text_to_wav')
-        mocker.patch.object(generator, 'play_audio')
-        mocker.patch('time.sleep')
-
-        # Mock concatenate_audio_files to raise PermissionError
-        mocker.patch.object(
-            generator,
-            'concatenate_audio_files',
-            side_effect=PermissionError("Permission denied")
-        )
-
-        with pytest.raises(PermissionError, match="Permission denied"):
-            generator.process_dialog_file(sample_dialog, record_mode=False, output_file='/readonly/output.wav')
-
-    def test_concatenate_os_error(self, generator, sample_dialog, mocker):
-        """Test handling of OSError during file write"""
-        mocker.patch.object(generator, 'text_to_wav')
-        mocker.patch.object(generator, 'play_audio')
-        mocker.patch('time.sleep')
-
-        # Mock concatenate_audio_files to raise OSError
-        mocker.patch.object(
-            generator,
-            'concatenate_audio_files',
-            side_effect=OSError("Disk full")
-        )
-
-        with pytest.raises(OSError, match="Disk full"):
-            generator.process_dialog_file(sample_dialog, record_mode=False, output_file='output.wav')
-
-    def test_error_logging_on_write_failure(self, generator, sample_dialog, mocker, caplog):
-        """Test that errors are properly logged when write fails"""
-        mocker.patch.object(generator, 'text_to_wav')
-        mocker.patch.object(generator, 'play_audio')
-        mocker.patch('time.sleep')
-
-        # Mock concatenate_audio_files to raise PermissionError
-        mocker.patch.object(
+    @pytest.fixture
+    def patched_generator(self, generator, mocker):
+        """Generator with audio generation and concatenation mocked out"""
+        mocker.patch.multiple(
             generator,
-            'concatenate_audio_files',
-            side_effect=PermissionError("No permission")
+            text_to_wav=mocker.DEFAULT,
+            play_audio=mocker.DEFAULT,
+            concatenate_audio_files=mocker.DEFAULT
         )
+        return generator
+
+    @pytest.mark.parametrize("exc_type,message,output_file", [
+        (PermissionError, "Permission denied", '/readonly/output.wav'),
+        (OSError, "Disk full", 'output.wav'),
+        (PermissionError, "No permission", 'restricted.wav'),
+    ])
+    def test_concatenate_write_error(self, patched_generator, sample_dialog, caplog,
+                                     exc_type, message, output_file):
+        """Test that write failures propagate and are logged with the output path"""
+        # Mock concatenate_audio_files to raise the write error
+        patched_generator.concatenate_audio_files.side_effect = exc_type(message)
 
         with caplog.at_level(logging.ERROR):
-            with pytest.raises(PermissionError):
-                generator.process_dialog_file(sample_dialog, record_mode=False, output_file='restricted.wav')
+            with pytest.raises(exc_type, match=message):
+                patched_generator.process_dialog_file(sample_dialog, record_mode=False, output_file=output_file)
 
         # Verify error was logged
         assert "Failed to write output file" in caplog.text
-        assert "restricted.wav" in caplog.text
+        assert output_file in caplog.text
 
 
 class TestKeyboardInterruptHandling:
     """Test graceful handling of Ctrl+C (KeyboardInterrupt)"""
 
+    @pytest.mark.needs_print
     def test_keyboard_interrupt_exits_gracefully(self, mocker, capsys):
         """Test that KeyboardInterrupt during main() is caught and exits with code 130"""
         # Mock main() to raise KeyboardInterrupt
         mock_main = mocker.patch('main.main', side_effect=KeyboardInterrupt())
 
-        # Import the module to execute __main__ block
-        import main as main_module
-
         # Execute the __main__ block logic directly
         with pytest.raises(SystemExit) as exc_info:
-            try:
-                exit(mock_main())
-            except KeyboardInterrupt:
-                print("\n\nExiting...")
-                exit(130)
+            _run_main_with_kb_guard(mock_main)
 
         # Verify exit code is 130 (Unix convention: 128 + SIGINT)
         assert exc_info.value.code == 130
@@ -984,35 +947,29 @@ class TestKeyboardInterruptHandling:
 
     def test_keyboard_interrupt_exit_code_convention(self):
         """Test that exit code 130 follows Unix convention (128 + signal number)"""
-        import signal
-
-        # Verify the convention: 128 + SIGINT (2) = 130
-        expected_exit_code = 128 + signal.SIGINT
-        assert expected_exit_code == 130
+        assert 128 + signal.SIGINT == 130
 
-    def test_keyboard_interrupt_message_format(self, capsys):
+    @pytest.mark.needs_print
+    def test_keyboard_interrupt_message_format(self):
         """Test that the exit message has proper formatting (double newline)"""
         # Simulate the print statement
-        print("\n\nExiting...")
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            print("\n\nExiting...")
 
-        captured = capsys.readouterr()
+        out = buf.getvalue()
         # Verify double newline before message (ensures clean line)
-        assert captured.out.startswith("\n\n")
-        assert "Exiting..." in captured.out
+        assert out.startswith("\n\n")
+        assert "Exiting..." in out
 
+    @pytest.mark.needs_print
     def test_keyboard_interrupt_from_various_points(self, mocker, capsys):
         """Test that KeyboardInterrupt from any point in main() is caught"""
         # Test interruption during argument parsing
         mocker.patch('argparse.ArgumentParser.parse_args', side_effect=KeyboardInterrupt())
 
-        import main as main_module
-
         with pytest.raises(SystemExit) as exc_info:
-            try:
-                exit(main_module.main())
-            except KeyboardInterrupt:
-                print("\n\nExiting...")
-                exit(130)
+            _run_main_with_kb_guard(main_module.main)
 
         assert exc_info.value.code == 130
         captured = capsys.readouterr()
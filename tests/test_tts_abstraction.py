@@ -2,9 +2,15 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+import asyncio
+import base64
+import io
+import json
 import os
 import sys
-import tempfile
+import threading
+import time
+from types import SimpleNamespace
 
 from tts import (
     TTSFactory,
@@ -12,17 +18,56 @@ from tts import (
     TTSProvider,
     TTSConfigurationError,
     TTSAPIError,
+    TTSRateLimitError,
+    collect_stream,
+    stream_async,
     create_tts_provider,
     has_feature,
 )
 from tts.capabilities import TTSCapabilities
-from tts.features import StreamingCapable, SSMLCapable, CustomVoiceCapable
+from tts.features import StreamingCapable, SSMLCapable, CustomVoiceCapable, AsyncCapable
 from tts.providers.google_tts import GoogleTTSProvider
 from tts.providers.elevenlabs_tts import ElevenLabsTTSProvider
 
-# For AWS and Azure, we need to handle conditional imports differently
+# AWS and Azure SDKs are optional; tests patch the module-level SDK names
 import tts.providers.aws_polly
 import tts.providers.azure_tts
+from tts.providers.aws_polly import AWSPollyTTSProvider
+from tts.providers.azure_tts import AzureTTSProvider
+
+EXPECTED_SSML_150 = '<prosody rate="150%">Hello world</prosody>'
+EXPECTED_AUDIO = b'audio data'
+ENCODED = 'YXVkaW8gZGF0YQ=='  # base64 for EXPECTED_AUDIO
+AUDIO_RESPONSE = json.dumps({'audioContent': ENCODED}).encode()
+
+
+def sent_payload(call):
+    """Decode the JSON body of a mocked session.post() call."""
+    return json.loads(call.kwargs['data'])
+
+
+@pytest.fixture(scope="session")
+def yaml_config_file(tmp_path_factory):
+    """YAML config file written once per session."""
+    path = tmp_path_factory.mktemp("cfg") / "c.yaml"
+    path.write_text("provider: aws\ngoogle:\n  api_key: file-key\n")
+    return path
+
+
+@pytest.fixture(scope="module")
+def google_provider():
+    """Google provider shared by tests that do not mutate it."""
+    return GoogleTTSProvider(api_key='test-key')
+
+
+@pytest.fixture(scope="module")
+def elevenlabs_provider():
+    """ElevenLabs provider shared by tests that do not mutate it."""
+    return ElevenLabsTTSProvider(
+        api_key='test-key',
+        va_voice='voice-id-1',
+        caller_voice='voice-id-2'
+    )
 
 
 class TestTTSCapabilities:
@@ -55,64 +100,126 @@ class TestTTSCapabilities:
         assert caps.has_feature("custom_voices") is False
         assert caps.has_feature("unknown") is False
 
+    def test_capabilities_immutable(self):
+        """Test capabilities cannot be modified in place."""
+        import dataclasses
+        caps = TTSCapabilities()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            caps.supports_ssml = True
+        assert dataclasses.replace(caps, supports_ssml=True).has_feature("ssml") is True
+
 
 class TestTTSConfig:
     """Test TTSConfig class."""
 
-    def test_config_defaults(self):
+    def test_config_defaults(self, monkeypatch):
         """Test configuration with default values."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = TTSConfig()
-            assert config.get('provider') == 'google'
-            assert config.get('google.api_key') is None
-            assert config.get('google.va_voice') == 'en-US-Journey-O'
+        for env_var in ('TTS_PROVIDER', 'GOOGLE_API_KEY', 'VA_VOICE'):
+            monkeypatch.delenv(env_var, raising=False)
+        config = TTSConfig()
+        assert config.get('provider') == 'google'
+        assert config.get('google.api_key') is None
+        assert config.get('google.va_voice') == 'en-US-Journey-O'
+
+    def test_config_get_memoized(self):
+        """Test repeated lookups, including misses, are served from the memo."""
+        config = TTSConfig(provider='azure')
+        assert config.get('provider') == 'azure'
+        assert config.get('no.such.key', 'fallback') == 'fallback'
+        assert config._get_cache == {'provider': 'azure', 'no.such.key': None}
+        assert config.get('no.such.key', 'other') == 'other'
+
+    def test_materialize_provider(self):
+        """Test provider arguments are a fresh dict with extras applied last."""
+        config = TTSConfig(google={'api_key': 'file-key'})
+        kwargs = config.materialize_provider('google', {'api_key': 'direct-key'})
+        assert kwargs['api_key'] == 'direct-key'
+        assert kwargs['va_voice'] == 'en-US-Journey-O'
+        kwargs['va_voice'] = 'changed'
+        assert config.get('google.va_voice') == 'en-US-Journey-O'
 
     def test_config_overrides(self):
         """Test configuration with overrides."""
         config = TTSConfig(provider='azure', google={'api_key': 'test-key'})
         assert config.get('provider') == 'azure'
         assert config.get('google.api_key') == 'test-key'
+        # The shared defaults template is left untouched
+        assert TTSConfig.DEFAULTS['google']['api_key'] is None
 
-    def test_config_env_vars(self):
+    def test_config_env_vars(self, monkeypatch):
         """Test configuration from environment variables."""
-        with patch.dict(os.environ, {
-            'TTS_PROVIDER': 'elevenlabs',
-            'GOOGLE_API_KEY': 'env-key'
-        }):
-            config = TTSConfig()
-            assert config.get('provider') == 'elevenlabs'
-            assert config.get('google.api_key') == 'env-key'
-
-    def test_config_file_loading(self):
-        """Test configuration from YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("provider: aws\n")
-            f.write("google:\n")
-            f.write("  api_key: file-key\n")
-            config_file = f.name
-
-        try:
-            with patch.dict(os.environ, {}, clear=True):
-                config = TTSConfig(config_file=config_file)
-                assert config.get('provider') == 'aws'
-                assert config.get('google.api_key') == 'file-key'
-        finally:
-            os.unlink(config_file)
+        monkeypatch.setenv('TTS_PROVIDER', 'elevenlabs')
+        monkeypatch.setenv('GOOGLE_API_KEY', 'env-key')
+        config = TTSConfig()
+        assert config.get('provider') == 'elevenlabs'
+        assert config.get('google.api_key') == 'env-key'
 
-    def test_config_precedence(self):
+    def test_config_file_loading(self, yaml_config_file, monkeypatch):
+        """Test configuration from YAML file."""
+        monkeypatch.delenv('TTS_PROVIDER', raising=False)
+        monkeypatch.delenv('GOOGLE_API_KEY', raising=False)
+        config = TTSConfig(config_file=str(yaml_config_file))
+        assert config.get('provider') == 'aws'
+        assert config.get('google.api_key') == 'file-key'
+
+    def test_config_file_parse_cached(self, tmp_path, monkeypatch):
+        """Test that an unchanged config file is parsed only once."""
+        from tts.config import _parse_yaml
+        monkeypatch.delenv('TTS_PROVIDER', raising=False)
+        config_file = tmp_path / "cfg.yaml"
+        config_file.write_text("provider: aws\n")
+        _parse_yaml.cache_clear()
+
+        assert TTSConfig(config_file=str(config_file)).get('provider') == 'aws'
+        assert TTSConfig(config_file=str(config_file)).get('provider') == 'aws'
+        assert _parse_yaml.cache_info().hits == 1
+
+        # A modified file is parsed again
+        config_file.write_text("provider: azure\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert TTSConfig(config_file=str(config_file)).get('provider') == 'azure'
+
+        # A relative path is cached under the same absolute key
+        monkeypatch.chdir(tmp_path)
+        assert TTSConfig(config_file="cfg.yaml").get('provider') == 'azure'
+        assert _parse_yaml.cache_info().hits == 2
+
+    def test_config_file_lists_not_shared_with_cache(self, tmp_path):
+        """Test mutating a list from one config leaves later configs from the same file intact."""
+        config_file = tmp_path / "cfg.yaml"
+        config_file.write_text("voices:\n  - Joanna\n  - Matthew\n")
+
+        TTSConfig(config_file=str(config_file)).get('voices').append('Amy')
+        TTSConfig(config_file=str(config_file)).to_dict()['voices'].clear()
+
+        assert TTSConfig(config_file=str(config_file)).get('voices') == ['Joanna', 'Matthew']
+
+    def test_config_file_invalid_yaml(self, tmp_path, caplog):
+        """Test an unparseable config file is logged and ignored."""
+        config_file = tmp_path / "bad.yaml"
+        config_file.write_text("provider: [unclosed\n")
+        config = TTSConfig(config_file=str(config_file), provider='aws')
+        assert config.get('provider') == 'aws'
+        assert "Failed to load config file" in caplog.text
+
+    def test_config_yaml_loader(self):
+        """Test that the LibYAML loader is used when available."""
+        import yaml
+        from tts.config import _YamlLoader
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert _YamlLoader is expected
+
+    def test_config_precedence(self, tmp_path, monkeypatch):
         """Test configuration precedence: overrides > env > file > defaults."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("provider: azure\n")
-            config_file = f.name
+        config_file = tmp_path / "cfg.yaml"
+        config_file.write_text("provider: azure\n")
 
-        try:
-            with patch.dict(os.environ, {'TTS_PROVIDER': 'aws'}):
-                # File says azure, env says aws, override says google
-                config = TTSConfig(config_file=config_file, provider='google')
-                # Override should win
-                assert config.get('provider') == 'google'
-        finally:
-            os.unlink(config_file)
+        monkeypatch.setenv('TTS_PROVIDER', 'aws')
+        # File says azure, env says aws, override says google
+        config = TTSConfig(config_file=str(config_file), provider='google')
+        # Override should win
+        assert config.get('provider') == 'google'
 
     def test_get_provider_config(self):
         """Test getting provider-specific configuration."""
@@ -121,10 +228,25 @@ class TestTTSConfig:
         assert provider_config['api_key'] == 'test-key'
         assert provider_config['va_voice'] == 'test-voice'
 
+    def test_get_provider_config_read_only_view(self):
+        """Test provider config is a cached, read-only view."""
+        config = TTSConfig(google={'api_key': 'test-key'})
+        provider_config = config.get_provider_config('google')
+        assert config.get_provider_config('google') is provider_config
+        with pytest.raises(TypeError):
+            provider_config['api_key'] = 'other-key'
+
 
 class TestTTSFactory:
     """Test TTSFactory class."""
 
+    @pytest.fixture(autouse=True)
+    def _snapshot_registry(self, monkeypatch):
+        """Give each test a private copy of the provider registry."""
+        monkeypatch.setattr(TTSFactory, '_providers', dict(TTSFactory._providers))
+        monkeypatch.setattr(TTSFactory, '_provider_paths', dict(TTSFactory._provider_paths))
+        monkeypatch.setattr(TTSFactory, '_provider_names', None)
+
     def test_register_provider(self):
         """Test registering a custom provider."""
         class MockProvider:
@@ -133,55 +255,102 @@ class TestTTSFactory:
         TTSFactory.register_provider('mock', MockProvider)
         assert 'mock' in TTSFactory.list_providers()
 
-        # Cleanup
-        TTSFactory.unregister_provider('mock')
-
     def test_register_duplicate_provider(self):
         """Test registering a duplicate provider raises error."""
         class MockProvider:
             pass
 
         TTSFactory.register_provider('mock', MockProvider)
-        try:
-            with pytest.raises(ValueError, match="already registered"):
-                TTSFactory.register_provider('mock', MockProvider)
-        finally:
-            TTSFactory.unregister_provider('mock')
+        with pytest.raises(ValueError, match="already registered"):
+            TTSFactory.register_provider('mock', MockProvider)
+
+    def test_unregister_provider(self):
+        """Test unregistering a provider drops it from the listing."""
+        assert 'google' in TTSFactory.list_providers()
+        TTSFactory.unregister_provider('google')
+        assert 'google' not in TTSFactory.list_providers()
 
     def test_list_providers(self):
         """Test listing available providers."""
-        providers = TTSFactory.list_providers()
-        assert 'google' in providers
+        assert 'google' in TTSFactory.list_providers()
+
+    def test_provider_load_failure(self):
+        """Test a provider whose module cannot be imported raises a config error."""
+        TTSFactory._provider_paths['broken'] = 'tts.providers.no_such_module:Provider'
+        with pytest.raises(TTSConfigurationError, match="Failed to load"):
+            TTSFactory.create_provider('broken')
 
-    def test_create_google_provider(self):
+    def test_create_google_provider(self, monkeypatch):
         """Test creating Google TTS provider."""
-        with patch.dict(os.environ, {}, clear=True):
-            provider = TTSFactory.create_provider('google', api_key='test-key')
-            assert isinstance(provider, GoogleTTSProvider)
-            assert provider.name == 'google'
-            assert provider.api_key == 'test-key'
+        monkeypatch.delenv('GOOGLE_API_KEY', raising=False)
+        provider = TTSFactory.create_provider('google', api_key='test-key')
+        assert isinstance(provider, GoogleTTSProvider)
+        assert provider.name == 'google'
+        assert provider.api_key == 'test-key'
 
-    def test_create_provider_without_name(self):
+    def test_create_provider_without_name(self, monkeypatch):
         """Test creating provider without specifying name (uses default)."""
-        with patch.dict(os.environ, {'GOOGLE_API_KEY': 'test-key'}):
-            provider = TTSFactory.create_provider()
-            assert provider.name == 'google'
+        monkeypatch.delenv('TTS_PROVIDER', raising=False)
+        monkeypatch.setenv('GOOGLE_API_KEY', 'test-key')
+        provider = TTSFactory.create_provider()
+        assert provider.name == 'google'
 
     def test_create_unknown_provider(self):
         """Test creating unknown provider raises error."""
         with pytest.raises(TTSConfigurationError, match="not registered"):
             TTSFactory.create_provider('unknown-provider')
 
-    def test_convenience_methods(self):
+    def test_convenience_methods(self, monkeypatch):
         """Test factory convenience methods."""
-        with patch.dict(os.environ, {'GOOGLE_API_KEY': 'test-key'}):
-            provider = TTSFactory.create_google_provider()
-            assert provider.name == 'google'
+        monkeypatch.setenv('GOOGLE_API_KEY', 'test-key')
+        provider = TTSFactory.create_google_provider()
+        assert provider.name == 'google'
+
+    def test_cache_dir_from_environment(self, monkeypatch, tmp_path):
+        """Test TTS_CACHE_DIR enables the audio cache on created providers."""
+        monkeypatch.setenv('TTS_CACHE_DIR', str(tmp_path))
+        provider = TTSFactory.create_provider('google', api_key='test-key')
+        assert provider.cache_enabled is True
+        assert provider.get_capabilities().has_feature('cache') is True
+
+    def test_get_provider_shares_instances(self, monkeypatch):
+        """Test get_provider reuses instances until arguments or env change."""
+        TTSFactory.clear_cache()
+        provider = TTSFactory.get_provider('google', api_key='test-key')
+        assert TTSFactory.get_provider('google', api_key='test-key') is provider
+        assert TTSFactory.get_provider('google', api_key='other-key') is not provider
+
+        monkeypatch.setenv('VA_VOICE', 'en-US-Journey-F')
+        assert TTSFactory.get_provider('google', api_key='test-key') is not provider
+
+        # Unhashable values skip the cache
+        unhashable = TTSFactory.get_provider('google', api_key='test-key', extra=[])
+        assert unhashable is not TTSFactory.get_provider('google', api_key='test-key', extra=[])
+        TTSFactory.clear_cache()
+
+    def test_create_provider_reuses_config(self, monkeypatch):
+        """Test create_provider builds the config once until its sources change."""
+        from tts.factory import _shared_config
+        TTSFactory.clear_cache()
+        TTSFactory.create_provider('google', api_key='test-key')
+        TTSFactory.create_provider('google', api_key='test-key')
+        assert _shared_config.cache_info().hits == 1
+
+        monkeypatch.setenv('VA_VOICE', 'en-US-Journey-F')
+        provider = TTSFactory.create_provider('google', api_key='test-key')
+        assert provider.va_voice == 'en-US-Journey-F'
+        TTSFactory.clear_cache()
 
 
 class TestGoogleTTSProvider:
     """Test GoogleTTSProvider class."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_requests(self, monkeypatch):
+        """Replace the session's post for every test in this class."""
+        self._post = MagicMock()
+        monkeypatch.setattr("requests.Session.post", self._post)
+
     def test_initialization_with_api_key(self):
         """Test provider initialization with API key."""
         provider = GoogleTTSProvider(api_key='test-key')
@@ -193,10 +362,9 @@ class TestGoogleTTSProvider:
         with pytest.raises(TTSConfigurationError, match="requires an API key"):
             GoogleTTSProvider()
 
-    def test_get_capabilities(self):
+    def test_get_capabilities(self, google_provider):
         """Test getting provider capabilities."""
-        provider = GoogleTTSProvider(api_key='test-key')
-        caps = provider.get_capabilities()
+        caps = google_provider.get_capabilities()
         assert isinstance(caps, TTSCapabilities)
         assert caps.supports_ssml is True
         assert caps.supports_audio_effects is True
@@ -208,96 +376,436 @@ class TestGoogleTTSProvider:
         provider.configure(api_key='new-key', va_voice='new-voice')
         assert provider.api_key == 'new-key'
         assert provider.va_voice == 'new-voice'
+        assert provider._url.endswith('key=new-key')
 
-    @patch('requests.post')
-    def test_synthesize_success(self, mock_post):
-        """Test successful text synthesis."""
+    def test_synthesize_to_file(self, tmp_path, google_provider):
+        """Test synthesis request payload and file output."""
         # Mock API response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'audioContent': 'YXVkaW8gZGF0YQ=='  # base64 for "audio data"
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        self._post.return_value = SimpleNamespace(
+            status_code=200,
+            content=AUDIO_RESPONSE,
+            raise_for_status=lambda: None
+        )
+
+        output_file = str(tmp_path / "out.wav")
+
+        audio_bytes = google_provider.synthesize(
+            text="Hello world",
+            voice="en-US-Journey-O",
+            locale="en-US",
+            rate=1.0,
+            output_file=output_file
+        )
 
+        # Verify API was called
+        self._post.assert_called_once()
+        payload = sent_payload(self._post.call_args)
+        assert payload['input']['text'] == "Hello world"
+        assert payload['voice']['name'] == "en-US-Journey-O"
+        assert payload['voice']['languageCode'] == "en-US"
+
+        # Verify audio bytes returned
+        assert audio_bytes == EXPECTED_AUDIO
+
+        # Verify file was written, with no temporary file left behind
+        assert os.path.exists(output_file)
+        with open(output_file, 'rb') as f:
+            assert f.read() == EXPECTED_AUDIO
+        assert os.listdir(tmp_path) == ["out.wav"]
+
+    def test_synthesize_to_file_write_error(self, tmp_path, google_provider):
+        """Test a failed file write is reported without leaving a partial file."""
+        self._post.return_value = SimpleNamespace(
+            status_code=200,
+            content=AUDIO_RESPONSE,
+            raise_for_status=lambda: None
+        )
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(TTSAPIError, match="Failed to write audio file"):
+                google_provider.synthesize(
+                    text="Hello world",
+                    voice="en-US-Journey-O",
+                    locale="en-US",
+                    output_file=str(tmp_path / "out.wav")
+                )
+        assert os.listdir(tmp_path) == []
+
+    def test_capabilities_shared_between_instances(self, google_provider):
+        """Test providers with default settings share one capabilities object."""
+        other = GoogleTTSProvider(api_key='other-key')
+        assert other.get_capabilities() is google_provider.get_capabilities()
+        assert google_provider.get_capabilities() is GoogleTTSProvider.CAPABILITIES
+
+    def test_session_accepts_compressed_responses(self, google_provider):
+        """Test the pooled session asks for compressed JSON responses."""
+        assert 'gzip' in google_provider._session.headers['Accept-Encoding']
+
+    def test_session_retries_transient_errors(self, google_provider):
+        """Test the pooled session retries server errors but leaves 429 to the provider."""
+        retries = google_provider._session.get_adapter('https://texttospeech.googleapis.com').max_retries
+        assert {500, 502, 503, 504} <= set(retries.status_forcelist)
+        assert 429 not in retries.status_forcelist
+        assert 'POST' in retries.allowed_methods
+        # A POST that may already have been processed is never re-sent
+        assert retries.read == 0
+
+    def test_close_releases_session(self, monkeypatch):
+        """Test close() shuts down the pooled HTTP session."""
         provider = GoogleTTSProvider(api_key='test-key')
+        close = MagicMock()
+        monkeypatch.setattr(provider._session, 'close', close)
+        provider.close()
+        close.assert_called_once()
 
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            output_file = f.name
+    def test_prewarm(self, monkeypatch):
+        """Test prewarm() and warmup=True open a pooled connection to the API host."""
+        head = MagicMock()
+        monkeypatch.setattr('requests.Session.head', head)
 
-        try:
-            audio_bytes = provider.synthesize(
-                text="Hello world",
-                voice="en-US-Journey-O",
-                locale="en-US",
-                rate=1.0,
-                output_file=output_file
+        provider = GoogleTTSProvider(api_key='test-key')
+        provider.prewarm()
+        head.assert_called_once_with(provider.base_url, timeout=5.0)
+
+        with patch('tts.providers.google_tts.warm_up_in_background') as background:
+            warm = GoogleTTSProvider(api_key='test-key', warmup=True)
+        background.assert_called_once_with(warm._session, warm.base_url)
+
+        import requests
+        head.side_effect = requests.exceptions.ConnectionError("unreachable")
+        with pytest.raises(TTSAPIError, match="Failed to connect to Google TTS"):
+            provider.prewarm()
+
+    def test_context_manager_closes_session(self, monkeypatch):
+        """Test leaving a with block closes the pooled HTTP session."""
+        with GoogleTTSProvider(api_key='test-key') as provider:
+            close = MagicMock()
+            monkeypatch.setattr(provider._session, 'close', close)
+        close.assert_called_once()
+
+    def test_synthesize_many(self, google_provider):
+        """Test concurrent synthesis returns audio in job order."""
+        def respond(url, **kwargs):
+            text = json.loads(kwargs['data'])['input']['text'].encode()
+            return SimpleNamespace(
+                status_code=200,
+                content=json.dumps({'audioContent': base64.b64encode(text).decode()}).encode(),
+                raise_for_status=lambda: None
+            )
+        self._post.side_effect = respond
+
+        jobs = [
+            {'text': text, 'voice': 'en-US-Journey-O', 'locale': 'en-US'}
+            for text in ('one', 'two', 'three')
+        ]
+        audio = asyncio.run(google_provider.synthesize_many(jobs, max_concurrency=2))
+
+        assert audio == [b'one', b'two', b'three']
+        assert self._post.call_count == 3
+
+    def test_synthesize_batch(self, google_provider):
+        """Test thread-pool batch synthesis returns audio in item order."""
+        def respond(url, **kwargs):
+            text = json.loads(kwargs['data'])['input']['text'].encode()
+            return SimpleNamespace(
+                status_code=200,
+                content=json.dumps({'audioContent': base64.b64encode(text).decode()}).encode(),
+                raise_for_status=lambda: None
             )
+        self._post.side_effect = respond
+
+        items = [
+            {'text': text, 'voice': 'en-US-Journey-O', 'locale': 'en-US'}
+            for text in ('one', 'two', 'three')
+        ]
+
+        assert google_provider.synthesize_batch(items, max_workers=2) == [b'one', b'two', b'three']
+
+    def test_synthesize_batch_respects_rate_limit(self, monkeypatch):
+        """Test batch requests are spaced by max_requests_per_minute."""
+        import dataclasses
+        import tts.base
+        sleeps = []
+        monkeypatch.setattr(tts.base, 'time', SimpleNamespace(monotonic=lambda: 100.0, sleep=sleeps.append))
+        self._post.return_value = SimpleNamespace(status_code=200, content=AUDIO_RESPONSE, raise_for_status=lambda: None)
+        provider = GoogleTTSProvider(api_key='test-key')
+        provider._capabilities = dataclasses.replace(provider.CAPABILITIES, max_requests_per_minute=120)
+
+        item = {'text': 'Hello', 'voice': 'en-US-Journey-O', 'locale': 'en-US'}
+        provider.synthesize_batch([item] * 3, max_workers=1)
+
+        assert sleeps == [0.5, 1.0]
+
+    def test_synthesize_chunked(self, google_provider):
+        """Test long text is synthesized in sentence pieces, yielded in order."""
+        def respond(url, **kwargs):
+            text = json.loads(kwargs['data'])['input']['text'].encode()
+            return SimpleNamespace(
+                status_code=200,
+                content=json.dumps({'audioContent': base64.b64encode(text).decode()}).encode(),
+                raise_for_status=lambda: None
+            )
+        self._post.side_effect = respond
+
+        text = 'First sentence. Second one! "Third?" Fourth.'
+        clips = google_provider.synthesize_chunked(
+            text, 'en-US-Journey-O', 'en-US', max_chars=20, max_workers=2
+        )
+
+        assert list(clips) == [b'First sentence.', b'Second one! "Third?"', b'Fourth.']
+
+    def test_synthesize_batch_retries_rate_limited_requests(self, google_provider, monkeypatch):
+        """Test a batch item answered with 429 is retried with exponential backoff."""
+        import requests
+        import tts.base
+        sleeps = []
+        monkeypatch.setattr(tts.base, 'time', SimpleNamespace(sleep=sleeps.append))
+        monkeypatch.setattr(tts.base, 'random', SimpleNamespace(random=lambda: 0.0))
+        rate_limited = requests.Response()
+        rate_limited.status_code = 429
+        ok = requests.Response()
+        ok.status_code = 200
+        ok._content = json.dumps({'audioContent': base64.b64encode(b'audio').decode()}).encode()
+        self._post.side_effect = [rate_limited, rate_limited, ok]
+
+        item = {'text': 'Hello', 'voice': 'en-US-Journey-O', 'locale': 'en-US'}
+        assert google_provider.synthesize_batch([item]) == [b'audio']
+        assert self._post.call_count == 3
+        assert sleeps == [0.5, 1.0]
+
+    def test_synthesize_cache_hit(self, tmp_path):
+        """Test repeated synthesis is served from the audio cache."""
+        self._post.return_value = SimpleNamespace(
+            status_code=200,
+            content=AUDIO_RESPONSE,
+            raise_for_status=lambda: None
+        )
+        provider = GoogleTTSProvider(api_key='test-key', cache_dir=str(tmp_path / "cache"))
+
+        first = provider.synthesize("Hello world", "en-US-Journey-O", "en-US")
+        output_file = tmp_path / "out.wav"
+        second = provider.synthesize(
+            "Hello world", "en-US-Journey-O", "en-US", output_file=str(output_file)
+        )
+
+        self._post.assert_called_once()
+        assert first == second == EXPECTED_AUDIO
+        assert output_file.read_bytes() == EXPECTED_AUDIO
 
-            # Verify API was called
-            assert mock_post.called
-            call_args = mock_post.call_args
-            payload = call_args[1]['json']
-            assert payload['input']['text'] == "Hello world"
-            assert payload['voice']['name'] == "en-US-Journey-O"
-            assert payload['voice']['languageCode'] == "en-US"
-
-            # Verify audio bytes returned
-            assert audio_bytes == b'audio data'
-
-            # Verify file was written
-            assert os.path.exists(output_file)
-            with open(output_file, 'rb') as f:
-                assert f.read() == b'audio data'
+    def test_cache_evicts_least_recently_used(self, tmp_path):
+        """Test the audio cache stays within its byte bound."""
+        provider = GoogleTTSProvider(
+            api_key='test-key', cache_dir=str(tmp_path), cache_max_bytes=20
+        )
+        provider._cache_put('a', b'x' * 10)
+        provider._cache_put('b', b'y' * 10)
+        assert provider._cache_get('a') == b'x' * 10  # 'b' is now oldest
+        provider._cache_put('c', b'z' * 10)
+
+        assert provider._cache_get('b') is None
+        assert provider._cache_get('a') == b'x' * 10
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['a.audio', 'c.audio']
+
+    def test_cache_shared_by_batch_workers(self, tmp_path):
+        """Test concurrent batch synthesis keeps the cache index in step with the disk."""
+        def respond(url, **kwargs):
+            text = json.loads(kwargs['data'])['input']['text'].encode()
+            return SimpleNamespace(
+                status_code=200,
+                content=json.dumps({'audioContent': base64.b64encode(text * 10).decode()}).encode(),
+                raise_for_status=lambda: None
+            )
+        self._post.side_effect = respond
+        items = [
+            {'text': f'line {i % 40:02d}', 'voice': 'en-US-Journey-O', 'locale': 'en-US'}
+            for i in range(400)
+        ]
+
+        # Switch threads often so workers interleave inside the cache code;
+        # a race only shows up in some rounds, so run several
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for round_ in range(10):
+                cache_dir = tmp_path / str(round_)
+                provider = GoogleTTSProvider(
+                    api_key='test-key', cache_dir=str(cache_dir), cache_max_bytes=700
+                )
+                audio = provider.synthesize_batch(items, max_workers=16)
+
+                assert audio == [item['text'].encode() * 10 for item in items]
+                stats = provider.cache_stats()
+                files = list(cache_dir.glob('*.audio'))
+                assert stats['entries'] == len(files)
+                assert stats['bytes'] == sum(f.stat().st_size for f in files) <= 700
+                assert stats['hits'] + stats['misses'] == len(items)
         finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+            sys.setswitchinterval(interval)
+
+    def test_cache_memory_tier_and_stats(self, tmp_path):
+        """Test hits are served from memory and counted, and clear_cache() empties the cache."""
+        provider = GoogleTTSProvider(api_key='test-key', cache_dir=str(tmp_path))
+        provider._cache_put('a', b'audio')
+        (tmp_path / 'a.audio').write_bytes(b'changed on disk')
+
+        assert provider._cache_get('a') == b'audio'
+        assert provider._cache_get('missing') is None
+        stats = provider.cache_stats()
+        assert (stats['entries'], stats['bytes'], stats['hits'], stats['misses']) == (1, 5, 1, 1)
 
-    @patch('requests.post')
-    def test_synthesize_api_error(self, mock_post):
+        provider.clear_cache()
+        assert list(tmp_path.iterdir()) == []
+        assert provider.cache_stats()['entries'] == provider.cache_stats()['hits'] == 0
+
+    def test_synthesize_api_error(self, google_provider):
         """Test synthesis with API error."""
         import requests
-        mock_post.side_effect = requests.exceptions.RequestException("API error")
-
-        provider = GoogleTTSProvider(api_key='test-key')
+        self._post.side_effect = requests.exceptions.RequestException("API error")
 
         with pytest.raises(TTSAPIError, match="API request failed"):
-            provider.synthesize(
+            google_provider.synthesize(
+                text="Hello world",
+                voice="en-US-Journey-O",
+                locale="en-US"
+            )
+
+    def test_synthesize_rate_limit(self, google_provider):
+        """Test a 429 response raises TTSRateLimitError rather than TTSAPIError."""
+        import requests
+        response = requests.Response()
+        response.status_code = 429
+        self._post.return_value = response
+
+        with pytest.raises(TTSRateLimitError, match="rate limit"):
+            google_provider.synthesize(
+                text="Hello world",
+                voice="en-US-Journey-O",
+                locale="en-US"
+            )
+
+    def test_synthesize_invalid_audio_content(self, google_provider):
+        """Test synthesis with undecodable base64 audio content."""
+        self._post.return_value = Mock(content=b'{"audioContent": "abc"}')
+
+        with pytest.raises(TTSAPIError, match="Failed to parse"):
+            google_provider.synthesize(
                 text="Hello world",
                 voice="en-US-Journey-O",
                 locale="en-US"
             )
 
-    def test_list_effects_profiles(self):
+    def test_synthesize_batch_ssml(self, google_provider):
+        """Test phrases are fused into one request and split at mark timepoints."""
+        import wave
+        wav_buf = io.BytesIO()
+        with wave.open(wav_buf, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(bytes(2 * 8000))
+        self._post.return_value = SimpleNamespace(
+            status_code=200,
+            content=json.dumps({
+                'audioContent': base64.b64encode(wav_buf.getvalue()).decode(),
+                'timepoints': [
+                    {'markName': 'p0', 'timeSeconds': 0.0},
+                    {'markName': 'p1', 'timeSeconds': 0.25},
+                    {'markName': 'p2', 'timeSeconds': 0.5},
+                ],
+            }).encode(),
+            raise_for_status=lambda: None
+        )
+
+        clips = google_provider.synthesize_batch_ssml(
+            ['One', 'Two & three', 'Four'], 'en-US-Journey-O', 'en-US'
+        )
+
+        self._post.assert_called_once()
+        payload = sent_payload(self._post.call_args)
+        assert payload['enableTimePointing'] == ['SSML_MARK']
+        assert '<mark name="p1"/>Two &amp; three' in payload['input']['ssml']
+        frame_counts = []
+        for clip in clips:
+            with wave.open(io.BytesIO(clip)) as wav:
+                frame_counts.append(wav.getnframes())
+        assert frame_counts == [2000, 2000, 4000]
+
+    def test_list_effects_profiles(self, google_provider):
         """Test listing audio effects profiles."""
-        provider = GoogleTTSProvider(api_key='test-key')
-        profiles = provider.list_effects_profiles()
+        profiles = google_provider.list_effects_profiles()
         assert 'telephony-class-application' in profiles
         assert isinstance(profiles, list)
 
 
+@pytest.fixture(scope="session")
+def _boto3_template():
+    """Build the mock boto3 module and Polly client once per session."""
+    mock_boto3 = Mock()
+    mock_client = Mock()
+    mock_boto3.client.return_value = mock_client
+    return mock_boto3, mock_client
+
+
+@pytest.fixture(scope="session")
+def _azure_sdk_template():
+    """Build the fake Azure SDK namespace once per session."""
+    return SimpleNamespace(
+        SpeechConfig=Mock(return_value=Mock()),
+        SpeechSynthesizer=Mock(),
+        AudioOutputConfig=Mock(),
+        Connection=Mock(),
+        ResultReason=SimpleNamespace(SynthesizingAudioCompleted='completed', Canceled='canceled'),
+        StreamStatus=SimpleNamespace(AllData='all', Canceled='canceled'),
+        AudioDataStream=Mock(),
+    )
+
+
+@pytest.fixture
+def mock_boto3(_boto3_template):
+    """Fixture to reset and inject the shared mock boto3 module."""
+    mock_boto3, mock_client = _boto3_template
+    mock_boto3.reset_mock()
+    mock_client.reset_mock(return_value=True, side_effect=True)
+
+    # Patch the module to add boto3 if it doesn't exist
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tts.providers.aws_polly, 'AWS_SDK_AVAILABLE', True)
+        mp.setattr(tts.providers.aws_polly, 'boto3', mock_boto3, raising=False)
+        mp.setattr(tts.providers.aws_polly, 'ClientError', Exception, raising=False)
+        mp.setattr(tts.providers.aws_polly, 'BotoCoreError', Exception, raising=False)
+        mp.setattr(tts.providers.aws_polly, 'BotoConfig', dict, raising=False)
+        yield mock_boto3, mock_client
+
+
+@pytest.fixture
+def mock_azure_sdk(_azure_sdk_template, monkeypatch):
+    """Fixture to reset and inject the shared fake Azure SDK."""
+    fake_sdk = _azure_sdk_template
+    fake_sdk.SpeechConfig.reset_mock()
+    fake_sdk.SpeechSynthesizer.reset_mock(return_value=True, side_effect=True)
+    fake_sdk.AudioOutputConfig.reset_mock(return_value=True, side_effect=True)
+    fake_sdk.Connection.reset_mock(return_value=True, side_effect=True)
+    fake_sdk.AudioDataStream.reset_mock(return_value=True, side_effect=True)
+
+    # Patch the module to add Azure SDK if it doesn't exist
+    monkeypatch.setattr(tts.providers.azure_tts, 'AZURE_SDK_AVAILABLE', True)
+    for name, value in vars(fake_sdk).items():
+        monkeypatch.setattr(tts.providers.azure_tts, name, value, raising=False)
+    return fake_sdk
+
+
 class TestAWSPollyTTSProvider:
     """Test AWSPollyTTSProvider class."""
 
     @pytest.fixture
-    def mock_boto3(self):
-        """Fixture to create and inject mock boto3 module."""
-        mock_boto3 = Mock()
-        mock_client = Mock()
-        mock_boto3.client.return_value = mock_client
-
-        # Patch the module to add boto3 if it doesn't exist
-        with patch.object(tts.providers.aws_polly, 'AWS_SDK_AVAILABLE', True):
-            with patch.object(tts.providers.aws_polly, 'boto3', mock_boto3, create=True):
-                with patch.object(tts.providers.aws_polly, 'ClientError', Exception, create=True):
-                    with patch.object(tts.providers.aws_polly, 'BotoCoreError', Exception, create=True):
-                        yield mock_boto3, mock_client
+    def aws_provider(self, mock_boto3):
+        """Provider wired to the mock boto3 client."""
+        return AWSPollyTTSProvider()
 
     def test_initialization_with_credentials(self, mock_boto3):
         """Test provider initialization with AWS credentials."""
         boto3_mock, mock_client = mock_boto3
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
         provider = AWSPollyTTSProvider(
             access_key_id='test-key',
             secret_access_key='test-secret',
@@ -310,7 +818,7 @@ class TestAWSPollyTTSProvider:
 
         # Verify boto3 client was created with correct params
         boto3_mock.client.assert_called_once()
-        call_kwargs = boto3_mock.client.call_args[1]
+        call_kwargs = boto3_mock.client.call_args.kwargs
         assert call_kwargs['region_name'] == 'us-west-2'
         assert call_kwargs['aws_access_key_id'] == 'test-key'
         assert call_kwargs['aws_secret_access_key'] == 'test-secret'
@@ -319,30 +827,36 @@ class TestAWSPollyTTSProvider:
         """Test provider initialization without explicit credentials (uses IAM role)."""
         boto3_mock, mock_client = mock_boto3
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
         provider = AWSPollyTTSProvider()
         assert provider.name == 'aws'
 
         # Verify boto3 client was created without credentials
         boto3_mock.client.assert_called_once()
-        call_kwargs = boto3_mock.client.call_args[1]
+        call_kwargs = boto3_mock.client.call_args.kwargs
         assert 'aws_access_key_id' not in call_kwargs
         assert 'aws_secret_access_key' not in call_kwargs
 
+    def test_client_transport_config(self, mock_boto3):
+        """Test the client gets a pooled keep-alive config, reused on reconfigure."""
+        boto3_mock, mock_client = mock_boto3
+
+        provider = AWSPollyTTSProvider()
+        config = boto3_mock.client.call_args.kwargs['config']
+        assert config['max_pool_connections'] >= 8
+        assert config['tcp_keepalive'] is True
+
+        provider.configure(region='eu-west-1')
+        assert boto3_mock.client.call_args.kwargs['config'] is config
+
     def test_initialization_without_boto3(self):
         """Test provider initialization without boto3 raises error."""
         with patch.object(tts.providers.aws_polly, 'AWS_SDK_AVAILABLE', False):
-            from tts.providers.aws_polly import AWSPollyTTSProvider
             with pytest.raises(TTSConfigurationError, match="requires boto3 package"):
                 AWSPollyTTSProvider()
 
-    def test_get_capabilities(self, mock_boto3):
+    def test_get_capabilities(self, aws_provider):
         """Test getting provider capabilities."""
-        boto3_mock, mock_client = mock_boto3
-
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        provider = AWSPollyTTSProvider()
-        caps = provider.get_capabilities()
+        caps = aws_provider.get_capabilities()
         assert isinstance(caps, TTSCapabilities)
         assert caps.supports_ssml is True
         assert caps.supports_streaming is True
@@ -352,7 +866,6 @@ class TestAWSPollyTTSProvider:
         """Test configure method."""
         boto3_mock, mock_client = mock_boto3
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
         provider = AWSPollyTTSProvider()
         provider.configure(
             va_voice='Amy',
@@ -364,9 +877,14 @@ class TestAWSPollyTTSProvider:
         assert provider.caller_voice == 'Brian'
         assert provider.region == 'eu-west-1'
         assert provider.engine == 'standard'
+        assert boto3_mock.client.call_count == 2
 
-    def test_synthesize_success(self, mock_boto3):
-        """Test successful text synthesis."""
+        # Unchanged connection settings keep the existing client
+        provider.configure(region='eu-west-1', access_key_id=None)
+        assert boto3_mock.client.call_count == 2
+
+    def test_synthesize_to_file(self, mock_boto3, aws_provider, tmp_path):
+        """Test synthesis request parameters and WAV file output."""
         boto3_mock, mock_client = mock_boto3
 
         # Mock Polly response
@@ -375,41 +893,33 @@ class TestAWSPollyTTSProvider:
         mock_response = {'AudioStream': mock_audio_stream}
         mock_client.synthesize_speech.return_value = mock_response
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        provider = AWSPollyTTSProvider()
-
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            output_file = f.name
-
-        try:
-            audio_bytes = provider.synthesize(
-                text="Hello world",
-                voice="Joanna",
-                locale="en-US",
-                rate=1.0,
-                output_file=output_file
-            )
+        output_file = str(tmp_path / "out.wav")
 
-            # Verify API was called
-            assert mock_client.synthesize_speech.called
-            call_kwargs = mock_client.synthesize_speech.call_args[1]
-            assert call_kwargs['Text'] == "Hello world"
-            assert call_kwargs['VoiceId'] == "Joanna"
-            assert call_kwargs['LanguageCode'] == "en-US"
-            assert call_kwargs['OutputFormat'] == 'pcm'
-
-            # Verify file was written (with WAV header added)
-            assert os.path.exists(output_file)
-            with open(output_file, 'rb') as f:
-                content = f.read()
-                # Check for WAV header
-                assert content[:4] == b'RIFF'
-                assert content[8:12] == b'WAVE'
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        audio_bytes = aws_provider.synthesize(
+            text="Hello world",
+            voice="Joanna",
+            locale="en-US",
+            rate=1.0,
+            output_file=output_file
+        )
 
-    def test_synthesize_with_rate(self, mock_boto3):
+        # Verify API was called
+        mock_client.synthesize_speech.assert_called_once()
+        call_kwargs = mock_client.synthesize_speech.call_args.kwargs
+        assert call_kwargs['Text'] == "Hello world"
+        assert call_kwargs['VoiceId'] == "Joanna"
+        assert call_kwargs['LanguageCode'] == "en-US"
+        assert call_kwargs['OutputFormat'] == 'pcm'
+
+        # Verify file was written (with WAV header added)
+        assert os.path.exists(output_file)
+        with open(output_file, 'rb') as f:
+            content = f.read()
+            # Check for WAV header
+            assert content[:4] == b'RIFF'
+            assert content[8:12] == b'WAVE'
+
+    def test_synthesize_with_rate(self, mock_boto3, aws_provider):
         """Test synthesis with custom speaking rate (uses SSML)."""
         boto3_mock, mock_client = mock_boto3
 
@@ -418,9 +928,7 @@ class TestAWSPollyTTSProvider:
         mock_response = {'AudioStream': mock_audio_stream}
         mock_client.synthesize_speech.return_value = mock_response
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        provider = AWSPollyTTSProvider()
-        audio_bytes = provider.synthesize(
+        audio_bytes = aws_provider.synthesize(
             text="Hello world",
             voice="Joanna",
             locale="en-US",
@@ -428,11 +936,33 @@ class TestAWSPollyTTSProvider:
         )
 
         # Verify SSML was used
-        call_kwargs = mock_client.synthesize_speech.call_args[1]
+        mock_client.synthesize_speech.assert_called_once()
+        call_kwargs = mock_client.synthesize_speech.call_args.kwargs
         assert call_kwargs['TextType'] == 'ssml'
-        assert '<prosody rate="150%">Hello world</prosody>' in call_kwargs['Text']
+        assert EXPECTED_SSML_150 in call_kwargs['Text']
+
+    def test_synthesize_near_default_rate_is_plain_text(self, mock_boto3, aws_provider):
+        """Test a rate within float noise of 1.0 skips the SSML wrapper."""
+        boto3_mock, mock_client = mock_boto3
+        mock_client.synthesize_speech.return_value = {'AudioStream': io.BytesIO(b'pcm')}
+
+        aws_provider.synthesize("Hello world", "Joanna", "en-US", rate=1.0000001)
 
-    def test_synthesize_ssml(self, mock_boto3):
+        call_kwargs = mock_client.synthesize_speech.call_args.kwargs
+        assert 'TextType' not in call_kwargs
+        assert call_kwargs['Text'] == "Hello world"
+
+    def test_synthesize_with_rate_escapes_text(self, mock_boto3, aws_provider):
+        """Test text wrapped in SSML for a rate change is XML-escaped."""
+        boto3_mock, mock_client = mock_boto3
+        mock_client.synthesize_speech.return_value = {'AudioStream': io.BytesIO(b'pcm')}
+
+        aws_provider.synthesize("Fish & <chips>", "Joanna", "en-US", rate=1.5)
+
+        text = mock_client.synthesize_speech.call_args.kwargs['Text']
+        assert 'Fish &amp; &lt;chips&gt;' in text
+
+    def test_synthesize_ssml(self, mock_boto3, aws_provider):
         """Test SSML synthesis."""
         boto3_mock, mock_client = mock_boto3
 
@@ -441,67 +971,142 @@ class TestAWSPollyTTSProvider:
         mock_response = {'AudioStream': mock_audio_stream}
         mock_client.synthesize_speech.return_value = mock_response
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        provider = AWSPollyTTSProvider()
         ssml = '<speak><prosody rate="slow">Hello world</prosody></speak>'
-        audio_bytes = provider.synthesize_ssml(ssml, "Joanna", "en-US")
+        audio_bytes = aws_provider.synthesize_ssml(ssml, "Joanna", "en-US")
 
         # Verify API was called with SSML
-        call_kwargs = mock_client.synthesize_speech.call_args[1]
+        mock_client.synthesize_speech.assert_called_once()
+        call_kwargs = mock_client.synthesize_speech.call_args.kwargs
         assert call_kwargs['TextType'] == 'ssml'
         assert call_kwargs['Text'] == ssml
 
-    def test_synthesize_api_error(self, mock_boto3):
+    def test_compressed_output_format(self, mock_boto3, tmp_path):
+        """Test compressed formats are requested from Polly and never get a WAV header."""
+        boto3_mock, mock_client = mock_boto3
+        mock_client.synthesize_speech.return_value = {'AudioStream': io.BytesIO(b'mp3 data')}
+        provider = AWSPollyTTSProvider(output_format='mp3')
+        output_file = tmp_path / "out.mp3"
+
+        audio = provider.synthesize("Hello", "Joanna", "en-US", output_file=str(output_file))
+
+        assert mock_client.synthesize_speech.call_args.kwargs['OutputFormat'] == 'mp3'
+        assert audio == output_file.read_bytes() == b'mp3 data'
+
+        with pytest.raises(TTSConfigurationError, match="Unsupported AWS Polly output format"):
+            AWSPollyTTSProvider(output_format='flac')
+
+    @pytest.mark.parametrize('output_format', ['mp3', 'ogg_vorbis'])
+    def test_compressed_output_rejects_wav_path(self, mock_boto3, tmp_path, output_format):
+        """Test compressed audio is never written under a .wav name."""
+        boto3_mock, mock_client = mock_boto3
+        provider = AWSPollyTTSProvider(output_format=output_format)
+        output_file = str(tmp_path / "out.wav")
+
+        with pytest.raises(TTSConfigurationError, match="cannot be written to a .wav file"):
+            provider.synthesize("Hello", "Joanna", "en-US", output_file=output_file)
+        with pytest.raises(TTSConfigurationError, match="cannot be written to a .wav file"):
+            provider.stream_to_file("Hello", "Joanna", "en-US", output_file)
+
+        mock_client.synthesize_speech.assert_not_called()
+        assert not (tmp_path / "out.wav").exists()
+
+    def test_compressed_long_text_is_chunked(self, mock_boto3, tmp_path):
+        """Test over-long text is split for compressed formats too, with the frames joined in order."""
+        boto3_mock, mock_client = mock_boto3
+        mock_client.synthesize_speech.side_effect = lambda **kwargs: {
+            'AudioStream': io.BytesIO(kwargs['Text'][:1].encode())
+        }
+        provider = AWSPollyTTSProvider(output_format='mp3')
+        text = ' '.join(f"{letter * 999}." for letter in 'abc')
+        output_file = tmp_path / "out.mp3"
+
+        audio = provider.synthesize(text, "Joanna", "en-US", output_file=str(output_file))
+
+        assert mock_client.synthesize_speech.call_count == 3
+        assert audio == output_file.read_bytes() == b'abc'
+
+    def test_synthesize_long_text_is_chunked(self, mock_boto3, aws_provider, tmp_path):
+        """Test text over the neural limit is split at sentences and the PCM joined in order."""
+        boto3_mock, mock_client = mock_boto3
+        mock_client.synthesize_speech.side_effect = lambda **kwargs: {
+            'AudioStream': io.BytesIO(kwargs['Text'][:1].encode())
+        }
+        text = ' '.join(f"{letter * 999}." for letter in 'abc')
+        output_file = tmp_path / "out.wav"
+
+        audio = aws_provider.synthesize(text, "Joanna", "en-US", output_file=str(output_file))
+
+        texts = [c.kwargs['Text'] for c in mock_client.synthesize_speech.call_args_list]
+        assert sorted(texts) == [f"{letter * 999}." for letter in 'abc']
+        assert audio == output_file.read_bytes()
+        assert audio[44:] == b'abc'
+
+    def test_synthesize_many(self, mock_boto3, aws_provider):
+        """Test concurrent Polly synthesis returns audio in job order."""
+        boto3_mock, mock_client = mock_boto3
+        mock_client.synthesize_speech.side_effect = lambda **kwargs: {
+            'AudioStream': io.BytesIO(kwargs['Text'].encode())
+        }
+
+        jobs = [{'text': text, 'voice': 'Joanna', 'locale': 'en-US'} for text in ('one', 'two')]
+        audio = asyncio.run(aws_provider.synthesize_many(jobs))
+
+        assert audio == [b'one', b'two']
+        assert isinstance(aws_provider, AsyncCapable)
+
+    def test_stream_to_file(self, mock_boto3, aws_provider, tmp_path):
+        """Test the audio stream is copied to a WAV file in chunks."""
+        import wave
+        boto3_mock, mock_client = mock_boto3
+        pcm = bytes(range(256)) * 40
+        mock_client.synthesize_speech.return_value = {'AudioStream': io.BytesIO(pcm)}
+        output_file = tmp_path / "out.wav"
+
+        written = aws_provider.stream_to_file(
+            "Hello world", "Joanna", "en-US", str(output_file), chunk_size=1000
+        )
+
+        assert written == len(pcm)
+        with wave.open(str(output_file)) as wav:
+            assert wav.getframerate() == 16000
+            assert wav.readframes(wav.getnframes()) == pcm
+
+    def test_synthesize_api_error(self, mock_boto3, aws_provider):
         """Test synthesis with API error."""
         boto3_mock, mock_client = mock_boto3
 
         mock_client.synthesize_speech.side_effect = Exception("API error")
 
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        provider = AWSPollyTTSProvider()
-
         with pytest.raises(TTSAPIError, match="AWS Polly synthesis failed"):
-            provider.synthesize(
+            aws_provider.synthesize(
                 text="Hello world",
                 voice="Joanna",
                 locale="en-US"
             )
 
-    def test_validate_ssml(self, mock_boto3):
+    @pytest.mark.parametrize("ssml,expected", [
+        ('<speak>Hello</speak>', True),
+        ('Hello world', False),
+        ('<speak>Hello', False),
+        ('</speak><speak>', False),
+    ])
+    def test_validate_ssml(self, aws_provider, ssml, expected):
         """Test SSML validation."""
-        boto3_mock, mock_client = mock_boto3
-
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        provider = AWSPollyTTSProvider()
-
-        # Valid SSML
-        assert provider.validate_ssml('<speak>Hello</speak>') is True
-
-        # Invalid SSML (missing tags)
-        assert provider.validate_ssml('Hello world') is False
-        assert provider.validate_ssml('<speak>Hello') is False
+        assert aws_provider.validate_ssml(ssml) is expected
 
 
 class TestAzureTTSProvider:
     """Test AzureTTSProvider class."""
 
     @pytest.fixture
-    def mock_azure_sdk(self):
-        """Fixture to create and inject mock Azure SDK."""
-        mock_speech_config_class = Mock()
-        mock_config = Mock()
-        mock_speech_config_class.return_value = mock_config
-
-        # Patch the module to add Azure SDK if it doesn't exist
-        with patch.object(tts.providers.azure_tts, 'AZURE_SDK_AVAILABLE', True):
-            with patch.object(tts.providers.azure_tts, 'SpeechConfig', mock_speech_config_class, create=True):
-                yield mock_speech_config_class, mock_config
+    def azure_provider(self, mock_azure_sdk):
+        """Provider wired to the mock Azure SDK."""
+        return AzureTTSProvider(subscription_key='test-key')
 
     def test_initialization_with_subscription_key(self, mock_azure_sdk):
         """Test provider initialization with subscription key."""
-        mock_speech_config, mock_config = mock_azure_sdk
+        mock_speech_config = mock_azure_sdk.SpeechConfig
 
-        from tts.providers.azure_tts import AzureTTSProvider
         provider = AzureTTSProvider(
             subscription_key='test-key',
             region='westus'
@@ -518,30 +1123,26 @@ class TestAzureTTSProvider:
 
     def test_initialization_without_subscription_key(self, mock_azure_sdk):
         """Test provider initialization without subscription key raises error."""
-        from tts.providers.azure_tts import AzureTTSProvider
         with pytest.raises(TTSConfigurationError, match="requires a subscription key"):
             AzureTTSProvider()
 
     def test_initialization_without_azure_sdk(self):
         """Test provider initialization without Azure SDK raises error."""
         with patch.object(tts.providers.azure_tts, 'AZURE_SDK_AVAILABLE', False):
-            from tts.providers.azure_tts import AzureTTSProvider
             with pytest.raises(TTSConfigurationError, match="requires azure-cognitiveservices-speech"):
                 AzureTTSProvider(subscription_key='test-key')
 
-    def test_get_capabilities(self, mock_azure_sdk):
+    def test_get_capabilities(self, azure_provider):
         """Test getting provider capabilities."""
-        from tts.providers.azure_tts import AzureTTSProvider
-        provider = AzureTTSProvider(subscription_key='test-key')
-        caps = provider.get_capabilities()
+        caps = azure_provider.get_capabilities()
         assert isinstance(caps, TTSCapabilities)
         assert caps.supports_ssml is True
-        assert caps.supports_streaming is False
+        assert caps.supports_streaming is True
         assert caps.supports_custom_voices is False
+        assert isinstance(azure_provider, StreamingCapable)
 
     def test_configure_method(self, mock_azure_sdk):
         """Test configure method."""
-        from tts.providers.azure_tts import AzureTTSProvider
         provider = AzureTTSProvider(subscription_key='test-key')
         provider.configure(
             va_voice='en-US-AriaNeural',
@@ -551,167 +1152,238 @@ class TestAzureTTSProvider:
         assert provider.va_voice == 'en-US-AriaNeural'
         assert provider.caller_voice == 'en-US-DavisNeural'
         assert provider.region == 'eastus2'
+        mock_azure_sdk.SpeechConfig.assert_called_with(subscription='test-key', region='eastus2')
+        assert mock_azure_sdk.SpeechConfig.call_count == 2
+
+        # Unchanged credentials keep the existing SpeechConfig
+        provider.configure(subscription_key='test-key', region='eastus2')
+        assert mock_azure_sdk.SpeechConfig.call_count == 2
+
+    def test_synthesize_to_file(self, mock_azure_sdk, azure_provider, tmp_path):
+        """Test synthesis to file writes the in-memory audio."""
+        synthesizer = mock_azure_sdk.SpeechSynthesizer.return_value
+        synthesizer.speak_text_async.return_value.get.return_value = SimpleNamespace(
+            audio_data=b'azure audio data', reason='completed'
+        )
 
-    def test_synthesize_success(self, mock_azure_sdk):
-        """Test successful text synthesis."""
-        mock_speech_config, mock_config = mock_azure_sdk
-
-        # Mock synthesizer and result
-        mock_synthesizer = Mock()
-        mock_result = Mock()
-        mock_result.audio_data = b'azure audio data'
-        mock_async = Mock()
-        mock_async.get.return_value = mock_result
-        mock_synthesizer.speak_text_async.return_value = mock_async
-
-        mock_synthesizer_class = Mock()
-        mock_synthesizer_class.return_value = mock_synthesizer
-
-        with patch.object(tts.providers.azure_tts, 'SpeechSynthesizer', mock_synthesizer_class, create=True):
-            from tts.providers.azure_tts import AzureTTSProvider
-            provider = AzureTTSProvider(subscription_key='test-key')
-            audio_bytes = provider.synthesize(
-                text="Hello world",
-                voice="en-US-JennyNeural",
-                locale="en-US",
-                rate=1.0
-            )
-
-            # Verify synthesizer was called
-            assert mock_synthesizer.speak_text_async.called
-            call_args = mock_synthesizer.speak_text_async.call_args[0]
-            assert call_args[0] == "Hello world"
-
-            # Verify audio bytes returned
-            assert audio_bytes == b'azure audio data'
-
-    def test_synthesize_to_file(self, mock_azure_sdk):
-        """Test synthesis to file."""
-        # Mock audio config
-        mock_audio_config_class = Mock()
-        mock_output_config = Mock()
-        mock_audio_config_class.return_value = mock_output_config
-
-        # Mock synthesizer and result
-        mock_synthesizer = Mock()
-        mock_result = Mock()
-        mock_async = Mock()
-        mock_async.get.return_value = mock_result
-        mock_synthesizer.speak_text_async.return_value = mock_async
+        output_path = tmp_path / "out.wav"
+        audio_bytes = azure_provider.synthesize(
+            text="Hello world",
+            voice="en-US-JennyNeural",
+            locale="en-US",
+            output_file=str(output_path)
+        )
 
-        mock_synthesizer_class = Mock()
-        mock_synthesizer_class.return_value = mock_synthesizer
+        # Synthesized to memory, then written once; no SDK file output
+        assert mock_azure_sdk.SpeechSynthesizer.call_args.kwargs['audio_config'] is None
+        assert audio_bytes == b'azure audio data'
+        assert output_path.read_bytes() == b'azure audio data'
 
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            output_file = f.name
-            # Write some dummy data
-            f.write(b'azure audio data')
+    def test_synthesize_canceled(self, mock_azure_sdk, azure_provider):
+        """Test a canceled synthesis raises instead of returning partial audio."""
+        synthesizer = mock_azure_sdk.SpeechSynthesizer.return_value
+        synthesizer.speak_text_async.return_value.get.return_value = SimpleNamespace(
+            audio_data=b'partial', reason='canceled'
+        )
 
-        try:
-            with patch.object(tts.providers.azure_tts, 'SpeechSynthesizer', mock_synthesizer_class, create=True):
-                with patch.object(tts.providers.azure_tts, 'AudioOutputConfig', mock_audio_config_class, create=True):
-                    from tts.providers.azure_tts import AzureTTSProvider
-                    provider = AzureTTSProvider(subscription_key='test-key')
-                    audio_bytes = provider.synthesize(
-                        text="Hello world",
-                        voice="en-US-JennyNeural",
-                        locale="en-US",
-                        output_file=output_file
-                    )
-
-                    # Verify audio config was created with filename
-                    mock_audio_config_class.assert_called_once_with(filename=output_file)
-
-                    # Verify file was read
-                    assert audio_bytes == b'azure audio data'
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        with pytest.raises(TTSAPIError, match="^Azure TTS synthesis failed: canceled$"):
+            azure_provider.synthesize("Hello", "en-US-JennyNeural", "en-US")
+        # The synthesizer may hold a dead connection, so it is not pooled
+        assert azure_provider._synthesizers == {}
 
-    def test_synthesize_with_rate(self, mock_azure_sdk):
+    def test_synthesize_with_rate(self, mock_azure_sdk, azure_provider):
         """Test synthesis with custom speaking rate (uses SSML)."""
         # Mock synthesizer and result
         mock_synthesizer = Mock()
         mock_result = Mock()
         mock_result.audio_data = b'azure audio data'
+        mock_result.reason = 'completed'
         mock_async = Mock()
         mock_async.get.return_value = mock_result
         mock_synthesizer.speak_ssml_async.return_value = mock_async
 
-        mock_synthesizer_class = Mock()
-        mock_synthesizer_class.return_value = mock_synthesizer
+        mock_azure_sdk.SpeechSynthesizer.return_value = mock_synthesizer
 
-        with patch.object(tts.providers.azure_tts, 'SpeechSynthesizer', mock_synthesizer_class, create=True):
-            from tts.providers.azure_tts import AzureTTSProvider
-            provider = AzureTTSProvider(subscription_key='test-key')
-            audio_bytes = provider.synthesize(
-                text="Hello world",
-                voice="en-US-JennyNeural",
-                locale="en-US",
-                rate=1.5
-            )
+        audio_bytes = azure_provider.synthesize(
+            text="Hello world",
+            voice="en-US-JennyNeural",
+            locale="en-US",
+            rate=1.5
+        )
+
+        # Verify SSML was used
+        mock_synthesizer.speak_ssml_async.assert_called_once()
+        ssml = mock_synthesizer.speak_ssml_async.call_args.args[0]
+        assert '<speak' in ssml
+        assert EXPECTED_SSML_150 in ssml
+
+    def test_synthesize_with_rate_escapes_text(self, mock_azure_sdk, azure_provider):
+        """Test text wrapped in SSML for a rate change is XML-escaped."""
+        synthesizer = mock_azure_sdk.SpeechSynthesizer.return_value
+        synthesizer.speak_ssml_async.return_value.get.return_value = SimpleNamespace(
+            audio_data=b'azure audio data', reason='completed'
+        )
 
-            # Verify SSML was used
-            assert mock_synthesizer.speak_ssml_async.called
-            call_args = mock_synthesizer.speak_ssml_async.call_args[0]
-            ssml = call_args[0]
-            assert '<speak' in ssml
-            assert '<prosody rate="150%">Hello world</prosody>' in ssml
+        azure_provider.synthesize("Fish & <chips>", "en-US-JennyNeural", "en-US", rate=1.5)
 
-    def test_synthesize_ssml(self, mock_azure_sdk):
+        ssml = synthesizer.speak_ssml_async.call_args.args[0]
+        assert 'Fish &amp; &lt;chips&gt;' in ssml
+
+    def test_synthesize_ssml(self, mock_azure_sdk, azure_provider):
         """Test SSML synthesis."""
         # Mock synthesizer and result
         mock_synthesizer = Mock()
         mock_result = Mock()
         mock_result.audio_data = b'azure audio data'
+        mock_result.reason = 'completed'
         mock_async = Mock()
         mock_async.get.return_value = mock_result
         mock_synthesizer.speak_ssml_async.return_value = mock_async
 
-        mock_synthesizer_class = Mock()
-        mock_synthesizer_class.return_value = mock_synthesizer
+        mock_azure_sdk.SpeechSynthesizer.return_value = mock_synthesizer
+
+        ssml = '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US"><voice name="en-US-JennyNeural">Hello world</voice></speak>'
+        audio_bytes = azure_provider.synthesize_ssml(ssml, "en-US-JennyNeural", "en-US")
+
+        # Verify SSML was used
+        mock_synthesizer.speak_ssml_async.assert_called_once()
+        assert mock_synthesizer.speak_ssml_async.call_args.args[0] == ssml
+
+    def test_synthesizer_reused(self, mock_azure_sdk, azure_provider):
+        """Test in-memory synthesis reuses a synthesizer per voice and drops failed ones."""
+        synthesizer = mock_azure_sdk.SpeechSynthesizer.return_value
+        synthesizer.speak_text_async.return_value.get.return_value = SimpleNamespace(
+            audio_data=b'azure audio data', reason='completed'
+        )
 
-        with patch.object(tts.providers.azure_tts, 'SpeechSynthesizer', mock_synthesizer_class, create=True):
-            from tts.providers.azure_tts import AzureTTSProvider
-            provider = AzureTTSProvider(subscription_key='test-key')
-            ssml = '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US"><voice name="en-US-JennyNeural">Hello world</voice></speak>'
-            audio_bytes = provider.synthesize_ssml(ssml, "en-US-JennyNeural", "en-US")
+        for _ in range(3):
+            azure_provider.synthesize("Hello", "en-US-JennyNeural", "en-US")
+        assert mock_azure_sdk.SpeechSynthesizer.call_count == 1
+
+        azure_provider.synthesize("Hello", "en-US-GuyNeural", "en-US")
+        assert mock_azure_sdk.SpeechSynthesizer.call_count == 2
+
+        synthesizer.speak_text_async.side_effect = Exception("connection reset")
+        with pytest.raises(TTSAPIError):
+            azure_provider.synthesize("Hello", "en-US-JennyNeural", "en-US")
+        synthesizer.speak_text_async.side_effect = None
+        azure_provider.synthesize("Hello", "en-US-JennyNeural", "en-US")
+        assert mock_azure_sdk.SpeechSynthesizer.call_count == 3
+
+    def test_synthesize_stream(self, mock_azure_sdk, azure_provider, tmp_path):
+        """Test streaming yields chunks as read and writes them to output_file."""
+        stream = mock_azure_sdk.AudioDataStream.return_value
+        stream.read_data.side_effect = [4, 2, 0]
+        stream.status = 'all'
+        output_path = tmp_path / "out.wav"
+
+        chunks = list(azure_provider.synthesize_stream(
+            "Hello", "en-US-JennyNeural", "en-US", chunk_size=4, output_file=str(output_path)
+        ))
 
-            # Verify SSML was used
-            call_args = mock_synthesizer.speak_ssml_async.call_args[0]
-            assert call_args[0] == ssml
+        synthesizer = mock_azure_sdk.SpeechSynthesizer.return_value
+        synthesizer.start_speaking_text_async.assert_called_once_with("Hello")
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+        assert output_path.read_bytes() == b''.join(chunks)
 
-    def test_synthesize_api_error(self, mock_azure_sdk):
+        # A canceled stream is an error
+        stream.read_data.side_effect = [4, 0]
+        stream.status = 'canceled'
+        with pytest.raises(TTSAPIError, match="streaming failed"):
+            list(azure_provider.synthesize_stream("Hello", "en-US-JennyNeural", "en-US"))
+
+    def test_prewarm(self, mock_azure_sdk, azure_provider):
+        """Test prewarm opens a connection for each default voice."""
+        azure_provider.prewarm()
+        connection = mock_azure_sdk.Connection.from_speech_synthesizer.return_value
+        assert connection.open.call_count == 2
+
+        mock_azure_sdk.Connection.from_speech_synthesizer.side_effect = Exception("no route")
+        with pytest.raises(TTSAPIError, match="Failed to connect"):
+            azure_provider.prewarm()
+
+    def test_synthesize_api_error(self, mock_azure_sdk, azure_provider):
         """Test synthesis with API error."""
         # Mock synthesizer to raise error
         mock_synthesizer = Mock()
         mock_synthesizer.speak_text_async.side_effect = Exception("Azure API error")
 
-        mock_synthesizer_class = Mock()
-        mock_synthesizer_class.return_value = mock_synthesizer
+        mock_azure_sdk.SpeechSynthesizer.return_value = mock_synthesizer
 
-        with patch.object(tts.providers.azure_tts, 'SpeechSynthesizer', mock_synthesizer_class, create=True):
-            from tts.providers.azure_tts import AzureTTSProvider
-            provider = AzureTTSProvider(subscription_key='test-key')
-
-            with pytest.raises(TTSAPIError, match="Azure TTS synthesis failed"):
-                provider.synthesize(
-                    text="Hello world",
-                    voice="en-US-JennyNeural",
-                    locale="en-US"
-                )
+        with pytest.raises(TTSAPIError, match="Azure TTS synthesis failed"):
+            azure_provider.synthesize(
+                text="Hello world",
+                voice="en-US-JennyNeural",
+                locale="en-US"
+            )
 
-    def test_validate_ssml(self, mock_azure_sdk):
+    @pytest.mark.parametrize("ssml,expected", [
+        ('<speak>Hello</speak>', True),
+        ('Hello world', False),
+        ('<speak>Hello', False),
+        ('</speak><speak>', False),
+    ])
+    def test_validate_ssml(self, azure_provider, ssml, expected):
         """Test SSML validation."""
-        from tts.providers.azure_tts import AzureTTSProvider
-        provider = AzureTTSProvider(subscription_key='test-key')
+        assert azure_provider.validate_ssml(ssml) is expected
+
+
+@pytest.fixture(params=['google', 'aws', 'azure'])
+def synth_case(request, monkeypatch):
+    """Provider wired to a mocked backend, with a hook to read the text it sent."""
+    if request.param == 'google':
+        post = MagicMock(return_value=SimpleNamespace(
+            status_code=200,
+            content=AUDIO_RESPONSE,
+            raise_for_status=lambda: None
+        ))
+        monkeypatch.setattr("requests.Session.post", post)
+        return SimpleNamespace(
+            provider=request.getfixturevalue('google_provider'),
+            voice="en-US-Journey-O",
+            sent_text=lambda: sent_payload(post.call_args)['input']['text'],
+            expected=EXPECTED_AUDIO,
+        )
 
-        # Valid SSML
-        assert provider.validate_ssml('<speak>Hello</speak>') is True
+    if request.param == 'aws':
+        _, mock_client = request.getfixturevalue('mock_boto3')
+        mock_client.synthesize_speech.return_value = {
+            'AudioStream': SimpleNamespace(read=lambda: b'pcm audio data')
+        }
+        return SimpleNamespace(
+            provider=AWSPollyTTSProvider(),
+            voice="Joanna",
+            sent_text=lambda: mock_client.synthesize_speech.call_args.kwargs['Text'],
+            expected=b'pcm audio data',
+        )
 
-        # Invalid SSML (missing tags)
-        assert provider.validate_ssml('Hello world') is False
-        assert provider.validate_ssml('<speak>Hello') is False
+    fake_sdk = request.getfixturevalue('mock_azure_sdk')
+    synthesizer = fake_sdk.SpeechSynthesizer.return_value
+    synthesizer.speak_text_async.return_value.get.return_value = SimpleNamespace(
+        audio_data=b'azure audio data', reason='completed'
+    )
+    return SimpleNamespace(
+        provider=AzureTTSProvider(subscription_key='test-key'),
+        voice="en-US-JennyNeural",
+        sent_text=lambda: synthesizer.speak_text_async.call_args.args[0],
+        expected=b'azure audio data',
+    )
+
+
+class TestSynthesizeContract:
+    """Behaviour every provider's synthesize must share."""
+
+    def test_synthesize_success(self, synth_case):
+        """Test successful in-memory synthesis sends the text and returns audio."""
+        audio_bytes = synth_case.provider.synthesize(
+            text="Hello world",
+            voice=synth_case.voice,
+            locale="en-US",
+            rate=1.0
+        )
+
+        assert synth_case.sent_text() == "Hello world"
+        assert audio_bytes == synth_case.expected
 
 
 class TestElevenLabsTTSProvider:
@@ -731,29 +1403,19 @@ class TestElevenLabsTTSProvider:
         assert provider.model == 'eleven_multilingual_v2'
         assert provider.name == 'elevenlabs'
 
-    def test_initialization_without_api_key(self):
-        """Test provider initialization without API key raises error."""
-        with pytest.raises(TTSConfigurationError, match="requires an API key"):
-            ElevenLabsTTSProvider(va_voice='voice-id-1', caller_voice='voice-id-2')
-
-    def test_initialization_without_va_voice(self):
-        """Test provider initialization without va_voice raises error."""
-        with pytest.raises(TTSConfigurationError, match="requires va_voice"):
-            ElevenLabsTTSProvider(api_key='test-key', caller_voice='voice-id-2')
-
-    def test_initialization_without_caller_voice(self):
-        """Test provider initialization without caller_voice raises error."""
-        with pytest.raises(TTSConfigurationError, match="requires caller_voice"):
-            ElevenLabsTTSProvider(api_key='test-key', va_voice='voice-id-1')
-
-    def test_get_capabilities(self):
+    @pytest.mark.parametrize("kwargs,msg", [
+        ({'va_voice': 'voice-id-1', 'caller_voice': 'voice-id-2'}, "requires an API key"),
+        ({'api_key': 'test-key', 'caller_voice': 'voice-id-2'}, "requires va_voice"),
+        ({'api_key': 'test-key', 'va_voice': 'voice-id-1'}, "requires caller_voice"),
+    ])
+    def test_initialization_missing_required(self, kwargs, msg):
+        """Test provider initialization without a required setting raises error."""
+        with pytest.raises(TTSConfigurationError, match=msg):
+            ElevenLabsTTSProvider(**kwargs)
+
+    def test_get_capabilities(self, elevenlabs_provider):
         """Test getting provider capabilities."""
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
-        )
-        caps = provider.get_capabilities()
+        caps = elevenlabs_provider.get_capabilities()
         assert isinstance(caps, TTSCapabilities)
         assert caps.supports_streaming is True
         assert caps.supports_ssml is False
@@ -776,71 +1438,70 @@ class TestElevenLabsTTSProvider:
         assert provider.model == 'eleven_monolingual_v1'
         assert provider.headers['xi-api-key'] == 'new-key'
 
-    @patch('requests.post')
-    def test_synthesize_success(self, mock_post):
+    @patch('requests.Session.post')
+    def test_synthesize_success(self, mock_post, elevenlabs_provider):
         """Test successful text synthesis."""
         # Mock API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b'mp3 audio data'
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            content=b'mp3 audio data',
+            raise_for_status=lambda: None
         )
 
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            output_file = f.name
-
-        try:
-            audio_bytes = provider.synthesize(
-                text="Hello world",
-                voice="voice-id-1",
-                locale="en-US",
-                output_file=output_file
-            )
+        buf = io.BytesIO()
 
-            # Verify API was called
-            assert mock_post.called
-            call_args = mock_post.call_args
-            url = call_args[0][0]
-            assert 'voice-id-1' in url
+        audio_bytes = elevenlabs_provider.synthesize(
+            text="Hello world",
+            voice="voice-id-1",
+            locale="en-US",
+            output_file=buf
+        )
 
-            payload = call_args[1]['json']
-            assert payload['text'] == "Hello world"
-            assert payload['model_id'] == 'eleven_monolingual_v1'
+        # Verify API was called
+        mock_post.assert_called_once()
+        call_args = mock_post.call_args
+        url = call_args.args[0]
+        assert 'voice-id-1' in url
+
+        payload = sent_payload(call_args)
+        assert payload['text'] == "Hello world"
+        assert payload['model_id'] == 'eleven_monolingual_v1'
+
+        # Verify audio bytes returned and written to the buffer
+        assert audio_bytes == b'mp3 audio data'
+        assert buf.getvalue() == b'mp3 audio data'
+
+    @patch('requests.Session.post')
+    def test_synthesize_wav_path_is_transcoded(self, mock_post, elevenlabs_provider, tmp_path):
+        """Test MP3 audio written to a .wav path is converted to WAV."""
+        mock_post.return_value = SimpleNamespace(
+            status_code=200, content=b'mp3 audio data', raise_for_status=lambda: None
+        )
+        segment = MagicMock()
+        segment.export.side_effect = lambda buf, format: buf.write(b'RIFF wav data')
+        output_file = tmp_path / "out.wav"
 
-            # Verify audio bytes returned
-            assert audio_bytes == b'mp3 audio data'
+        with patch('pydub.AudioSegment.from_file', return_value=segment) as from_file:
+            audio = elevenlabs_provider.synthesize(
+                "Hello world", "voice-id-1", "en-US", output_file=str(output_file)
+            )
 
-            # Verify file was written
-            assert os.path.exists(output_file)
-            with open(output_file, 'rb') as f:
-                assert f.read() == b'mp3 audio data'
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        assert from_file.call_args.args[0].getvalue() == b'mp3 audio data'
+        assert from_file.call_args.kwargs['format'] == 'mp3'
+        assert audio == b'mp3 audio data'
+        assert output_file.read_bytes() == b'RIFF wav data'
 
-    @patch('requests.post')
-    def test_synthesize_with_voice_id(self, mock_post):
+    @patch('requests.Session.post')
+    def test_synthesize_with_voice_id(self, mock_post, elevenlabs_provider):
         """Test synthesis with custom voice ID and settings."""
         # Mock API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b'mp3 audio data'
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            content=b'mp3 audio data',
+            raise_for_status=lambda: None
         )
 
-        audio_bytes = provider.synthesize_with_voice_id(
+        audio_bytes = elevenlabs_provider.synthesize_with_voice_id(
             text="Hello world",
             voice_id="custom-voice-id",
             stability=0.7,
@@ -848,111 +1509,286 @@ class TestElevenLabsTTSProvider:
         )
 
         # Verify API was called with custom settings
-        payload = mock_post.call_args[1]['json']
+        payload = sent_payload(mock_post.call_args)
         assert payload['voice_settings']['stability'] == 0.7
         assert payload['voice_settings']['similarity_boost'] == 0.8
+        assert mock_post.call_args.args[0].endswith('/text-to-speech/custom-voice-id')
+        # Overrides must not leak into the shared defaults
+        assert ElevenLabsTTSProvider.DEFAULT_VOICE_SETTINGS == {
+            "stability": 0.5,
+            "similarity_boost": 0.75,
+        }
 
-    @patch('requests.post')
-    def test_synthesize_rate_limit_error(self, mock_post):
+    @patch('requests.Session.post')
+    def test_synthesize_rate_limit_error(self, mock_post, elevenlabs_provider):
         """Test synthesis with rate limit error."""
         # Mock rate limit response
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_post.return_value = mock_response
-
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
-        )
+        mock_post.return_value = SimpleNamespace(status_code=429)
 
         from tts.base import TTSRateLimitError
         with pytest.raises(TTSRateLimitError, match="rate limit exceeded"):
-            provider.synthesize(
+            elevenlabs_provider.synthesize(
                 text="Hello world",
                 voice="voice-id-1",
                 locale="en-US"
             )
 
-    @patch('requests.post')
-    def test_synthesize_api_error(self, mock_post):
+    @patch('requests.Session.post')
+    def test_synthesize_api_error(self, mock_post, elevenlabs_provider):
         """Test synthesis with API error."""
         import requests
         mock_post.side_effect = requests.exceptions.RequestException("API error")
 
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
-        )
-
         with pytest.raises(TTSAPIError, match="API request failed"):
-            provider.synthesize(
+            elevenlabs_provider.synthesize(
                 text="Hello world",
                 voice="voice-id-1",
                 locale="en-US"
             )
 
-    @patch('requests.post')
-    def test_synthesize_stream(self, mock_post):
+    @patch('requests.Session.post')
+    def test_synthesize_unknown_voice_short_circuits(self, mock_post):
+        """Test a voice ID rejected with 404 is not sent to the API again."""
+        import requests
+        provider = ElevenLabsTTSProvider(api_key='test-key', va_voice='voice-id-1', caller_voice='voice-id-2')
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+        mock_post.return_value = response
+
+        for _ in range(2):
+            with pytest.raises(TTSConfigurationError, match="missing-voice"):
+                provider.synthesize(
+                    text="Hello world",
+                    voice="missing-voice",
+                    locale="en-US"
+                )
+        assert mock_post.call_count == 1
+
+        provider.clear_voice_cache()
+        with pytest.raises(TTSConfigurationError, match="was not found"):
+            provider.synthesize(text="Hello world", voice="missing-voice", locale="en-US")
+        assert mock_post.call_count == 2
+
+    def test_synthesize_many_defaults_to_batch_max_workers(self, monkeypatch):
+        """Test async synthesis stays within the provider's concurrency cap."""
+        provider = ElevenLabsTTSProvider(api_key='test-key', va_voice='voice-id-1', caller_voice='voice-id-2')
+        lock = threading.Lock()
+        active = peak = 0
+
+        def synthesize(text, voice, locale, rate, output_file):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return text.encode()
+        monkeypatch.setattr(provider, 'synthesize', synthesize)
+
+        jobs = [{'text': str(i), 'voice': 'voice-id-1', 'locale': 'en-US'} for i in range(6)]
+        audio = asyncio.run(provider.synthesize_many(jobs))
+
+        assert audio == [str(i).encode() for i in range(6)]
+        assert peak == ElevenLabsTTSProvider.BATCH_MAX_WORKERS
+
+    @patch('requests.Session.post')
+    def test_synthesize_stream(self, mock_post, elevenlabs_provider):
         """Test streaming synthesis."""
         # Mock streaming response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.iter_content.return_value = iter([b'chunk1', b'chunk2', b'chunk3'])
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
-
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([b'chunk1', b'chunk2', b'chunk3']),
+            raise_for_status=lambda: None,
+            close=Mock()
         )
 
-        chunks = list(provider.synthesize_stream(
+        chunks = list(elevenlabs_provider.synthesize_stream(
             text="Hello world",
             voice="voice-id-1",
             locale="en-US"
         ))
 
         # Verify streaming API was called
+        mock_post.assert_called_once()
         call_args = mock_post.call_args
-        url = call_args[0][0]
-        assert 'stream' in url
-        assert mock_post.call_args[1]['stream'] is True
+        assert 'stream' in call_args.args[0]
+        assert call_args.kwargs['stream'] is True
+        # Audio is already compressed, so no content coding is requested
+        assert call_args.kwargs['headers']['Accept-Encoding'] == 'identity'
 
-        # Verify chunks were received
+        # Verify chunks were received and the connection released
         assert chunks == [b'chunk1', b'chunk2', b'chunk3']
+        mock_post.return_value.close.assert_called_once()
+
+    @patch('requests.Session.post')
+    def test_synthesize_stream_early_exit_closes_response(self, mock_post, elevenlabs_provider):
+        """Test a consumer that stops early still releases the pooled connection."""
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([b'chunk1', b'chunk2']),
+            raise_for_status=lambda: None,
+            close=Mock()
+        )
 
-    @patch('requests.post')
-    def test_synthesize_stream_rate_limit(self, mock_post):
-        """Test streaming with rate limit error."""
-        # Mock rate limit response
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_post.return_value = mock_response
+        chunks = elevenlabs_provider.synthesize_stream("Hello", "voice-id-1", "en-US")
+        assert next(chunks) == b'chunk1'
+        chunks.close()
 
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
+        mock_post.return_value.close.assert_called_once()
+
+    @patch('requests.Session.post')
+    def test_collect_stream(self, mock_post, elevenlabs_provider):
+        """Test collect_stream joins streamed chunks into one bytes object."""
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([b'chunk1', b'chunk2', b'chunk3']),
+            raise_for_status=lambda: None,
+            close=Mock()
+        )
+
+        audio = collect_stream(elevenlabs_provider, "Hello world", "voice-id-1", "en-US")
+
+        assert audio == b'chunk1chunk2chunk3'
+
+    @patch('requests.Session.post')
+    def test_stream_async(self, mock_post, elevenlabs_provider):
+        """Test stream_async yields the provider's chunks from asyncio code."""
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([b'chunk1', b'chunk2']),
+            raise_for_status=lambda: None,
+            close=Mock()
+        )
+
+        async def collect():
+            return [c async for c in stream_async(elevenlabs_provider, "Hello", "voice-id-1", "en-US")]
+
+        assert asyncio.run(collect()) == [b'chunk1', b'chunk2']
+
+    @patch('requests.Session.post')
+    def test_stream_async_early_exit_closes_response(self, mock_post, elevenlabs_provider):
+        """Test stopping stream_async early closes the provider's HTTP response."""
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([b'chunk1', b'chunk2']),
+            raise_for_status=lambda: None,
+            close=Mock()
+        )
+
+        async def first_chunk():
+            chunks = stream_async(elevenlabs_provider, "Hello", "voice-id-1", "en-US")
+            try:
+                return await chunks.__anext__()
+            finally:
+                await chunks.aclose()
+
+        assert asyncio.run(first_chunk()) == b'chunk1'
+        mock_post.return_value.close.assert_called_once()
+
+    @patch('requests.Session.post')
+    def test_synthesize_stream_to_file(self, mock_post, elevenlabs_provider, tmp_path):
+        """Test streaming writes chunks to disk using the default chunk size."""
+        read_sizes = []
+
+        def iter_content(chunk_size):
+            read_sizes.append(chunk_size)
+            return iter([b'chunk1', b'', b'chunk2'])
+
+        mock_post.return_value = SimpleNamespace(
+            status_code=200,
+            iter_content=iter_content,
+            raise_for_status=lambda: None,
+            close=Mock()
+        )
+        output_file = tmp_path / "stream.mp3"
+
+        chunks = list(elevenlabs_provider.synthesize_stream(
+            text="Hello world",
+            voice="voice-id-1",
+            locale="en-US",
+            output_file=str(output_file)
+        ))
+
+        assert chunks == [b'chunk1', b'chunk2']
+        assert output_file.read_bytes() == b'chunk1chunk2'
+        assert read_sizes == [64 * 1024]
+
+    @patch('requests.Session.post')
+    def test_synthesize_stream_mv(self, mock_post, elevenlabs_provider):
+        """Test memoryview streaming reads into one reused buffer."""
+        response = MagicMock(status_code=200, raw=io.BytesIO(b'abcdefgh'))
+        mock_post.return_value = response
+
+        views = elevenlabs_provider.synthesize_stream_mv(
+            text="Hello world",
+            voice="voice-id-1",
+            locale="en-US",
+            chunk_size=3
         )
+        chunks = [bytes(view) for view in views]
+
+        assert chunks == [b'abc', b'def', b'gh']
+        assert response.raw.decode_content is True
+        response.close.assert_called_once()
+
+    @patch('requests.Session.post')
+    def test_stream_to_file(self, mock_post, elevenlabs_provider, tmp_path):
+        """Test stream_to_file hands every chunk to the writer thread."""
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = iter([b'chunk%d' % i for i in range(10)])
+        mock_post.return_value = response
+        output_file = tmp_path / "stream.mp3"
+
+        written = elevenlabs_provider.stream_to_file(
+            text="Hello world",
+            voice="voice-id-1",
+            locale="en-US",
+            output_file=str(output_file),
+            chunk_size=1024
+        )
+
+        expected = b''.join(b'chunk%d' % i for i in range(10))
+        assert written == len(expected)
+        assert output_file.read_bytes() == expected
+        response.iter_content.assert_called_once_with(chunk_size=1024)
+        response.close.assert_called_once()
+
+    @patch('requests.Session.post')
+    def test_stream_to_file_write_error(self, mock_post, elevenlabs_provider, tmp_path):
+        """Test a writer failure is reported to the caller."""
+        response = MagicMock(status_code=200)
+        response.iter_content.return_value = iter([b'chunk1', b'chunk2'])
+        mock_post.return_value = response
+
+        with pytest.raises(TTSAPIError, match="Failed to write audio file"):
+            elevenlabs_provider.stream_to_file(
+                text="Hello world",
+                voice="voice-id-1",
+                locale="en-US",
+                output_file=str(tmp_path / "missing" / "stream.mp3")
+            )
+
+    @patch('requests.Session.post')
+    def test_synthesize_stream_rate_limit(self, mock_post, elevenlabs_provider):
+        """Test streaming with rate limit error."""
+        # Mock rate limit response
+        mock_post.return_value = SimpleNamespace(status_code=429, close=Mock())
 
         from tts.base import TTSRateLimitError
         with pytest.raises(TTSRateLimitError, match="rate limit exceeded"):
-            list(provider.synthesize_stream(
+            list(elevenlabs_provider.synthesize_stream(
                 text="Hello world",
                 voice="voice-id-1",
                 locale="en-US"
             ))
+        mock_post.return_value.close.assert_called_once()
 
-    @patch('requests.get')
-    def test_list_custom_voices(self, mock_get):
+    @patch('requests.Session.get')
+    def test_list_custom_voices(self, mock_get, elevenlabs_provider):
         """Test listing custom voices."""
         # Mock API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        voices_json = {
             'voices': [
                 {
                     'voice_id': 'voice-1',
@@ -967,21 +1803,17 @@ class TestElevenLabsTTSProvider:
                 }
             ]
         }
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
+        mock_get.return_value = SimpleNamespace(
+            status_code=200,
+            content=json.dumps(voices_json).encode(),
+            raise_for_status=lambda: None
         )
 
-        voices = provider.list_custom_voices()
+        voices = elevenlabs_provider.list_custom_voices()
 
         # Verify API was called
-        assert mock_get.called
-        call_args = mock_get.call_args
-        url = call_args[0][0]
+        mock_get.assert_called_once()
+        url = mock_get.call_args.args[0]
         assert 'voices' in url
 
         # Verify voices were parsed correctly
@@ -990,20 +1822,37 @@ class TestElevenLabsTTSProvider:
         assert voices[0]['name'] == 'Voice One'
         assert voices[1]['id'] == 'voice-2'
 
-    @patch('requests.get')
-    def test_list_custom_voices_api_error(self, mock_get):
+    @patch('requests.Session.get')
+    def test_iter_custom_voices_early_exit(self, mock_get, elevenlabs_provider, monkeypatch):
+        """Test stopping after the first voice does not parse the rest."""
+        parsed = []
+
+        def items(raw, prefix):
+            assert prefix == 'voices.item'
+            for i in range(1000):
+                parsed.append(i)
+                yield {'voice_id': f'voice-{i}', 'name': f'Voice {i}'}
+
+        monkeypatch.setattr(tts.providers.elevenlabs_tts, 'ijson', SimpleNamespace(items=items))
+        response = MagicMock(status_code=200)
+        mock_get.return_value = response
+
+        voices = elevenlabs_provider.iter_custom_voices()
+        assert next(voices)['id'] == 'voice-0'
+        voices.close()
+
+        assert parsed == [0]
+        assert mock_get.call_args.kwargs['stream'] is True
+        response.close.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_list_custom_voices_api_error(self, mock_get, elevenlabs_provider):
         """Test listing voices with API error."""
         import requests
         mock_get.side_effect = requests.exceptions.RequestException("API error")
 
-        provider = ElevenLabsTTSProvider(
-            api_key='test-key',
-            va_voice='voice-id-1',
-            caller_voice='voice-id-2'
-        )
-
         with pytest.raises(TTSAPIError, match="Failed to list"):
-            provider.list_custom_voices()
+            elevenlabs_provider.list_custom_voices()
 
 
 class TestFeatureDetection:
@@ -1017,6 +1866,21 @@ class TestFeatureDetection:
         from tts.features import AudioEffectsCapable
         assert has_feature(provider, AudioEffectsCapable) is True
         assert has_feature(provider, StreamingCapable) is False
+        assert has_feature(provider, AsyncCapable) is True
+
+    def test_has_feature_with_data_member_protocol(self, google_provider):
+        """Test has_feature falls back to isinstance for protocols with properties."""
+        assert has_feature(google_provider, TTSProvider) is True
+        assert has_feature(object(), TTSProvider) is False
+
+    def test_has_feature_agrees_with_isinstance(self):
+        """Test the attribute-based check matches the runtime protocol check."""
+        from tts.features import _REQUIRED_ATTRS
+        for provider_class in (GoogleTTSProvider, ElevenLabsTTSProvider,
+                               AzureTTSProvider, AWSPollyTTSProvider):
+            provider = provider_class.__new__(provider_class)
+            for protocol in _REQUIRED_ATTRS:
+                assert has_feature(provider, protocol) is isinstance(provider, protocol)
 
     def test_isinstance_check_for_features(self):
         """Test isinstance checks for feature protocols."""
@@ -1037,5 +1901,29 @@ class TestCreateTTSProvider:
         assert provider.name == 'google'
 
 
+class TestPackageImport:
+    """Test the tts package loads its submodules lazily."""
+
+    def test_import_does_not_load_providers(self):
+        """Test importing tts alone does not pull in HTTP or provider modules."""
+        import subprocess
+        code = (
+            "import sys, tts; "
+            "assert 'requests' not in sys.modules; "
+            "assert 'tts.providers' not in sys.modules; "
+            "assert tts.TTSFactory.list_providers(); "
+            "assert 'tts.providers.google_tts' not in sys.modules; "
+            "tts.create_tts_provider('google', api_key='k'); "
+            "assert 'tts.providers.azure_tts' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import tts
+        with pytest.raises(AttributeError):
+            tts.NoSuchName
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -34,48 +34,58 @@ Advanced usage:
             play_audio(chunk)
 """
 
-from tts.base import (
-    TTSProvider,
-    TTSProviderError,
-    TTSConfigurationError,
-    TTSAPIError,
-    TTSRateLimitError,
-)
-from tts.capabilities import TTSCapabilities
-from tts.config import TTSConfig, get_config, reset_config
-from tts.factory import TTSFactory, create_tts_provider
-from tts.features import (
-    StreamingCapable,
-    SSMLCapable,
-    CustomVoiceCapable,
-    AudioEffectsCapable,
-    VolumeControlCapable,
-    has_feature,
-)
+import importlib
 
-__all__ = [
+# Public names and the modules that define them. Submodules are imported on
+# first attribute access (PEP 562), so "import tts" stays cheap and only the
+# parts of the package a program actually uses get loaded.
+_LAZY_EXPORTS = {
     # Base classes
-    'TTSProvider',
-    'TTSProviderError',
-    'TTSConfigurationError',
-    'TTSAPIError',
-    'TTSRateLimitError',
+    'TTSProvider': 'tts.base',
+    'AsyncSynthesisMixin': 'tts.base',
+    'BatchSynthesisMixin': 'tts.base',
+    'CachedTTSMixin': 'tts.base',
+    'TTSProviderError': 'tts.base',
+    'TTSConfigurationError': 'tts.base',
+    'TTSAPIError': 'tts.base',
+    'TTSRateLimitError': 'tts.base',
     # Capabilities
-    'TTSCapabilities',
+    'TTSCapabilities': 'tts.capabilities',
     # Configuration
-    'TTSConfig',
-    'get_config',
-    'reset_config',
+    'TTSConfig': 'tts.config',
+    'get_config': 'tts.config',
+    'reset_config': 'tts.config',
     # Factory
-    'TTSFactory',
-    'create_tts_provider',
+    'TTSFactory': 'tts.factory',
+    'create_tts_provider': 'tts.factory',
     # Features
-    'StreamingCapable',
-    'SSMLCapable',
-    'CustomVoiceCapable',
-    'AudioEffectsCapable',
-    'VolumeControlCapable',
-    'has_feature',
-]
+    'StreamingCapable': 'tts.features',
+    'SSMLCapable': 'tts.features',
+    'CustomVoiceCapable': 'tts.features',
+    'AudioEffectsCapable': 'tts.features',
+    'VolumeControlCapable': 'tts.features',
+    'AsyncCapable': 'tts.features',
+    'collect_stream': 'tts.features',
+    'stream_async': 'tts.features',
+    'has_feature': 'tts.features',
+}
+
+__all__ = list(_LAZY_EXPORTS)
 
 __version__ = '0.1.0'
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'tts' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily exported names alongside the loaded module attributes."""
+    return sorted(set(globals()) | set(__all__))
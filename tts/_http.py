@@ -0,0 +1,132 @@
+"""Shared HTTP helpers for REST-based TTS providers."""
+
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+# Prefer orjson for encoding requests and decoding responses when installed
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    import json as _json
+    from json import loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes (stdlib fallback)."""
+        return _json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# Every content coding urllib3 can decode here (gzip and deflate, plus br
+# and zstd when their optional packages are installed)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def build_session(pool_connections: int = 8, pool_maxsize: int = 32) -> requests.Session:
+    """
+    Create a pooled HTTP session for talking to a TTS API.
+
+    Reusing one session keeps connections alive between requests, so the
+    TCP and TLS handshakes are paid once rather than on every synthesis.
+    Failed connections and transient server errors (500/502/503/504)
+    are retried with backoff, honouring any Retry-After header. Read
+    errors are not retried. 429 is left to the providers, which raise
+    TTSRateLimitError so callers and synthesize_batch() can back off
+    across requests.
+    Responses are requested gzip-compressed, plus Brotli when the brotli
+    package is installed (``--extra speedups``).
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host pool
+
+    Returns:
+        Configured requests session
+    """
+    retries = Retry(
+        total=3,
+        connect=2,
+        # A synthesis POST whose response was lost may already have been
+        # processed and billed per character, so it is never re-sent
+        # after a read error. A failed connection or an error status
+        # means no audio was delivered, so POST is retried in those cases.
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.mount("https://", adapter)
+    return session
+
+
+def post_json(session: requests.Session, url: str, payload: Any, **kwargs) -> requests.Response:
+    """
+    POST a JSON payload serialized with json_dumps().
+
+    Passing pre-encoded bytes as data= skips requests' own pure-Python
+    json.dumps() and encode() of the body. The caller's headers must set
+    Content-Type to application/json.
+
+    Args:
+        session: Session to send the request on
+        url: Request URL
+        payload: JSON-serializable request body
+        **kwargs: Extra arguments for session.post() (headers, stream, ...)
+
+    Returns:
+        HTTP response
+    """
+    return session.post(url, data=json_dumps(payload), **kwargs)
+
+
+def warm_up(session: requests.Session, url: str, timeout: float = 5.0) -> None:
+    """
+    Open a pooled connection to a host ahead of the first real request.
+
+    A HEAD request completes the TCP and TLS handshakes and leaves the
+    connection idle in the session's pool. Any HTTP status will do.
+
+    Args:
+        session: Session whose pool should hold the connection
+        url: Any URL on the API host
+        timeout: Seconds to wait for the connection
+
+    Raises:
+        requests.exceptions.RequestException: If the host cannot be reached
+    """
+    session.head(url, timeout=timeout).close()
+
+
+def warm_up_in_background(session: requests.Session, url: str) -> threading.Thread:
+    """
+    Run warm_up() on a daemon thread, ignoring connection errors.
+
+    A failed warm-up only means the first request pays the handshake.
+
+    Args:
+        session: Session whose pool should hold the connection
+        url: Any URL on the API host
+
+    Returns:
+        The started thread
+    """
+    def run() -> None:
+        try:
+            warm_up(session, url)
+        except requests.exceptions.RequestException:
+            pass
+
+    thread = threading.Thread(target=run, name="tts-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,86 @@
+"""Low-level file helpers for writing synthesized audio."""
+
+import os
+from typing import BinaryIO, Union
+
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def open_for_write(path: Union[str, os.PathLike]) -> int:
+    """
+    Open a file for writing, truncating it, and return the raw descriptor.
+
+    Args:
+        path: File path to open
+
+    Returns:
+        OS-level file descriptor; the caller must os.close() it
+    """
+    return os.open(path, _WRITE_FLAGS, 0o644)
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of data to a file descriptor.
+
+    os.write() may write less than asked, so keep going until the whole
+    buffer has been written. For regular files this is a single syscall.
+
+    Args:
+        fd: File descriptor from open_for_write()
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_bytes_atomic(path: Union[str, os.PathLike], data: bytes) -> None:
+    """
+    Write bytes to a file so readers never see a partial file.
+
+    The data goes to a temporary sibling file with one unbuffered write,
+    which then replaces the target.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = f"{os.fspath(path)}.tmp"
+    fd = open_for_write(tmp_path)
+    try:
+        try:
+            write_all(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_output(target: Union[str, os.PathLike, BinaryIO], data: bytes) -> None:
+    """
+    Write synthesized audio to a path or a binary file object.
+
+    File objects (anything with a write() method, e.g. io.BytesIO) are
+    written to directly; paths go through write_bytes_atomic().
+
+    Args:
+        target: Destination path or writable binary file object
+        data: Bytes to write
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    if hasattr(target, "write"):
+        target.write(data)
+    else:
+        write_bytes_atomic(target, data)
@@ -0,0 +1,46 @@
+"""Text helpers for splitting input into synthesis-sized pieces."""
+
+import re
+from typing import List
+
+# Sentence ends: whitespace following ., ! or ?, or one of those closed by
+# a quote or bracket
+_SENTENCE_END_RE = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\')\]]))\s+')
+
+
+def split_text(text: str, limit: int) -> List[str]:
+    """
+    Split text into pieces of at most limit characters.
+
+    Whole sentences are packed into each piece where possible. A sentence
+    longer than limit is split at spaces, and a single word longer than
+    limit is cut.
+
+    Args:
+        text: Text to split
+        limit: Maximum piece length in characters
+
+    Returns:
+        Non-empty pieces, in order
+    """
+    pieces: List[str] = []
+    current = ''
+    for sentence in _SENTENCE_END_RE.split(text):
+        words = [sentence] if len(sentence) <= limit else sentence.split()
+        for word in words:
+            while len(word) > limit:
+                if current:
+                    pieces.append(current)
+                    current = ''
+                pieces.append(word[:limit])
+                word = word[limit:]
+            if not current:
+                current = word
+            elif len(current) + 1 + len(word) <= limit:
+                current = f'{current} {word}'
+            else:
+                pieces.append(current)
+                current = word
+    if current:
+        pieces.append(current)
+    return pieces
@@ -1,8 +1,25 @@
 """Base TTS provider interface and protocols."""
 
-from typing import Protocol, runtime_checkable
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, runtime_checkable
+from tts._io import write_bytes_atomic
+from tts._text import split_text
 from tts.capabilities import TTSCapabilities
 
+# Default size bound for the on-disk audio cache (100 MB)
+DEFAULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# Recently used cache entries also kept in memory, so hits skip the disk read
+DEFAULT_CACHE_MEMORY_ENTRIES = 64
+
 
 @runtime_checkable
 class TTSProvider(Protocol):
@@ -86,3 +103,397 @@ class TTSAPIError(TTSProviderError):
 class TTSRateLimitError(TTSAPIError):
     """Exception raised when API rate limit is exceeded."""
     pass
+
+
+class CachedTTSMixin:
+    """
+    On-disk cache of synthesized audio for TTS providers.
+
+    Providers call _init_cache() from __init__, then look up _cache_get()
+    before calling their API and store results with _cache_put(). Entries
+    are keyed by a hash of the synthesis inputs and evicted least recently
+    used first once the cache grows past its byte bound. The most recently
+    used entries are also held in memory, so repeated prompts are served
+    without touching the disk.
+
+    The cache is safe to share between the worker threads of the batch,
+    async and chunked synthesis helpers: the index, the memory tier and
+    the counters are only changed under a lock, as are cache file writes
+    and deletions, so the index always matches the files on disk.
+
+    The cache is disabled unless a cache directory is configured.
+    """
+
+    _cache_dir: Optional[Path] = None
+
+    def _init_cache(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        memory_entries: int = DEFAULT_CACHE_MEMORY_ENTRIES
+    ) -> None:
+        """
+        Set up the audio cache.
+
+        Args:
+            cache_dir: Directory for cached audio (None disables caching)
+            max_bytes: Maximum total size of cached audio in bytes
+            memory_entries: Number of recently used entries kept in memory
+        """
+        self._cache_lock = threading.Lock()
+        self._cache_index: "OrderedDict[str, int]" = OrderedDict()
+        self._cache_memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_memory_entries = int(memory_entries)
+        self._cache_size = 0
+        self._cache_max_bytes = int(max_bytes)
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        if not cache_dir:
+            self._cache_dir = None
+            return
+
+        self._cache_dir = Path(cache_dir).expanduser()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Rebuild the LRU index from earlier runs, oldest first
+        entries = sorted(
+            (entry.stat().st_mtime, entry.stem, entry.stat().st_size)
+            for entry in self._cache_dir.glob("*.audio")
+        )
+        with self._cache_lock:
+            for _, key, size in entries:
+                self._cache_index[key] = size
+                self._cache_size += size
+            self._cache_evict()
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether synthesized audio is cached on disk."""
+        return self._cache_dir is not None
+
+    def _cache_key(self, **inputs) -> Optional[str]:
+        """
+        Build the cache key for a synthesis request.
+
+        Args:
+            **inputs: Everything that affects the synthesized audio
+
+        Returns:
+            Hex digest key, or None if caching is disabled
+        """
+        if self._cache_dir is None:
+            return None
+        canonical = json.dumps({"provider": self.name, **inputs}, sort_keys=True)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: Optional[str]) -> Optional[bytes]:
+        """
+        Look up cached audio.
+
+        Args:
+            key: Cache key from _cache_key()
+
+        Returns:
+            Cached audio bytes, or None on a miss
+        """
+        if key is None:
+            return None
+
+        with self._cache_lock:
+            if key not in self._cache_index:
+                self._cache_misses += 1
+                return None
+            data = self._cache_memory.get(key)
+            if data is not None:
+                self._cache_memory.move_to_end(key)
+                self._cache_index.move_to_end(key)
+                self._cache_hits += 1
+                return data
+
+        # Read outside the lock; another thread may evict the entry meanwhile
+        path = self._cache_dir / f"{key}.audio"
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = None
+
+        with self._cache_lock:
+            if data is None:
+                # Entry was removed behind our back; forget it unless another
+                # thread has stored it again since
+                if not path.exists():
+                    self._cache_size -= self._cache_index.pop(key, 0)
+                    self._cache_memory.pop(key, None)
+                self._cache_misses += 1
+                return None
+            if key in self._cache_index:
+                self._cache_index.move_to_end(key)
+                self._cache_remember(key, data)
+            self._cache_hits += 1
+        return data
+
+    def _cache_put(self, key: Optional[str], data: bytes) -> None:
+        """
+        Store audio in the cache.
+
+        Args:
+            key: Cache key from _cache_key()
+            data: Audio bytes to cache
+        """
+        if key is None or len(data) > self._cache_max_bytes:
+            return
+
+        # The write happens under the lock so an eviction cannot delete the
+        # file between it being written and being indexed
+        with self._cache_lock:
+            try:
+                write_bytes_atomic(self._cache_dir / f"{key}.audio", data)
+            except OSError:
+                # Caching is best effort; synthesis already succeeded
+                return
+
+            self._cache_size += len(data) - self._cache_index.pop(key, 0)
+            self._cache_index[key] = len(data)
+            self._cache_remember(key, data)
+            self._cache_evict()
+
+    def _cache_remember(self, key: str, data: bytes) -> None:
+        """
+        Keep audio in the in-memory tier, dropping its oldest entry if full.
+
+        The caller must hold _cache_lock.
+        """
+        self._cache_memory[key] = data
+        self._cache_memory.move_to_end(key)
+        if len(self._cache_memory) > self._cache_memory_entries:
+            self._cache_memory.popitem(last=False)
+
+    def _cache_evict(self) -> None:
+        """
+        Drop least recently used entries until the cache fits its bound.
+
+        The caller must hold _cache_lock.
+        """
+        while self._cache_size > self._cache_max_bytes and self._cache_index:
+            key, size = self._cache_index.popitem(last=False)
+            self._cache_size -= size
+            self._cache_memory.pop(key, None)
+            (self._cache_dir / f"{key}.audio").unlink(missing_ok=True)
+
+    def clear_cache(self) -> None:
+        """Delete all cached audio and reset the hit and miss counters."""
+        with self._cache_lock:
+            for key in self._cache_index:
+                (self._cache_dir / f"{key}.audio").unlink(missing_ok=True)
+            self._cache_index.clear()
+            self._cache_memory.clear()
+            self._cache_size = 0
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Report audio cache usage.
+
+        Returns:
+            Dict with enabled, entries, memory_entries, bytes, max_bytes,
+            hits and misses
+        """
+        with self._cache_lock:
+            return {
+                "enabled": self.cache_enabled,
+                "entries": len(self._cache_index),
+                "memory_entries": len(self._cache_memory),
+                "bytes": self._cache_size,
+                "max_bytes": self._cache_max_bytes,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            }
+
+
+class AsyncSynthesisMixin:
+    """
+    Asyncio entry points built on a provider's blocking synthesize().
+
+    Each request runs in a worker thread, so providers keep a single
+    synchronous code path (and their pooled HTTP session) while callers
+    can overlap many round trips.
+    """
+
+    async def synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        rate: float = 1.0,
+        output_file: str = None
+    ) -> bytes:
+        """
+        Synthesize text to speech audio without blocking the event loop.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice identifier
+            locale: Locale code
+            rate: Speaking rate (1.0 is normal)
+            output_file: Optional path to write audio file
+
+        Returns:
+            Raw audio bytes
+        """
+        return await asyncio.to_thread(
+            self.synthesize, text, voice, locale, rate, output_file
+        )
+
+    async def synthesize_many(
+        self,
+        jobs: Iterable[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[bytes]:
+        """
+        Synthesize several utterances concurrently.
+
+        Args:
+            jobs: Keyword arguments for synthesize(), one dict per utterance
+            max_concurrency: Maximum number of requests in flight
+                (default: BATCH_MAX_WORKERS)
+
+        Returns:
+            Audio bytes for each job, in input order
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(self, 'BATCH_MAX_WORKERS', 8)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(job: Dict[str, Any]) -> bytes:
+            async with semaphore:
+                return await self.synthesize_async(**job)
+
+        return await asyncio.gather(*(run(job) for job in jobs))
+
+
+class _RequestPacer:
+    """Space out calls so they stay under a requests-per-minute limit."""
+
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_start = time.monotonic()
+
+    def wait(self) -> None:
+        """Block until the caller may start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        # Sleep outside the lock so other workers can book their slot
+        if start > now:
+            time.sleep(start - now)
+
+
+class BatchSynthesisMixin:
+    """
+    Thread-pool batch synthesis built on a provider's blocking synthesize().
+
+    Network-bound requests release the GIL while waiting on the socket,
+    so a small pool overlaps many round trips on the provider's shared
+    HTTP session or SDK client. Requests are paced to the provider's
+    max_requests_per_minute capability when it is set, and requests
+    rejected with TTSRateLimitError are retried with exponential backoff.
+    """
+
+    # Default number of requests in flight; providers with a concurrency
+    # cap on their API lower this
+    BATCH_MAX_WORKERS = 8
+
+    # Retries for a rate-limited request, and the first backoff in seconds
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_BACKOFF = 0.5
+
+    # Target piece length for synthesize_chunked(); short pieces come back
+    # quickly, so the first audio is ready sooner
+    CHUNK_MAX_CHARS = 250
+
+    def synthesize_batch(
+        self,
+        items: Iterable[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[bytes]:
+        """
+        Synthesize several utterances on a thread pool.
+
+        Args:
+            items: Keyword arguments for synthesize(), one dict per utterance
+            max_workers: Maximum number of requests in flight
+                (default: BATCH_MAX_WORKERS)
+
+        Returns:
+            Audio bytes for each item, in input order
+
+        Raises:
+            TTSProviderError: If any synthesis fails
+        """
+        limit = self.get_capabilities().max_requests_per_minute
+        pacer = _RequestPacer(limit) if limit else None
+
+        def run(item: Dict[str, Any]) -> bytes:
+            for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+                if pacer is not None:
+                    pacer.wait()
+                try:
+                    return self.synthesize(**item)
+                except TTSRateLimitError:
+                    if attempt == self.RATE_LIMIT_RETRIES:
+                        raise
+                    # Jitter keeps the workers from retrying in lockstep
+                    time.sleep(self.RATE_LIMIT_BACKOFF * 2 ** attempt + random.random() * self.RATE_LIMIT_BACKOFF)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.BATCH_MAX_WORKERS) as executor:
+            return list(executor.map(run, items))
+
+    def synthesize_chunked(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        rate: float = 1.0,
+        max_chars: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Synthesize long text piece by piece, yielding audio as it is ready.
+
+        The text is split at sentence boundaries into pieces of about
+        max_chars characters. All pieces are requested on a thread pool,
+        and each piece's audio is yielded in order as soon as it arrives.
+        Playback of the first piece can then start while later pieces are
+        still being synthesized.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice identifier (provider-specific)
+            locale: Locale code
+            rate: Speaking rate (1.0 is normal)
+            max_chars: Maximum characters per piece (default: CHUNK_MAX_CHARS)
+            max_workers: Maximum number of requests in flight
+                (default: BATCH_MAX_WORKERS)
+
+        Yields:
+            One complete audio clip per piece, in the provider's output format
+
+        Raises:
+            TTSProviderError: If any synthesis fails
+        """
+        pieces = split_text(text, max_chars or self.CHUNK_MAX_CHARS)
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.BATCH_MAX_WORKERS)
+        try:
+            futures = [
+                executor.submit(self.synthesize, piece, voice, locale, rate)
+                for piece in pieces
+            ]
+            for future in futures:
+                yield future.result()
+        finally:
+            # Drop pieces nobody will read if the caller stops early
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -3,20 +3,40 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-
-@dataclass
+# Feature names accepted by TTSCapabilities.has_feature() -> attribute name
+_FEATURE_ATTRS = {
+    "streaming": "supports_streaming",
+    "ssml": "supports_ssml",
+    "custom_voices": "supports_custom_voices",
+    "pitch_control": "supports_pitch_control",
+    "rate_control": "supports_rate_control",
+    "volume_control": "supports_volume_control",
+    "phoneme_input": "supports_phoneme_input",
+    "audio_effects": "supports_audio_effects",
+    "multi_speaker": "supports_multi_speaker",
+    "batch_ssml": "supports_batch_ssml",
+    "offline_mode": "supports_offline_mode",
+    "cache": "cache_enabled",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class TTSCapabilities:
     """
     Describes the capabilities supported by a TTS provider.
 
     This allows runtime feature detection so code can gracefully handle
-    providers with different feature sets.
+    providers with different feature sets. Instances are immutable; use
+    dataclasses.replace() to derive a modified copy.
     """
 
     # Core capabilities
     supports_streaming: bool = False
     """Whether the provider supports streaming audio generation"""
 
+    stream_chunk_size: Optional[int] = None
+    """Default chunk size in bytes for streamed audio. None if not streaming."""
+
     supports_ssml: bool = False
     """Whether the provider supports SSML (Speech Synthesis Markup Language)"""
 
@@ -54,6 +74,9 @@ class TTSCapabilities:
     supports_multi_speaker: bool = False
     """Whether the provider supports multiple speakers in one synthesis"""
 
+    supports_batch_ssml: bool = False
+    """Whether several phrases can be synthesized in one request and split apart"""
+
     # Provider metadata
     requires_api_key: bool = True
     """Whether the provider requires an API key for authentication"""
@@ -61,6 +84,9 @@ class TTSCapabilities:
     supports_offline_mode: bool = False
     """Whether the provider can work without internet connection"""
 
+    cache_enabled: bool = False
+    """Whether synthesized audio is served from an on-disk cache"""
+
     def __repr__(self) -> str:
         """Return a human-readable representation of capabilities."""
         features = []
@@ -86,16 +112,5 @@ class TTSCapabilities:
         Returns:
             True if the feature is supported, False otherwise
         """
-        feature_map = {
-            "streaming": self.supports_streaming,
-            "ssml": self.supports_ssml,
-            "custom_voices": self.supports_custom_voices,
-            "pitch_control": self.supports_pitch_control,
-            "rate_control": self.supports_rate_control,
-            "volume_control": self.supports_volume_control,
-            "phoneme_input": self.supports_phoneme_input,
-            "audio_effects": self.supports_audio_effects,
-            "multi_speaker": self.supports_multi_speaker,
-            "offline_mode": self.supports_offline_mode,
-        }
-        return feature_map.get(feature.lower(), False)
+        attr = _FEATURE_ATTRS.get(feature.lower())
+        return bool(getattr(self, attr)) if attr else False
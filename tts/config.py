@@ -7,11 +7,43 @@ Implements hybrid configuration with precedence:
 4. Defaults (lowest priority)
 """
 
+import copy
+import logging
 import os
+import sys
 import yaml
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Prefer the LibYAML C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Marks a key that is absent from the configuration
+_MISSING = object()
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML config file.
+
+    Results are cached per (path, mtime_ns), so repeated TTSConfig instances
+    reuse the parsed file until it is modified on disk.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: Modification time of the file (part of the cache key)
+
+    Returns:
+        Parsed YAML document
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class TTSConfig:
     """
@@ -24,6 +56,8 @@ class TTSConfig:
     4. Built-in defaults
     """
 
+    __slots__ = ("config_file", "overrides", "_config", "_provider_views", "_get_cache")
+
     # Default configuration values
     DEFAULTS = {
         "provider": "google",
@@ -57,6 +91,10 @@ class TTSConfig:
             "va_locale": "en-US",
             "caller_locale": "en-US",
         },
+        "cache": {
+            "dir": None,  # Audio cache disabled unless set
+            "max_bytes": 100 * 1024 * 1024,
+        },
     }
 
     # Environment variable mappings
@@ -80,8 +118,22 @@ class TTSConfig:
         "aws.region": "AWS_REGION",
         "aws.va_voice": "AWS_VA_VOICE",
         "aws.caller_voice": "AWS_CALLER_VOICE",
+        "cache.dir": "TTS_CACHE_DIR",
+        "cache.max_bytes": "TTS_CACHE_MAX_BYTES",
     }
 
+    # Setting names whose env values are interned (identifiers, not secrets)
+    _INTERNED_KEYS = frozenset({
+        "provider", "region", "model",
+        "va_voice", "va_locale", "caller_voice", "caller_locale",
+    })
+
+    # ENV_VAR_MAP with the dotted keys pre-split, for _load_env_config()
+    _ENV_VAR_ENTRIES = tuple(
+        (tuple(config_key.split(".")), env_var)
+        for config_key, env_var in ENV_VAR_MAP.items()
+    )
+
     def __init__(
         self,
         config_file: Optional[str] = None,
@@ -97,6 +149,8 @@ class TTSConfig:
         self.config_file = config_file
         self.overrides = overrides
         self._config = None
+        self._provider_views: Dict[str, Mapping[str, Any]] = {}
+        self._get_cache: Dict[str, Any] = {}
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -109,34 +163,63 @@ class TTSConfig:
         Returns:
             Configuration value with precedence applied
         """
-        if self._config is None:
-            self._config = self._build_config()
-
-        # Navigate nested keys
-        keys = key.split(".")
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        value = self._get_cache.get(key, _MISSING)
+        if value is _MISSING:
+            if self._config is None:
+                self._config = self._build_config()
+
+            # Navigate nested keys
+            value = self._config
+            for k in key.split("."):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = None
+                    break
+
+            # Remember the lookup; absent keys are cached as None
+            self._get_cache[key] = value
 
         return value if value is not None else default
 
-    def get_provider_config(self, provider: str) -> Dict[str, Any]:
+    def get_provider_config(self, provider: str) -> Mapping[str, Any]:
         """
         Get all configuration for a specific provider.
 
+        The result is a read-only view that is built once per provider and
+        reused; copy it with dict() before modifying.
+
         Args:
             provider: Provider name (e.g., 'google', 'azure')
 
         Returns:
-            Dictionary of provider configuration
+            Read-only mapping of provider configuration
         """
-        if self._config is None:
-            self._config = self._build_config()
+        view = self._provider_views.get(provider)
+        if view is None:
+            if self._config is None:
+                self._config = self._build_config()
+            view = MappingProxyType(self._config.get(provider, {}))
+            self._provider_views[provider] = view
+        return view
+
+    def materialize_provider(
+        self,
+        provider: str,
+        extra: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the constructor arguments for a provider in one pass.
+
+        Args:
+            provider: Provider name (e.g., 'google', 'azure')
+            extra: Provider-specific arguments that take precedence
 
-        return self._config.get(provider, {})
+        Returns:
+            New dictionary of the provider's configuration overlaid with extra
+        """
+        view = self.get_provider_config(provider)
+        return {**view, **extra} if extra else dict(view)
 
     def _build_config(self) -> Dict[str, Any]:
         """
@@ -145,20 +228,24 @@ class TTSConfig:
         Returns:
             Merged configuration dictionary
         """
-        # Start with defaults
-        config = self._deep_copy(self.DEFAULTS)
+        # Copy the defaults once, then merge each source into that copy.
+        # DEFAULTS sections are flat dicts of scalars, so copying each
+        # section copies the whole template without a recursive walk.
+        config = {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in self.DEFAULTS.items()
+        }
 
         # Merge config file
         if self.config_file:
-            file_config = self._load_config_file(self.config_file)
-            config = self._deep_merge(config, file_config)
+            self._merge_into(config, self._load_config_file(self.config_file))
 
-        # Merge environment variables
-        env_config = self._load_env_config()
-        config = self._deep_merge(config, env_config)
+        # Merge environment variables (written straight into the config)
+        self._apply_env(config)
 
         # Merge constructor overrides (highest priority)
-        config = self._deep_merge(config, self.overrides)
+        if self.overrides:
+            self._merge_into(config, self.overrides)
 
         return config
 
@@ -173,15 +260,19 @@ class TTSConfig:
             Configuration dictionary from file
         """
         path = Path(config_file)
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
             return {}
 
         try:
-            with open(path, 'r') as f:
-                config = yaml.safe_load(f)
-                return config if config else {}
+            # Key on the absolute path so a relative name is not confused
+            # across working directories
+            config = _parse_yaml(str(path.resolve()), mtime_ns)
+            # Copy so callers never mutate the cached document
+            return self._deep_copy(config) if config else {}
         except Exception as e:
-            print(f"Warning: Failed to load config file {config_file}: {e}")
+            logger.warning("Failed to load config file %s: %s", config_file, e)
             return {}
 
     def _load_env_config(self) -> Dict[str, Any]:
@@ -192,21 +283,38 @@ class TTSConfig:
             Configuration dictionary from environment
         """
         config = {}
+        self._apply_env(config)
+        return config
+
+    def _apply_env(self, config: Dict[str, Any]) -> None:
+        """
+        Write environment variable values into a configuration dict in place.
+
+        Equivalent to merging _load_env_config() into config, without
+        building and walking the intermediate dictionary.
 
-        for config_key, env_var in self.ENV_VAR_MAP.items():
-            value = os.environ.get(env_var)
+        Args:
+            config: Configuration dictionary to update (must not be shared)
+        """
+        # Bind the lookup once; os.environ.get is a Python-level Mapping
+        # method that re-encodes the key on every call
+        getenv = os.environ.get
+        for keys, env_var in self._ENV_VAR_ENTRIES:
+            value = getenv(env_var)
             if value is not None:
                 # Handle nested keys (e.g., 'google.api_key')
-                keys = config_key.split(".")
                 current = config
-                for i, key in enumerate(keys[:-1]):
-                    if key not in current:
-                        current[key] = {}
-                    current = current[key]
+                for key in keys[:-1]:
+                    section = current.get(key)
+                    if not isinstance(section, dict):
+                        section = current[key] = {}
+                    current = section
+                # Each read decodes a new string; interning lets voice and
+                # locale names from every build share one object
+                if keys[-1] in self._INTERNED_KEYS:
+                    value = sys.intern(value)
                 current[keys[-1]] = value
 
-        return config
-
     def _deep_copy(self, d: Dict) -> Dict:
         """Create a deep copy of a dictionary."""
         result = {}
@@ -214,7 +322,8 @@ class TTSConfig:
             if isinstance(value, dict):
                 result[key] = self._deep_copy(value)
             else:
-                result[key] = value
+                # Lists in a parsed file must not stay shared with the cache
+                result[key] = copy.deepcopy(value)
         return result
 
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
@@ -229,15 +338,30 @@ class TTSConfig:
             Merged dictionary
         """
         result = self._deep_copy(base)
+        self._merge_into(result, override)
+        return result
 
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                if value is not None:  # Only override if not None
-                    result[key] = value
+    @staticmethod
+    def _merge_into(target: Dict, override: Dict) -> None:
+        """
+        Deep merge override into target in place.
 
-        return result
+        Nested dicts are walked with an explicit stack rather than by
+        recursion. None values in override never replace existing values.
+
+        Args:
+            target: Dictionary to update (must not be shared)
+            override: Dictionary whose values take precedence
+        """
+        stack = [(target, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                elif value is not None:  # Only override if not None
+                    dst[key] = value
 
     def to_dict(self) -> Dict[str, Any]:
         """
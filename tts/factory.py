@@ -4,11 +4,83 @@ The factory pattern allows runtime selection of TTS providers based on
 configuration, with support for multiple configuration sources.
 """
 
+import importlib
+import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from tts.base import TTSProvider, TTSConfigurationError
 from tts.config import TTSConfig, get_config
 
 
+# Keyword arguments consumed by the factory rather than the provider
+_FACTORY_KEYS = frozenset({'provider', 'config_file'})
+
+
+@lru_cache(maxsize=32)
+def _shared_provider(
+    provider: Optional[str],
+    config_file: Optional[str],
+    kwargs_items: tuple,
+    fingerprint: tuple
+) -> TTSProvider:
+    """
+    Create a provider once per distinct set of arguments.
+
+    Args:
+        provider: Provider name
+        config_file: Path to configuration file
+        kwargs_items: Sorted (key, value) pairs of extra arguments
+        fingerprint: Environment and config file state (part of the cache key)
+
+    Returns:
+        Provider instance shared by every call with the same key
+    """
+    return TTSFactory.create_provider(provider, config_file, **dict(kwargs_items))
+
+
+@lru_cache(maxsize=16)
+def _shared_config(config_file: Optional[str], kwargs_items: tuple, fingerprint: tuple) -> TTSConfig:
+    """
+    Build a TTSConfig once per distinct set of arguments.
+
+    Args:
+        config_file: Path to configuration file
+        kwargs_items: Sorted (key, value) pairs of configuration overrides
+        fingerprint: Environment and config file state (part of the cache key)
+
+    Returns:
+        Configuration shared by every call with the same key
+    """
+    return TTSConfig(config_file=config_file, **dict(kwargs_items))
+
+
+def _load_config(config_file: Optional[str], kwargs: Dict[str, Any]) -> TTSConfig:
+    """
+    Get the configuration for a create_provider() call.
+
+    Configurations are only read after construction, so one instance is
+    shared while the arguments, environment and config file are unchanged.
+    Arguments that are not hashable get a fresh instance.
+    """
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_items)
+    except TypeError:
+        return TTSConfig(config_file=config_file, **kwargs)
+    return _shared_config(config_file, kwargs_items, _config_fingerprint(config_file))
+
+
+def _config_fingerprint(config_file: Optional[str]) -> tuple:
+    """Snapshot the environment and config file state that configure providers."""
+    getenv = os.environ.get
+    env = tuple([getenv(var) for var in TTSConfig.ENV_VAR_MAP.values()])
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns if config_file else None
+    except OSError:
+        mtime_ns = None
+    return env, mtime_ns
+
+
 class TTSFactory:
     """
     Factory for creating TTS provider instances.
@@ -20,9 +92,21 @@ class TTSFactory:
     4. Built-in defaults
     """
 
-    # Registry of available providers
+    # Built-in providers as "module:class" paths, imported on first use so
+    # an unused provider never loads its SDK
+    _provider_paths: Dict[str, str] = {
+        'google': 'tts.providers.google_tts:GoogleTTSProvider',
+        'azure': 'tts.providers.azure_tts:AzureTTSProvider',
+        'elevenlabs': 'tts.providers.elevenlabs_tts:ElevenLabsTTSProvider',
+        'aws': 'tts.providers.aws_polly:AWSPollyTTSProvider',
+    }
+
+    # Registry of loaded and user-registered provider classes
     _providers: Dict[str, type] = {}
 
+    # Cached provider names, rebuilt after the registry changes
+    _provider_names: Optional[tuple[str, ...]] = None
+
     @classmethod
     def register_provider(cls, name: str, provider_class: type) -> None:
         """
@@ -35,10 +119,12 @@ class TTSFactory:
         Raises:
             ValueError: If provider is already registered
         """
-        if name in cls._providers:
+        if name in cls._providers or name in cls._provider_paths:
             raise ValueError(f"Provider '{name}' is already registered")
 
         cls._providers[name] = provider_class
+        cls._provider_names = None
+        cls.clear_cache()
 
     @classmethod
     def unregister_provider(cls, name: str) -> None:
@@ -48,8 +134,11 @@ class TTSFactory:
         Args:
             name: Provider name to unregister
         """
-        if name in cls._providers:
-            del cls._providers[name]
+        if name in cls._providers or name in cls._provider_paths:
+            cls._providers.pop(name, None)
+            cls._provider_paths.pop(name, None)
+            cls._provider_names = None
+            cls.clear_cache()
 
     @classmethod
     def list_providers(cls) -> list[str]:
@@ -59,7 +148,47 @@ class TTSFactory:
         Returns:
             List of provider names
         """
-        return list(cls._providers.keys())
+        if cls._provider_names is None:
+            # dict.fromkeys keeps registration order and drops duplicates
+            cls._provider_names = tuple(dict.fromkeys([*cls._provider_paths, *cls._providers]))
+        return list(cls._provider_names)
+
+    @classmethod
+    def _get_provider_class(cls, name: str) -> type:
+        """
+        Look up a provider class, importing its module on first use.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Provider class
+
+        Raises:
+            TTSConfigurationError: If the provider is unknown or its module fails to import
+        """
+        provider_class = cls._providers.get(name)
+        if provider_class is not None:
+            return provider_class
+
+        path = cls._provider_paths.get(name)
+        if path is None:
+            available = ', '.join(cls.list_providers())
+            raise TTSConfigurationError(
+                f"TTS provider '{name}' is not registered. "
+                f"Available providers: {available}"
+            )
+
+        module_name, _, class_name = path.partition(':')
+        try:
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise TTSConfigurationError(
+                f"Failed to load TTS provider '{name}': {e}"
+            ) from e
+
+        cls._providers[name] = provider_class
+        return provider_class
 
     @classmethod
     def create_provider(
@@ -106,34 +235,35 @@ class TTSFactory:
                 api_key='override_key'
             )
         """
-        # Build configuration
-        config = TTSConfig(config_file=config_file, **kwargs)
+        # Build configuration (reused while its sources are unchanged)
+        config = _load_config(config_file, kwargs)
 
         # Determine provider name
         if provider is None:
             provider = config.get('provider', 'google')
 
-        # Check if provider is registered
-        if provider not in cls._providers:
-            available = ', '.join(cls.list_providers())
-            raise TTSConfigurationError(
-                f"TTS provider '{provider}' is not registered. "
-                f"Available providers: {available}"
-            )
-
-        # Get provider configuration
-        provider_config = config.get_provider_config(provider)
+        # Resolve the provider class (imports built-in providers on first use)
+        provider_class = cls._get_provider_class(provider)
 
         # Merge any direct kwargs that aren't configuration-related
         # This allows passing provider-specific params directly
-        config_keys = {'provider', 'config_file'}
-        for key, value in kwargs.items():
-            if key not in config_keys and '.' not in key:
-                # This is a provider-specific parameter
-                provider_config[key] = value
+        extra = {
+            key: value for key, value in kwargs.items()
+            if key not in _FACTORY_KEYS and '.' not in key
+        }
+        provider_config = config.materialize_provider(provider, extra)
+
+        # Audio cache settings are shared by every provider
+        cache_dir = config.get('cache.dir')
+        if cache_dir:
+            try:
+                cache_max_bytes = int(config.get('cache.max_bytes'))
+            except (TypeError, ValueError) as e:
+                raise TTSConfigurationError(f"Invalid cache.max_bytes: {e}") from e
+            provider_config.setdefault('cache_dir', cache_dir)
+            provider_config.setdefault('cache_max_bytes', cache_max_bytes)
 
         # Create provider instance
-        provider_class = cls._providers[provider]
         try:
             instance = provider_class(**provider_config)
             return instance
@@ -142,6 +272,48 @@ class TTSFactory:
                 f"Failed to create TTS provider '{provider}': {e}"
             ) from e
 
+    @classmethod
+    def get_provider(
+        cls,
+        provider: Optional[str] = None,
+        config_file: Optional[str] = None,
+        **kwargs
+    ) -> TTSProvider:
+        """
+        Get a shared provider instance, creating it on first use.
+
+        Unlike create_provider(), repeated calls with the same arguments,
+        environment and config file return the same instance, so session
+        setup and authentication are paid once. Because the instance is
+        shared, avoid configure() on it; use create_provider() for a
+        private instance. Arguments that are not hashable bypass the cache.
+
+        Args:
+            provider: Provider name (uses config if not specified)
+            config_file: Path to configuration file
+            **kwargs: Provider-specific configuration overrides
+
+        Returns:
+            Shared TTS provider instance
+
+        Raises:
+            TTSConfigurationError: If provider is not registered or misconfigured
+        """
+        kwargs_items = tuple(sorted(kwargs.items()))
+        try:
+            hash(kwargs_items)
+        except TypeError:
+            # Unhashable argument values cannot be cache keys
+            return cls.create_provider(provider, config_file, **kwargs)
+
+        return _shared_provider(provider, config_file, kwargs_items, _config_fingerprint(config_file))
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all shared instances returned by get_provider() and cached configs."""
+        _shared_provider.cache_clear()
+        _shared_config.cache_clear()
+
     @classmethod
     def create_google_provider(cls, **kwargs) -> TTSProvider:
         """
@@ -220,35 +392,3 @@ def create_tts_provider(
         provider = create_tts_provider('google', api_key='xxx')
     """
     return TTSFactory.create_provider(provider, config_file, **kwargs)
-
-
-# Auto-register built-in providers when module is imported
-def _register_builtin_providers():
-    """Register built-in TTS providers."""
-    try:
-        from tts.providers.google_tts import GoogleTTSProvider
-        TTSFactory.register_provider('google', GoogleTTSProvider)
-    except ImportError:
-        pass
-
-    try:
-        from tts.providers.azure_tts import AzureTTSProvider
-        TTSFactory.register_provider('azure', AzureTTSProvider)
-    except ImportError:
-        pass
-
-    try:
-        from tts.providers.elevenlabs_tts import ElevenLabsTTSProvider
-        TTSFactory.register_provider('elevenlabs', ElevenLabsTTSProvider)
-    except ImportError:
-        pass
-
-    try:
-        from tts.providers.aws_polly import AWSPollyTTSProvider
-        TTSFactory.register_provider('aws', AWSPollyTTSProvider)
-    except ImportError:
-        pass
-
-
-# Register providers on module import
-_register_builtin_providers()
@@ -5,7 +5,9 @@ Code can use isinstance() checks to determine if a provider supports
 advanced features at runtime.
 """
 
-from typing import Protocol, Iterator, runtime_checkable
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -23,7 +25,8 @@ class StreamingCapable(Protocol):
         voice: str,
         locale: str,
         rate: float = 1.0,
-        chunk_size: int = 4096
+        chunk_size: Optional[int] = None,
+        output_file: Optional[str] = None
     ) -> Iterator[bytes]:
         """
         Synthesize text to speech as a stream of audio chunks.
@@ -33,7 +36,8 @@ class StreamingCapable(Protocol):
             voice: Voice identifier (provider-specific)
             locale: Locale code (e.g., 'en-US')
             rate: Speaking rate (1.0 is normal speed)
-            chunk_size: Size of audio chunks in bytes
+            chunk_size: Size of audio chunks in bytes (None for provider default)
+            output_file: Optional path to write the audio as it streams
 
         Yields:
             Audio chunks as bytes (WAV format)
@@ -230,11 +234,93 @@ class VolumeControlCapable(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncCapable(Protocol):
+    """
+    Protocol for providers that can synthesize from asyncio code.
+
+    Lets callers overlap the network round trips of many utterances
+    instead of waiting on each one in turn.
+    """
+
+    async def synthesize_async(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        rate: float = 1.0,
+        output_file: str = None
+    ) -> bytes:
+        """
+        Synthesize text to speech audio without blocking the event loop.
+
+        Args:
+            text: The text to synthesize
+            voice: Voice identifier (provider-specific)
+            locale: Locale code (e.g., 'en-US')
+            rate: Speaking rate (1.0 is normal speed)
+            output_file: Optional path to write audio file
+
+        Returns:
+            Raw audio bytes
+
+        Raises:
+            TTSProviderError: If synthesis fails
+        """
+        ...
+
+    async def synthesize_many(
+        self,
+        jobs: Iterable[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[bytes]:
+        """
+        Synthesize several utterances concurrently.
+
+        Args:
+            jobs: Keyword arguments for synthesize(), one dict per utterance
+            max_concurrency: Maximum number of requests in flight
+                (default: the provider's BATCH_MAX_WORKERS)
+
+        Returns:
+            Audio bytes for each job, in input order
+
+        Raises:
+            TTSProviderError: If any synthesis fails
+        """
+        ...
+
+
+# Methods each feature protocol requires, so support can be checked with
+# plain attribute lookups instead of the typing module's protocol machinery
+_REQUIRED_ATTRS = {
+    StreamingCapable: ("synthesize_stream",),
+    SSMLCapable: ("synthesize_ssml", "validate_ssml"),
+    CustomVoiceCapable: ("synthesize_with_voice_id", "list_custom_voices"),
+    AudioEffectsCapable: ("synthesize_with_effects", "list_effects_profiles"),
+    VolumeControlCapable: ("synthesize_with_volume",),
+    AsyncCapable: ("synthesize_async", "synthesize_many"),
+}
+
+
+@lru_cache(maxsize=None)
+def _class_supports(provider_class: type, feature_protocol) -> bool:
+    """Check (and remember) whether a provider class implements a protocol."""
+    attrs = _REQUIRED_ATTRS.get(feature_protocol)
+    if attrs is None:
+        return issubclass(provider_class, feature_protocol)
+    return all(callable(getattr(provider_class, attr, None)) for attr in attrs)
+
+
 # Helper function for feature detection
 def has_feature(provider, feature_protocol) -> bool:
     """
     Check if a provider implements a specific feature protocol.
 
+    Results are cached per (provider class, protocol), so repeated checks
+    are a dictionary lookup. Call has_feature.cache_clear() after adding
+    methods to a provider class at runtime.
+
     Args:
         provider: TTS provider instance
         feature_protocol: Protocol class to check (e.g., StreamingCapable)
@@ -247,4 +333,73 @@ def has_feature(provider, feature_protocol) -> bool:
             for chunk in provider.synthesize_stream(text, voice, locale):
                 play_audio(chunk)
     """
-    return isinstance(provider, feature_protocol)
+    try:
+        return _class_supports(type(provider), feature_protocol)
+    except TypeError:
+        # Protocols with data members (e.g. TTSProvider.name) only support
+        # isinstance() checks against the instance itself
+        return isinstance(provider, feature_protocol)
+
+
+has_feature.cache_clear = _class_supports.cache_clear
+
+
+def collect_stream(provider: StreamingCapable, text: str, voice: str, locale: str, **kwargs) -> bytes:
+    """
+    Drain a provider's audio stream into a single bytes object.
+
+    Chunks are appended to one growing buffer rather than kept in a list
+    and joined afterwards.
+
+    Args:
+        provider: Provider implementing StreamingCapable
+        text: The text to synthesize
+        voice: Voice identifier (provider-specific)
+        locale: Locale code (e.g., 'en-US')
+        **kwargs: Extra synthesize_stream() arguments (rate, chunk_size, ...)
+
+    Returns:
+        Complete audio as bytes
+
+    Example:
+        audio = collect_stream(provider, "Hello", voice, locale)
+    """
+    buf = bytearray()
+    for chunk in provider.synthesize_stream(text, voice, locale, **kwargs):
+        buf += chunk
+    return bytes(buf)
+
+
+async def stream_async(
+    provider: StreamingCapable, text: str, voice: str, locale: str, **kwargs
+) -> AsyncIterator[bytes]:
+    """
+    Iterate a provider's audio stream from asyncio code.
+
+    Each blocking read of the provider's stream runs on a worker thread,
+    so the event loop keeps serving other tasks while audio arrives.
+
+    Args:
+        provider: Provider implementing StreamingCapable
+        text: The text to synthesize
+        voice: Voice identifier (provider-specific)
+        locale: Locale code (e.g., 'en-US')
+        **kwargs: Extra synthesize_stream() arguments (rate, chunk_size, ...)
+
+    Yields:
+        Audio chunks as bytes
+
+    Example:
+        async for chunk in stream_async(provider, "Hello", voice, locale):
+            play_audio(chunk)
+    """
+    chunks = iter(provider.synthesize_stream(text, voice, locale, **kwargs))
+    try:
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Close the provider's stream if the caller stops early, so it can
+        # release its HTTP response or SDK connection
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
@@ -1,32 +1,34 @@
 """TTS provider implementations.
 
 This package contains concrete implementations of the TTSProvider interface
-for various TTS services.
+for various TTS services. Provider modules are imported on first access, so
+importing one provider does not load the others.
 """
 
-__all__ = []
-
-# Import providers that are available
-try:
-    from tts.providers.google_tts import GoogleTTSProvider
-    __all__.append('GoogleTTSProvider')
-except ImportError:
-    pass
-
-try:
-    from tts.providers.azure_tts import AzureTTSProvider
-    __all__.append('AzureTTSProvider')
-except ImportError:
-    pass
-
-try:
-    from tts.providers.elevenlabs_tts import ElevenLabsTTSProvider
-    __all__.append('ElevenLabsTTSProvider')
-except ImportError:
-    pass
-
-try:
-    from tts.providers.aws_polly import AWSPollyTTSProvider
-    __all__.append('AWSPollyTTSProvider')
-except ImportError:
-    pass
+import importlib
+
+# Provider classes and the modules that define them
+_LAZY_EXPORTS = {
+    'GoogleTTSProvider': 'tts.providers.google_tts',
+    'AzureTTSProvider': 'tts.providers.azure_tts',
+    'ElevenLabsTTSProvider': 'tts.providers.elevenlabs_tts',
+    'AWSPollyTTSProvider': 'tts.providers.aws_polly',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import a provider class from its module on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'tts.providers' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily exported names alongside the loaded module attributes."""
+    return sorted(set(globals()) | set(__all__))
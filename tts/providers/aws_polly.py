@@ -1,19 +1,77 @@
 """AWS Polly Text-to-Speech provider implementation."""
 
-from typing import Optional
-from tts.base import TTSProvider, TTSAPIError, TTSConfigurationError
+import os
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Optional, Union
+from xml.sax.saxutils import escape
+from tts.base import AsyncSynthesisMixin, BatchSynthesisMixin, TTSProvider, TTSAPIError, TTSConfigurationError
+from tts._io import open_for_write, write_all, write_output
+from tts._text import split_text
 from tts.capabilities import TTSCapabilities
 from tts.features import SSMLCapable
 
 try:
     import boto3
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import BotoCoreError, ClientError
     AWS_SDK_AVAILABLE = True
 except ImportError:
     AWS_SDK_AVAILABLE = False
 
 
-class AWSPollyTTSProvider(SSMLCapable):
+# Rates this close to 1.0 (e.g. 1.0000001 from float config values) are
+# sent as plain text; SSML is slower for the service to process
+_RATE_TOLERANCE = 1e-3
+
+
+@lru_cache(maxsize=128)
+def _prosody_wrapper(rate: float) -> tuple[str, str]:
+    """
+    Build the SSML markup placed around text to apply a speaking rate.
+
+    Args:
+        rate: Speaking rate (1.0 is normal)
+
+    Returns:
+        Tuple of (prefix, suffix) SSML strings
+    """
+    # Convert rate to percentage (0.5 -> 50%, 1.0 -> 100%, 2.0 -> 200%)
+    rate_percent = f"{int(rate * 100)}%"
+    return f'<speak><prosody rate="{rate_percent}">', '</prosody></speak>'
+
+
+# Precompiled layouts for the 44-byte WAV header and its size fields
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAV_SIZE = struct.Struct('<I')
+
+
+@lru_cache(maxsize=8)
+def _wav_header_template(sample_rate: int, bits_per_sample: int, channels: int) -> bytes:
+    """
+    Build a 44-byte WAV header with both size fields left as zero.
+
+    Args:
+        sample_rate: Sample rate in Hz
+        bits_per_sample: Bits per sample
+        channels: Number of channels
+
+    Returns:
+        WAV header bytes; the RIFF size (offset 4) and data size (offset 40)
+        must be filled in per file
+    """
+    block_align = channels * bits_per_sample // 8
+    return _WAV_HEADER.pack(
+        b'RIFF', 0, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,  # Chunk size, PCM format
+        sample_rate * block_align, block_align, bits_per_sample,
+        b'data', 0
+    )
+
+
+class AWSPollyTTSProvider(AsyncSynthesisMixin, BatchSynthesisMixin, SSMLCapable):
     """
     AWS Polly Text-to-Speech provider.
 
@@ -27,6 +85,35 @@ class AWSPollyTTSProvider(SSMLCapable):
     Requires: boto3 package (AWS SDK for Python)
     """
 
+    # <speak> root element, opened before it is closed
+    _SSML_RE = re.compile(r'<speak[\s>].*</speak>', re.DOTALL)
+
+    # Polly output formats; mp3 and ogg_vorbis are a fraction of PCM's size
+    OUTPUT_FORMATS = ('pcm', 'mp3', 'ogg_vorbis')
+
+    # Read size when copying an AudioStream to a file
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Longest text Polly accepts in one request, per engine
+    MAX_TEXT_LENGTH = {'neural': 1500, 'standard': 3000}
+
+    # Requests in flight when synthesizing text split over several requests
+    MAX_CHUNK_WORKERS = 8
+
+    # Provider capabilities, shared by every instance
+    CAPABILITIES = TTSCapabilities(
+        supports_streaming=True,
+        supports_ssml=True,
+        supports_custom_voices=False,
+        supported_audio_formats=["pcm", "mp3", "ogg"],
+        max_text_length=3000,  # For standard voices; 1500 for neural
+        max_requests_per_minute=None,  # Based on AWS account limits
+        supports_pitch_control=True,
+        supports_rate_control=True,
+        supports_volume_control=True,
+        requires_api_key=True,
+    )
+
     def __init__(
         self,
         access_key_id: Optional[str] = None,
@@ -37,6 +124,7 @@ class AWSPollyTTSProvider(SSMLCapable):
         va_locale: str = "en-US",
         caller_locale: str = "en-US",
         engine: str = "neural",
+        output_format: str = "pcm",
         **kwargs
     ):
         """
@@ -51,10 +139,12 @@ class AWSPollyTTSProvider(SSMLCapable):
             va_locale: Default locale for virtual assistant
             caller_locale: Default locale for caller
             engine: Voice engine ('neural' or 'standard')
+            output_format: Polly output format: 'pcm' (16-bit, wrapped in a WAV
+                header for .wav paths), or the compressed 'mp3' or 'ogg_vorbis'
             **kwargs: Additional configuration (ignored)
 
         Raises:
-            TTSConfigurationError: If boto3 is not available
+            TTSConfigurationError: If boto3 is not available or output_format is unknown
         """
         if not AWS_SDK_AVAILABLE:
             raise TTSConfigurationError(
@@ -70,33 +160,28 @@ class AWSPollyTTSProvider(SSMLCapable):
         self.va_locale = va_locale
         self.caller_locale = caller_locale
         self.engine = engine
+        self.output_format = self._check_output_format(output_format)
+
+        # Client transport settings, kept for clients recreated by configure().
+        # The pool matches the HTTP providers' so synthesize_batch() workers
+        # never wait for a connection, and keep-alive holds idle TLS
+        # sessions open between requests.
+        self._client_config = BotoConfig(
+            max_pool_connections=32,
+            retries={'max_attempts': 3, 'mode': 'standard'},
+            connect_timeout=3,
+            read_timeout=30,
+            tcp_keepalive=True,
+        )
 
         # Create Polly client
-        session_params = {
-            'region_name': self.region
-        }
-        if access_key_id and secret_access_key:
-            session_params['aws_access_key_id'] = access_key_id
-            session_params['aws_secret_access_key'] = secret_access_key
-
         try:
-            self.polly_client = boto3.client('polly', **session_params)
+            self.polly_client = self._create_client()
         except Exception as e:
             raise TTSConfigurationError(f"Failed to create AWS Polly client: {e}") from e
 
         # Define capabilities
-        self._capabilities = TTSCapabilities(
-            supports_streaming=True,
-            supports_ssml=True,
-            supports_custom_voices=False,
-            supported_audio_formats=["pcm", "mp3", "ogg"],
-            max_text_length=3000,  # For standard voices; 1500 for neural
-            max_requests_per_minute=None,  # Based on AWS account limits
-            supports_pitch_control=True,
-            supports_rate_control=True,
-            supports_volume_control=True,
-            requires_api_key=True,
-        )
+        self._capabilities = self.CAPABILITIES
 
     @property
     def name(self) -> str:
@@ -114,6 +199,14 @@ class AWSPollyTTSProvider(SSMLCapable):
         Args:
             **kwargs: Configuration options
         """
+        # Building a client resolves endpoints and credentials, so only
+        # rebuild when a connection setting actually changes
+        needs_reset = (
+            kwargs.get('access_key_id', self.access_key_id) != self.access_key_id
+            or kwargs.get('secret_access_key', self.secret_access_key) != self.secret_access_key
+            or kwargs.get('region', self.region) != self.region
+        )
+
         if 'access_key_id' in kwargs:
             self.access_key_id = kwargs['access_key_id']
         if 'secret_access_key' in kwargs:
@@ -130,14 +223,28 @@ class AWSPollyTTSProvider(SSMLCapable):
             self.caller_locale = kwargs['caller_locale']
         if 'engine' in kwargs:
             self.engine = kwargs['engine']
+        if 'output_format' in kwargs:
+            self.output_format = self._check_output_format(kwargs['output_format'])
 
         # Recreate client if credentials changed
-        if any(k in kwargs for k in ['access_key_id', 'secret_access_key', 'region']):
-            session_params = {'region_name': self.region}
-            if self.access_key_id and self.secret_access_key:
-                session_params['aws_access_key_id'] = self.access_key_id
-                session_params['aws_secret_access_key'] = self.secret_access_key
-            self.polly_client = boto3.client('polly', **session_params)
+        if needs_reset:
+            self.polly_client = self._create_client()
+
+    def _create_client(self):
+        """
+        Create a Polly client from the current credentials and region.
+
+        Returns:
+            boto3 Polly client
+        """
+        session_params = {
+            'region_name': self.region,
+            'config': self._client_config,
+        }
+        if self.access_key_id and self.secret_access_key:
+            session_params['aws_access_key_id'] = self.access_key_id
+            session_params['aws_secret_access_key'] = self.secret_access_key
+        return boto3.client('polly', **session_params)
 
     def synthesize(
         self,
@@ -145,43 +252,95 @@ class AWSPollyTTSProvider(SSMLCapable):
         voice: str,
         locale: str,
         rate: float = 1.0,
-        output_file: str = None
+        output_file: Union[str, BinaryIO] = None
     ) -> bytes:
         """
         Synthesize text to speech audio using AWS Polly.
 
+        Text longer than the engine's limit (MAX_TEXT_LENGTH) is split at
+        sentence boundaries. The pieces are synthesized concurrently and
+        their audio is joined in order.
+
         Args:
             text: Text to synthesize
             voice: Voice ID (e.g., 'Joanna', 'Matthew', 'Amy')
             locale: Locale code (e.g., 'en-US')
-            rate: Speaking rate (1.0 is normal) - applied via SSML if not 1.0
-            output_file: Optional path to write audio file
+            rate: Speaking rate (1.0 is normal) - applied via SSML if not ~1.0
+            output_file: Optional path or binary file object to write audio to
 
         Returns:
-            Raw audio bytes (PCM format)
+            Raw audio bytes (PCM unless output_format is compressed)
 
         Raises:
+            TTSConfigurationError: If a compressed output_format would be
+                written to a .wav path
             TTSAPIError: If synthesis fails
         """
+        self._check_output_path(output_file)
+        limit = self.MAX_TEXT_LENGTH.get(self.engine)
+        if limit and len(text) > limit:
+            return self._synthesize_chunked(text, limit, voice, locale, rate, output_file)
+
         # If rate is not 1.0, use SSML to apply rate
-        if rate != 1.0:
-            # Convert rate to percentage (0.5 -> 50%, 1.0 -> 100%, 2.0 -> 200%)
-            rate_percent = f"{int(rate * 100)}%"
-            ssml = (
-                f'<speak>'
-                f'<prosody rate="{rate_percent}">{text}</prosody>'
-                f'</speak>'
-            )
+        if abs(rate - 1.0) > _RATE_TOLERANCE:
+            prefix, suffix = _prosody_wrapper(rate)
+            ssml = prefix + escape(text) + suffix
             return self.synthesize_ssml(ssml, voice, locale, output_file)
 
         return self._synthesize_text(text, voice, locale, output_file)
 
+    def _synthesize_chunked(
+        self,
+        text: str,
+        limit: int,
+        voice: str,
+        locale: str,
+        rate: float,
+        output_file: Union[str, BinaryIO, None]
+    ) -> bytes:
+        """
+        Synthesize over-long text as several concurrent requests.
+
+        Raw PCM has no framing, MP3 is a sequence of self-contained frames
+        and Ogg allows chained streams, so the pieces' audio is joined as is.
+
+        Args:
+            text: Text to synthesize
+            limit: Maximum characters per request
+            voice: Voice ID
+            locale: Locale code
+            rate: Speaking rate
+            output_file: Optional output path or binary file object
+
+        Returns:
+            Audio bytes for the whole text
+
+        Raises:
+            TTSAPIError: If any request fails
+        """
+        pieces = split_text(text, limit)
+        workers = min(len(pieces), self.MAX_CHUNK_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            audio_bytes = b''.join(executor.map(
+                lambda piece: self.synthesize(piece, voice, locale, rate), pieces
+            ))
+
+        if output_file:
+            if self._wants_wav_header(output_file):
+                audio_bytes = self._add_wav_header(audio_bytes, 16000, 16, 1)
+            try:
+                write_output(output_file, audio_bytes)
+            except OSError as e:
+                raise TTSAPIError(f"Failed to write audio file: {e}") from e
+
+        return audio_bytes
+
     def _synthesize_text(
         self,
         text: str,
         voice: str,
         locale: str,
-        output_file: Optional[str]
+        output_file: Union[str, BinaryIO, None]
     ) -> bytes:
         """
         Internal method to synthesize plain text.
@@ -190,7 +349,7 @@ class AWSPollyTTSProvider(SSMLCapable):
             text: Text to synthesize
             voice: Voice ID
             locale: Locale code
-            output_file: Optional output file path
+            output_file: Optional output path or binary file object
 
         Returns:
             Raw audio bytes
@@ -200,12 +359,7 @@ class AWSPollyTTSProvider(SSMLCapable):
         """
         try:
             response = self.polly_client.synthesize_speech(
-                Text=text,
-                OutputFormat='pcm',
-                VoiceId=voice,
-                Engine=self.engine,
-                LanguageCode=locale,
-                SampleRate='16000'
+                **self._speech_request(text, voice, locale, ssml=False)
             )
 
             # Read audio stream
@@ -214,11 +368,10 @@ class AWSPollyTTSProvider(SSMLCapable):
             # Write to file if requested
             if output_file:
                 # For WAV format, we need to add a header
-                if output_file.endswith('.wav'):
+                if self._wants_wav_header(output_file):
                     audio_bytes = self._add_wav_header(audio_bytes, 16000, 16, 1)
 
-                with open(output_file, 'wb') as f:
-                    f.write(audio_bytes)
+                write_output(output_file, audio_bytes)
 
             return audio_bytes
 
@@ -230,7 +383,7 @@ class AWSPollyTTSProvider(SSMLCapable):
         ssml: str,
         voice: str,
         locale: str,
-        output_file: str = None
+        output_file: Union[str, BinaryIO] = None
     ) -> bytes:
         """
         Synthesize SSML markup to speech audio.
@@ -239,23 +392,20 @@ class AWSPollyTTSProvider(SSMLCapable):
             ssml: SSML markup string
             voice: Voice ID
             locale: Locale code
-            output_file: Optional path to write audio file
+            output_file: Optional path or binary file object to write audio to
 
         Returns:
-            Raw audio bytes (PCM format)
+            Raw audio bytes (PCM unless output_format is compressed)
 
         Raises:
+            TTSConfigurationError: If a compressed output_format would be
+                written to a .wav path
             TTSAPIError: If synthesis fails
         """
+        self._check_output_path(output_file)
         try:
             response = self.polly_client.synthesize_speech(
-                Text=ssml,
-                TextType='ssml',
-                OutputFormat='pcm',
-                VoiceId=voice,
-                Engine=self.engine,
-                LanguageCode=locale,
-                SampleRate='16000'
+                **self._speech_request(ssml, voice, locale, ssml=True)
             )
 
             # Read audio stream
@@ -264,17 +414,149 @@ class AWSPollyTTSProvider(SSMLCapable):
             # Write to file if requested
             if output_file:
                 # For WAV format, we need to add a header
-                if output_file.endswith('.wav'):
+                if self._wants_wav_header(output_file):
                     audio_bytes = self._add_wav_header(audio_bytes, 16000, 16, 1)
 
-                with open(output_file, 'wb') as f:
-                    f.write(audio_bytes)
+                write_output(output_file, audio_bytes)
 
             return audio_bytes
 
         except (BotoCoreError, ClientError) as e:
             raise TTSAPIError(f"AWS Polly SSML synthesis failed: {e}") from e
 
+    def stream_to_file(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        output_file: str,
+        rate: float = 1.0,
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Synthesize straight to a file without holding the audio in memory.
+
+        The AudioStream is copied to the file in chunk_size pieces. For a
+        .wav path a header is written first and its size fields are filled
+        in once the length is known.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID
+            locale: Locale code
+            output_file: Path to write the audio to
+            rate: Speaking rate (1.0 is normal) - applied via SSML if not ~1.0
+            chunk_size: Read size in bytes (default: STREAM_CHUNK_SIZE)
+
+        Returns:
+            Number of audio bytes written (excluding any WAV header)
+
+        Raises:
+            TTSConfigurationError: If a compressed output_format would be
+                written to a .wav path
+            TTSAPIError: If synthesis or writing the file fails
+        """
+        self._check_output_path(output_file)
+        if abs(rate - 1.0) > _RATE_TOLERANCE:
+            prefix, suffix = _prosody_wrapper(rate)
+            request = self._speech_request(prefix + escape(text) + suffix, voice, locale, ssml=True)
+        else:
+            request = self._speech_request(text, voice, locale, ssml=False)
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        wav = self._wants_wav_header(output_file)
+
+        try:
+            stream = self.polly_client.synthesize_speech(**request)['AudioStream']
+            fd = open_for_write(output_file)
+            try:
+                if wav:
+                    write_all(fd, _wav_header_template(16000, 16, 1))
+                datasize = 0
+                while chunk := stream.read(chunk_size):
+                    write_all(fd, chunk)
+                    datasize += len(chunk)
+                if wav:
+                    os.lseek(fd, 4, os.SEEK_SET)
+                    write_all(fd, _WAV_SIZE.pack(datasize + 36))
+                    os.lseek(fd, 40, os.SEEK_SET)
+                    write_all(fd, _WAV_SIZE.pack(datasize))
+            finally:
+                os.close(fd)
+            return datasize
+        except OSError as e:
+            raise TTSAPIError(f"Failed to write audio file: {e}") from e
+        except (BotoCoreError, ClientError) as e:
+            raise TTSAPIError(f"AWS Polly synthesis failed: {e}") from e
+
+    @classmethod
+    def _check_output_format(cls, output_format: str) -> str:
+        """
+        Validate a Polly output format name.
+
+        Raises:
+            TTSConfigurationError: If the format is not supported
+        """
+        if output_format not in cls.OUTPUT_FORMATS:
+            raise TTSConfigurationError(
+                f"Unsupported AWS Polly output format '{output_format}'. "
+                f"Choose one of: {', '.join(cls.OUTPUT_FORMATS)}"
+            )
+        return output_format
+
+    def _check_output_path(self, output_file) -> None:
+        """
+        Reject a .wav path for compressed output.
+
+        Polly's MP3 and Ogg audio would otherwise be saved under a .wav
+        name without being WAV data.
+
+        Raises:
+            TTSConfigurationError: If output_format is compressed and the
+                path ends in .wav
+        """
+        if (
+            self.output_format != 'pcm'
+            and isinstance(output_file, str)
+            and output_file.endswith('.wav')
+        ):
+            raise TTSConfigurationError(
+                f"AWS Polly output format '{self.output_format}' cannot be written "
+                f"to a .wav file: {output_file}. Use output_format='pcm' for WAV output."
+            )
+
+    def _wants_wav_header(self, output_file) -> bool:
+        """Whether raw PCM output is being saved to a .wav path."""
+        return (
+            self.output_format == 'pcm'
+            and isinstance(output_file, str)
+            and output_file.endswith('.wav')
+        )
+
+    def _speech_request(self, content: str, voice: str, locale: str, ssml: bool) -> dict:
+        """
+        Build the synthesize_speech() arguments for 16 kHz output.
+
+        Args:
+            content: Text or SSML to synthesize
+            voice: Voice ID
+            locale: Locale code
+            ssml: Whether content is SSML
+
+        Returns:
+            Keyword arguments for the Polly client
+        """
+        request = {
+            'Text': content,
+            'OutputFormat': self.output_format,
+            'VoiceId': voice,
+            'Engine': self.engine,
+            'LanguageCode': locale,
+            'SampleRate': '16000',
+        }
+        if ssml:
+            request['TextType'] = 'ssml'
+        return request
+
     def validate_ssml(self, ssml: str) -> bool:
         """
         Validate SSML markup.
@@ -286,7 +568,7 @@ class AWSPollyTTSProvider(SSMLCapable):
             True if valid (basic check only)
         """
         # Basic validation: check for <speak> root element
-        return '<speak' in ssml and '</speak>' in ssml
+        return self._SSML_RE.search(ssml) is not None
 
     def _add_wav_header(
         self,
@@ -307,28 +589,10 @@ class AWSPollyTTSProvider(SSMLCapable):
         Returns:
             WAV file bytes with header
         """
-        import struct
-
         datasize = len(pcm_data)
-        header = b''
-
-        # RIFF header
-        header += b'RIFF'
-        header += struct.pack('<I', datasize + 36)
-        header += b'WAVE'
-
-        # fmt chunk
-        header += b'fmt '
-        header += struct.pack('<I', 16)  # Chunk size
-        header += struct.pack('<H', 1)   # Audio format (1 = PCM)
-        header += struct.pack('<H', channels)
-        header += struct.pack('<I', sample_rate)
-        header += struct.pack('<I', sample_rate * channels * bits_per_sample // 8)  # Byte rate
-        header += struct.pack('<H', channels * bits_per_sample // 8)  # Block align
-        header += struct.pack('<H', bits_per_sample)
-
-        # data chunk
-        header += b'data'
-        header += struct.pack('<I', datasize)
-
-        return header + pcm_data
+        header = bytearray(_wav_header_template(sample_rate, bits_per_sample, channels))
+        _WAV_SIZE.pack_into(header, 4, datasize + 36)
+        _WAV_SIZE.pack_into(header, 40, datasize)
+
+        # join() sizes the result once and copies each part into it
+        return b''.join((header, pcm_data))
@@ -1,24 +1,65 @@
 """Azure Cognitive Services Text-to-Speech provider implementation."""
 
-import time
-from typing import Optional
-from tts.base import TTSProvider, TTSAPIError, TTSConfigurationError
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+from tts.base import BatchSynthesisMixin, TTSProvider, TTSAPIError, TTSConfigurationError
+from tts._io import open_for_write, write_all, write_output
 from tts.capabilities import TTSCapabilities
-from tts.features import SSMLCapable
+from tts.features import SSMLCapable, StreamingCapable
 
 try:
     from azure.cognitiveservices.speech import (
+        AudioDataStream,
+        Connection,
+        ResultReason,
         SpeechConfig,
         SpeechSynthesizer,
-        SpeechSynthesisOutputFormat
+        SpeechSynthesisOutputFormat,
+        StreamStatus
     )
-    from azure.cognitiveservices.speech.audio import AudioOutputConfig
     AZURE_SDK_AVAILABLE = True
 except ImportError:
     AZURE_SDK_AVAILABLE = False
 
 
-class AzureTTSProvider(SSMLCapable):
+# Extra entities needed to escape a double-quoted XML attribute value
+_ATTR_ENTITIES = {'"': '&quot;'}
+
+
+# Rates this close to 1.0 (e.g. 1.0000001 from float config values) are
+# sent as plain text; SSML is slower for the service to process
+_RATE_TOLERANCE = 1e-3
+
+
+@lru_cache(maxsize=128)
+def _prosody_wrapper(rate: float, voice: str, locale: str) -> tuple[str, str]:
+    """
+    Build the SSML markup placed around text to apply a speaking rate.
+
+    Args:
+        rate: Speaking rate (1.0 is normal)
+        voice: Voice name
+        locale: Locale code
+
+    Returns:
+        Tuple of (prefix, suffix) SSML strings
+    """
+    # Convert rate to percentage (0.5 -> 50%, 1.0 -> 100%, 2.0 -> 200%)
+    rate_percent = f"{int(rate * 100)}%"
+    locale, voice = escape(locale, _ATTR_ENTITIES), escape(voice, _ATTR_ENTITIES)
+    prefix = (
+        f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{locale}">'
+        f'<voice name="{voice}">'
+        f'<prosody rate="{rate_percent}">'
+    )
+    return prefix, '</prosody></voice></speak>'
+
+
+class AzureTTSProvider(BatchSynthesisMixin, SSMLCapable, StreamingCapable):
     """
     Azure Cognitive Services Text-to-Speech provider.
 
@@ -31,6 +72,26 @@ class AzureTTSProvider(SSMLCapable):
     Requires: azure-cognitiveservices-speech package
     """
 
+    # <speak> root element, opened before it is closed
+    _SSML_RE = re.compile(r'<speak[\s>].*</speak>', re.DOTALL)
+
+    # Streamed chunk size: 100 ms of the default 16 kHz 16-bit mono PCM
+    DEFAULT_STREAM_CHUNK_SIZE = 3200
+
+    # Provider capabilities, shared by every instance
+    CAPABILITIES = TTSCapabilities(
+        supports_streaming=True,
+        supports_ssml=True,
+        supports_custom_voices=False,
+        supported_audio_formats=["wav", "mp3"],
+        max_text_length=None,  # Azure has no documented limit
+        max_requests_per_minute=20,  # Varies by tier
+        supports_pitch_control=True,
+        supports_rate_control=True,
+        supports_volume_control=True,
+        requires_api_key=True,
+    )
+
     def __init__(
         self,
         subscription_key: Optional[str] = None,
@@ -83,19 +144,14 @@ class AzureTTSProvider(SSMLCapable):
         self.speech_config.speech_synthesis_language = self.va_locale
         self.speech_config.speech_synthesis_voice_name = self.va_voice
 
+        # Idle in-memory synthesizers per (voice, locale). Each keeps its
+        # WebSocket open between requests, so reusing one skips the
+        # connection and TLS handshake on every call.
+        self._synthesizers: Dict[Tuple[str, str], List[SpeechSynthesizer]] = {}
+        self._synth_lock = threading.Lock()
+
         # Define capabilities
-        self._capabilities = TTSCapabilities(
-            supports_streaming=False,
-            supports_ssml=True,
-            supports_custom_voices=False,
-            supported_audio_formats=["wav", "mp3"],
-            max_text_length=None,  # Azure has no documented limit
-            max_requests_per_minute=20,  # Varies by tier
-            supports_pitch_control=True,
-            supports_rate_control=True,
-            supports_volume_control=True,
-            requires_api_key=True,
-        )
+        self._capabilities = self.CAPABILITIES
 
     @property
     def name(self) -> str:
@@ -113,12 +169,14 @@ class AzureTTSProvider(SSMLCapable):
         Args:
             **kwargs: Configuration options
         """
+        # Only a real credential or region change needs a new SpeechConfig
+        needs_reset = (
+            kwargs.get('subscription_key', self.subscription_key) != self.subscription_key
+            or kwargs.get('region', self.region) != self.region
+        )
+
         if 'subscription_key' in kwargs:
             self.subscription_key = kwargs['subscription_key']
-            self.speech_config = SpeechConfig(
-                subscription=self.subscription_key,
-                region=self.region
-            )
         if 'region' in kwargs:
             self.region = kwargs['region']
         if 'va_voice' in kwargs:
@@ -132,6 +190,110 @@ class AzureTTSProvider(SSMLCapable):
         if 'caller_locale' in kwargs:
             self.caller_locale = kwargs['caller_locale']
 
+        if needs_reset:
+            self.speech_config = SpeechConfig(
+                subscription=self.subscription_key,
+                region=self.region
+            )
+            self.speech_config.speech_synthesis_language = self.va_locale
+            self.speech_config.speech_synthesis_voice_name = self.va_voice
+            # Pooled synthesizers hold the old credentials
+            with self._synth_lock:
+                self._synthesizers.clear()
+
+    def prewarm(self) -> None:
+        """
+        Open connections for the default voices ahead of the first request.
+
+        Raises:
+            TTSAPIError: If a connection cannot be opened
+        """
+        for key in {(self.va_voice, self.va_locale), (self.caller_voice, self.caller_locale)}:
+            try:
+                synthesizer = self._acquire_synthesizer(key)
+                Connection.from_speech_synthesizer(synthesizer).open(True)
+            except Exception as e:
+                raise TTSAPIError(f"Failed to connect to Azure TTS: {e}") from e
+            self._release_synthesizer(key, synthesizer)
+
+    def _acquire_synthesizer(self, key: Tuple[str, str]) -> "SpeechSynthesizer":
+        """
+        Take an idle in-memory synthesizer for a voice, creating one if needed.
+
+        Args:
+            key: (voice, locale) pair
+
+        Returns:
+            Synthesizer for the caller's exclusive use until released
+        """
+        with self._synth_lock:
+            pool = self._synthesizers.get(key)
+            if pool:
+                return pool.pop()
+
+        voice, locale = key
+        speech_config = SpeechConfig(
+            subscription=self.subscription_key,
+            region=self.region
+        )
+        speech_config.speech_synthesis_language = locale
+        speech_config.speech_synthesis_voice_name = voice
+        return SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+
+    def _release_synthesizer(self, key: Tuple[str, str], synthesizer: "SpeechSynthesizer") -> None:
+        """Return a synthesizer to the idle pool after a successful request."""
+        with self._synth_lock:
+            self._synthesizers.setdefault(key, []).append(synthesizer)
+
+    def _speak(self, content: str, voice: str, locale: str, ssml: bool):
+        """
+        Run one in-memory synthesis on a pooled synthesizer.
+
+        The synthesizer only goes back to the pool when synthesis
+        completes. One that raises or returns a canceled result is
+        dropped, so a possibly broken connection is not reused.
+
+        Args:
+            content: Text or SSML to synthesize
+            voice: Voice name
+            locale: Locale code
+            ssml: Whether content is SSML
+
+        Returns:
+            Azure SDK synthesis result
+        """
+        key = (voice, locale)
+        synthesizer = self._acquire_synthesizer(key)
+        speak = synthesizer.speak_ssml_async if ssml else synthesizer.speak_text_async
+        result = speak(content).get()
+        if result.reason == ResultReason.SynthesizingAudioCompleted:
+            self._release_synthesizer(key, synthesizer)
+        return result
+
+    @staticmethod
+    def _finish(result, output_file: Optional[str], operation: str) -> bytes:
+        """
+        Take the audio from a completed synthesis and optionally save it.
+
+        Args:
+            result: Azure SDK synthesis result
+            output_file: Optional path to write the audio to
+            operation: Description used in error messages
+
+        Returns:
+            Raw audio bytes
+
+        Raises:
+            TTSAPIError: If synthesis did not complete
+        """
+        if result.reason != ResultReason.SynthesizingAudioCompleted or not result.audio_data:
+            raise TTSAPIError(f"{operation} failed: {result.reason}")
+
+        audio = result.audio_data
+        if output_file:
+            write_output(output_file, audio)
+        return audio
+
     def synthesize(
         self,
         text: str,
@@ -147,7 +309,7 @@ class AzureTTSProvider(SSMLCapable):
             text: Text to synthesize
             voice: Voice name (e.g., 'en-US-JennyNeural')
             locale: Locale code (e.g., 'en-US')
-            rate: Speaking rate (1.0 is normal) - applied via SSML if not 1.0
+            rate: Speaking rate (1.0 is normal) - applied via SSML if not ~1.0
             output_file: Optional path to write WAV file
 
         Returns:
@@ -157,16 +319,9 @@ class AzureTTSProvider(SSMLCapable):
             TTSAPIError: If synthesis fails
         """
         # If rate is not 1.0, use SSML to apply rate
-        if rate != 1.0:
-            # Convert rate to percentage (0.5 -> 50%, 1.0 -> 100%, 2.0 -> 200%)
-            rate_percent = f"{int(rate * 100)}%"
-            ssml = (
-                f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{locale}">'
-                f'<voice name="{voice}">'
-                f'<prosody rate="{rate_percent}">{text}</prosody>'
-                f'</voice>'
-                f'</speak>'
-            )
+        if abs(rate - 1.0) > _RATE_TOLERANCE:
+            prefix, suffix = _prosody_wrapper(rate, voice, locale)
+            ssml = prefix + escape(text) + suffix
             return self.synthesize_ssml(ssml, voice, locale, output_file)
 
         return self._synthesize_text(text, voice, locale, output_file)
@@ -194,42 +349,11 @@ class AzureTTSProvider(SSMLCapable):
             TTSAPIError: If synthesis fails
         """
         try:
-            # Create a new config for this specific synthesis
-            speech_config = SpeechConfig(
-                subscription=self.subscription_key,
-                region=self.region
-            )
-            speech_config.speech_synthesis_language = locale
-            speech_config.speech_synthesis_voice_name = voice
-
-            if output_file:
-                # Synthesize to file
-                audio_config = AudioOutputConfig(filename=output_file)
-                synthesizer = SpeechSynthesizer(
-                    speech_config=speech_config,
-                    audio_config=audio_config
-                )
-                result = synthesizer.speak_text_async(text).get()
-
-                # Wait for file to be written
-                time.sleep(1)
-
-                # Read file and return bytes
-                with open(output_file, 'rb') as f:
-                    return f.read()
-            else:
-                # Synthesize to memory
-                synthesizer = SpeechSynthesizer(
-                    speech_config=speech_config,
-                    audio_config=None
-                )
-                result = synthesizer.speak_text_async(text).get()
-
-                if result.audio_data:
-                    return result.audio_data
-                else:
-                    raise TTSAPIError(f"Azure TTS synthesis failed: {result.reason}")
-
+            # Synthesize to memory on a reused connection
+            result = self._speak(text, voice, locale, ssml=False)
+            return self._finish(result, output_file, "Azure TTS synthesis")
+        except TTSAPIError:
+            raise
         except Exception as e:
             raise TTSAPIError(f"Azure TTS synthesis failed: {e}") from e
 
@@ -256,44 +380,81 @@ class AzureTTSProvider(SSMLCapable):
             TTSAPIError: If synthesis fails
         """
         try:
-            # Create a new config for this specific synthesis
-            speech_config = SpeechConfig(
-                subscription=self.subscription_key,
-                region=self.region
-            )
-            speech_config.speech_synthesis_language = locale
-            speech_config.speech_synthesis_voice_name = voice
+            # Synthesize to memory on a reused connection
+            result = self._speak(ssml, voice, locale, ssml=True)
+            return self._finish(result, output_file, "Azure TTS SSML synthesis")
+        except TTSAPIError:
+            raise
+        except Exception as e:
+            raise TTSAPIError(f"Azure TTS SSML synthesis failed: {e}") from e
 
-            if output_file:
-                # Synthesize to file
-                audio_config = AudioOutputConfig(filename=output_file)
-                synthesizer = SpeechSynthesizer(
-                    speech_config=speech_config,
-                    audio_config=audio_config
-                )
-                result = synthesizer.speak_ssml_async(ssml).get()
-
-                # Wait for file to be written
-                time.sleep(1)
-
-                # Read file and return bytes
-                with open(output_file, 'rb') as f:
-                    return f.read()
+    def synthesize_stream(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        rate: float = 1.0,
+        chunk_size: Optional[int] = None,
+        output_file: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Synthesize text to speech as a stream of audio chunks.
+
+        Uses start_speaking_*_async(), which returns as soon as synthesis
+        starts, so the first chunk arrives long before the utterance is
+        complete.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice name
+            locale: Locale code
+            rate: Speaking rate (1.0 is normal) - applied via SSML if not ~1.0
+            chunk_size: Size of audio chunks in bytes (default: 3200)
+            output_file: Optional path; chunks are written to it as they arrive
+
+        Yields:
+            Audio chunks as bytes (WAV format)
+
+        Raises:
+            TTSAPIError: If synthesis fails
+        """
+        key = (voice, locale)
+        try:
+            synthesizer = self._acquire_synthesizer(key)
+            if abs(rate - 1.0) > _RATE_TOLERANCE:
+                prefix, suffix = _prosody_wrapper(rate, voice, locale)
+                result = synthesizer.start_speaking_ssml_async(prefix + escape(text) + suffix).get()
             else:
-                # Synthesize to memory
-                synthesizer = SpeechSynthesizer(
-                    speech_config=speech_config,
-                    audio_config=None
-                )
-                result = synthesizer.speak_ssml_async(ssml).get()
-
-                if result.audio_data:
-                    return result.audio_data
-                else:
-                    raise TTSAPIError(f"Azure TTS SSML synthesis failed: {result.reason}")
+                result = synthesizer.start_speaking_text_async(text).get()
+            stream = AudioDataStream(result)
+        except Exception as e:
+            raise TTSAPIError(f"Azure TTS streaming failed: {e}") from e
 
+        # The SDK fills this buffer in place on every read
+        buffer = bytes(chunk_size or self.DEFAULT_STREAM_CHUNK_SIZE)
+        fd = None
+        try:
+            if output_file:
+                fd = open_for_write(output_file)
+            while filled := stream.read_data(buffer):
+                chunk = buffer[:filled]
+                if fd is not None:
+                    write_all(fd, chunk)
+                yield chunk
+            if stream.status != StreamStatus.AllData:
+                raise TTSAPIError(f"Azure TTS streaming failed: {stream.status}")
+        except TTSAPIError:
+            raise
+        except OSError as e:
+            raise TTSAPIError(f"Failed to write audio file: {e}") from e
         except Exception as e:
-            raise TTSAPIError(f"Azure TTS SSML synthesis failed: {e}") from e
+            raise TTSAPIError(f"Azure TTS streaming failed: {e}") from e
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+        # Only a fully drained synthesizer is safe to reuse
+        self._release_synthesizer(key, synthesizer)
 
     def validate_ssml(self, ssml: str) -> bool:
         """
@@ -306,4 +467,4 @@ class AzureTTSProvider(SSMLCapable):
             True if valid (basic check only)
         """
         # Basic validation: check for <speak> root element
-        return '<speak' in ssml and '</speak>' in ssml
+        return self._SSML_RE.search(ssml) is not None
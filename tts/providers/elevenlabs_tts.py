@@ -1,13 +1,43 @@
 """ElevenLabs Text-to-Speech provider implementation."""
 
+import io
+import os
+import queue
+import threading
 import requests
-from typing import Optional, Iterator
-from tts.base import TTSProvider, TTSAPIError, TTSConfigurationError, TTSRateLimitError
+import urllib3
+from collections import OrderedDict
+from dataclasses import replace
+from typing import BinaryIO, Iterator, Optional, Union
+from tts.base import (
+    DEFAULT_CACHE_MAX_BYTES,
+    AsyncSynthesisMixin,
+    BatchSynthesisMixin,
+    CachedTTSMixin,
+    TTSProvider,
+    TTSAPIError,
+    TTSConfigurationError,
+    TTSRateLimitError,
+)
+from tts._http import build_session, json_loads, post_json, warm_up, warm_up_in_background
+from tts._io import open_for_write, write_all, write_output
 from tts.capabilities import TTSCapabilities
 from tts.features import CustomVoiceCapable, StreamingCapable
 
+# Optional incremental JSON parser for large voice catalogs
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
+
+class ElevenLabsTTSProvider(
+    CachedTTSMixin,
+    AsyncSynthesisMixin,
+    BatchSynthesisMixin,
+    CustomVoiceCapable,
+    StreamingCapable,
+):
     """
     ElevenLabs Text-to-Speech provider.
 
@@ -23,6 +53,38 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
 
     # API endpoints
     BASE_URL = "https://api.elevenlabs.io/v1"
+    SYNTH_URL_TEMPLATE = BASE_URL + "/text-to-speech/{voice_id}"
+    STREAM_URL_TEMPLATE = BASE_URL + "/text-to-speech/{voice_id}/stream"
+
+    # Voice settings sent when the caller does not override them
+    DEFAULT_VOICE_SETTINGS = {
+        "stability": 0.5,
+        "similarity_boost": 0.75,
+    }
+
+    # Most voice IDs remembered as rejected by the API
+    MAX_INVALID_VOICES = 1024
+
+    # Default read size for streamed audio (64 KiB)
+    DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Free-tier accounts may only have two requests in flight at once
+    BATCH_MAX_WORKERS = 2
+
+    # Capabilities for an instance with default settings
+    CAPABILITIES = TTSCapabilities(
+        supports_streaming=True,
+        supports_ssml=False,  # ElevenLabs doesn't support SSML
+        supports_custom_voices=True,
+        supported_audio_formats=["mp3", "wav"],
+        max_text_length=5000,
+        max_requests_per_minute=None,  # Varies by tier
+        supports_pitch_control=False,
+        supports_rate_control=False,
+        supports_volume_control=False,
+        requires_api_key=True,
+        stream_chunk_size=DEFAULT_STREAM_CHUNK_SIZE,
+    )
 
     def __init__(
         self,
@@ -30,6 +92,10 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         va_voice: Optional[str] = None,
         caller_voice: Optional[str] = None,
         model: str = "eleven_monolingual_v1",
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        stream_chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        warmup: bool = False,
         **kwargs
     ):
         """
@@ -42,6 +108,10 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
             model: Model ID to use (default: 'eleven_monolingual_v1')
                    Options: 'eleven_monolingual_v1', 'eleven_multilingual_v1',
                            'eleven_multilingual_v2'
+            cache_dir: Directory for cached audio (None disables caching)
+            cache_max_bytes: Maximum total size of cached audio in bytes
+            stream_chunk_size: Read size for synthesize_stream() in bytes
+            warmup: Open a connection to the API on a background thread
             **kwargs: Additional configuration (ignored)
 
         Raises:
@@ -69,6 +139,10 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         self.va_voice = va_voice
         self.caller_voice = caller_voice
         self.model = model
+        self.stream_chunk_size = stream_chunk_size
+        self._init_cache(cache_dir, cache_max_bytes)
+        self._session = build_session()
+        self._invalid_voices: OrderedDict[str, None] = OrderedDict()
 
         # Headers for API requests
         self.headers = {
@@ -76,20 +150,21 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
             "Content-Type": "application/json",
             "xi-api-key": self.api_key
         }
+        # MP3 is already compressed; ask for it unencoded so neither side
+        # spends time on gzip
+        self._audio_headers = {**self.headers, "Accept-Encoding": "identity"}
+
+        # Capabilities are shared; copy only when settings change them
+        self._capabilities = self.CAPABILITIES
+        if self.cache_enabled or stream_chunk_size != self.DEFAULT_STREAM_CHUNK_SIZE:
+            self._capabilities = replace(
+                self.CAPABILITIES,
+                cache_enabled=self.cache_enabled,
+                stream_chunk_size=stream_chunk_size,
+            )
 
-        # Define capabilities
-        self._capabilities = TTSCapabilities(
-            supports_streaming=True,
-            supports_ssml=False,  # ElevenLabs doesn't support SSML
-            supports_custom_voices=True,
-            supported_audio_formats=["mp3", "wav"],
-            max_text_length=5000,
-            max_requests_per_minute=None,  # Varies by tier
-            supports_pitch_control=False,
-            supports_rate_control=False,
-            supports_volume_control=False,
-            requires_api_key=True,
-        )
+        if warmup:
+            warm_up_in_background(self._session, self.BASE_URL)
 
     @property
     def name(self) -> str:
@@ -100,6 +175,36 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         """Get provider capabilities."""
         return self._capabilities
 
+    def prewarm(self) -> None:
+        """
+        Open a connection to the API ahead of the first request.
+
+        Raises:
+            TTSAPIError: If the API host cannot be reached
+        """
+        try:
+            warm_up(self._session, self.BASE_URL)
+        except requests.exceptions.RequestException as e:
+            raise TTSAPIError(f"Failed to connect to ElevenLabs: {e}") from e
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        """Use the provider as a context manager that closes its session."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Release pooled HTTP connections on leaving the with block."""
+        self.close()
+
+    def __del__(self):
+        """Release pooled HTTP connections when the provider is discarded."""
+        self.close()
+
     def configure(self, **kwargs) -> None:
         """
         Configure the provider with additional settings.
@@ -110,6 +215,7 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         if 'api_key' in kwargs:
             self.api_key = kwargs['api_key']
             self.headers["xi-api-key"] = self.api_key
+            self._audio_headers["xi-api-key"] = self.api_key
         if 'va_voice' in kwargs:
             self.va_voice = kwargs['va_voice']
         if 'caller_voice' in kwargs:
@@ -123,7 +229,7 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         voice: str,
         locale: str,
         rate: float = 1.0,
-        output_file: str = None
+        output_file: Union[str, BinaryIO] = None
     ) -> bytes:
         """
         Synthesize text to speech audio using ElevenLabs TTS.
@@ -133,7 +239,8 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
             voice: Voice ID (not voice name - use custom voice ID)
             locale: Locale code (ignored - ElevenLabs auto-detects language)
             rate: Speaking rate (ignored - not supported by ElevenLabs)
-            output_file: Optional path to write audio file
+            output_file: Optional path or binary file object to write audio to;
+                paths ending in .wav get the audio transcoded to WAV
 
         Returns:
             Raw audio bytes (MP3 format)
@@ -153,7 +260,7 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         voice_id: str,
         locale: str = None,
         rate: float = 1.0,
-        output_file: str = None,
+        output_file: Union[str, BinaryIO] = None,
         **voice_settings
     ) -> bytes:
         """
@@ -164,70 +271,105 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
             voice_id: ElevenLabs voice ID
             locale: Locale code (ignored)
             rate: Speaking rate (ignored)
-            output_file: Optional path to write audio file
+            output_file: Optional path or binary file object to write audio to;
+                paths ending in .wav get the audio transcoded to WAV
             **voice_settings: Voice settings (stability, similarity_boost, style, use_speaker_boost)
 
         Returns:
             Raw audio bytes (MP3 format)
 
         Raises:
+            TTSConfigurationError: If the voice ID is not found
             TTSAPIError: If synthesis fails
         """
-        url = f"{self.BASE_URL}/text-to-speech/{voice_id}"
+        url = self.SYNTH_URL_TEMPLATE.format(voice_id=voice_id)
 
-        # Default voice settings
-        default_settings = {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-        }
-        default_settings.update(voice_settings)
+        # Only build a new settings dict when overrides are given
+        settings = self.DEFAULT_VOICE_SETTINGS
+        if voice_settings:
+            settings = {**settings, **voice_settings}
 
         # Build request payload
         payload = {
             "text": text,
             "model_id": self.model,
-            "voice_settings": default_settings
+            "voice_settings": settings
         }
 
-        try:
-            response = requests.post(url, json=payload, headers=self.headers)
+        # Serve repeated requests from the audio cache
+        cache_key = self._cache_key(voice_id=voice_id, payload=payload)
+        audio_bytes = self._cache_get(cache_key)
 
-            # Check for rate limiting
-            if response.status_code == 429:
-                raise TTSRateLimitError("ElevenLabs API rate limit exceeded")
+        if audio_bytes is None:
+            self._check_voice(voice_id)
+            try:
+                response = post_json(self._session, url, payload, headers=self._audio_headers)
 
-            response.raise_for_status()
-            audio_bytes = response.content
+                # Check for rate limiting
+                if response.status_code == 429:
+                    raise TTSRateLimitError("ElevenLabs API rate limit exceeded")
 
-        except TTSRateLimitError:
-            raise
-        except requests.exceptions.RequestException as e:
-            raise TTSAPIError(f"ElevenLabs TTS API request failed: {e}") from e
+                if response.status_code == 404:
+                    self._reject_voice(voice_id)
+
+                response.raise_for_status()
+                audio_bytes = response.content
+
+            except (TTSRateLimitError, TTSConfigurationError):
+                raise
+            except requests.exceptions.RequestException as e:
+                raise TTSAPIError(f"ElevenLabs TTS API request failed: {e}") from e
+
+            self._cache_put(cache_key, audio_bytes)
 
         # Write to file if requested
         if output_file:
             try:
-                # Convert MP3 to WAV if needed
-                if output_file.endswith('.wav'):
-                    # For now, just write MP3 and note that conversion is needed
-                    # In production, you'd use pydub or similar to convert
-                    with open(output_file, 'wb') as f:
-                        f.write(audio_bytes)
+                if isinstance(output_file, str) and output_file.endswith('.wav'):
+                    write_output(output_file, self._mp3_to_wav(audio_bytes))
                 else:
-                    with open(output_file, 'wb') as f:
-                        f.write(audio_bytes)
+                    write_output(output_file, audio_bytes)
             except IOError as e:
                 raise TTSAPIError(f"Failed to write audio file: {e}") from e
 
         return audio_bytes
 
+    @staticmethod
+    def _mp3_to_wav(mp3_bytes: bytes) -> bytes:
+        """
+        Transcode MP3 audio to a WAV file in memory.
+
+        Decoding is done by ffmpeg through pydub, imported here so that
+        callers who never write .wav files do not load it.
+
+        Args:
+            mp3_bytes: MP3 audio from the API
+
+        Returns:
+            WAV file bytes
+
+        Raises:
+            TTSAPIError: If the audio cannot be decoded
+        """
+        from pydub import AudioSegment
+        from pydub.exceptions import CouldntDecodeError
+
+        try:
+            segment = AudioSegment.from_file(io.BytesIO(mp3_bytes), format='mp3')
+            buf = io.BytesIO()
+            segment.export(buf, format='wav')
+        except (CouldntDecodeError, OSError) as e:
+            raise TTSAPIError(f"Failed to convert ElevenLabs audio to WAV: {e}") from e
+        return buf.getvalue()
+
     def synthesize_stream(
         self,
         text: str,
         voice: str,
         locale: str,
         rate: float = 1.0,
-        chunk_size: int = 4096
+        chunk_size: Optional[int] = None,
+        output_file: Optional[str] = None
     ) -> Iterator[bytes]:
         """
         Synthesize text to speech as a stream of audio chunks.
@@ -237,7 +379,8 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
             voice: Voice ID
             locale: Locale code (ignored)
             rate: Speaking rate (ignored)
-            chunk_size: Size of audio chunks in bytes
+            chunk_size: Size of audio chunks in bytes (default: stream_chunk_size)
+            output_file: Optional path; chunks are written to it as they arrive
 
         Yields:
             Audio chunks as bytes (MP3 format)
@@ -245,35 +388,265 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         Raises:
             TTSAPIError: If synthesis fails
         """
-        url = f"{self.BASE_URL}/text-to-speech/{voice}/stream"
+        try:
+            response = self._open_stream(text, voice)
+
+            # Stream the response; closing it returns the pooled connection
+            # even if the consumer stops early
+            try:
+                chunks = response.iter_content(chunk_size=chunk_size or self.stream_chunk_size)
+                if output_file:
+                    # Write each chunk straight to the descriptor as it arrives
+                    fd = open_for_write(output_file)
+                    try:
+                        for chunk in chunks:
+                            if chunk:
+                                write_all(fd, chunk)
+                                yield chunk
+                    finally:
+                        os.close(fd)
+                else:
+                    for chunk in chunks:
+                        if chunk:
+                            yield chunk
+            finally:
+                response.close()
+
+        except TTSRateLimitError:
+            raise
+        except requests.exceptions.RequestException as e:
+            raise TTSAPIError(f"ElevenLabs TTS streaming failed: {e}") from e
+        except IOError as e:
+            raise TTSAPIError(f"Failed to write audio file: {e}") from e
+
+    def synthesize_stream_mv(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        rate: float = 1.0,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[memoryview]:
+        """
+        Stream synthesized audio as views over one reusable buffer.
+
+        Like synthesize_stream(), but the socket is read straight into a
+        single bytearray and each chunk is a memoryview of it, so no new
+        bytes object is allocated per chunk. A view is only valid until
+        the next chunk is requested; copy it with bytes(view) to keep it.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID
+            locale: Locale code (ignored)
+            rate: Speaking rate (ignored)
+            chunk_size: Buffer size in bytes (default: stream_chunk_size)
+
+        Yields:
+            Audio chunks as memoryviews (MP3 format)
+
+        Raises:
+            TTSAPIError: If synthesis fails
+        """
+        try:
+            response = self._open_stream(text, voice)
+            raw = response.raw
+            raw.decode_content = True
+
+            buf = bytearray(chunk_size or self.stream_chunk_size)
+            view = memoryview(buf)
+            try:
+                while n := raw.readinto(buf):
+                    yield view[:n]
+            finally:
+                response.close()
+
+        except TTSRateLimitError:
+            raise
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            raise TTSAPIError(f"ElevenLabs TTS streaming failed: {e}") from e
+
+    def stream_to_file(
+        self,
+        text: str,
+        voice: str,
+        locale: str,
+        output_file: str,
+        rate: float = 1.0,
+        chunk_size: Optional[int] = None
+    ) -> int:
+        """
+        Stream synthesized audio straight to a file.
+
+        Network reads and disk writes run on separate threads joined by a
+        small bounded queue, so a slow disk does not stall the download
+        and a slow network does not stall the disk.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID
+            locale: Locale code (ignored)
+            output_file: Path to write the audio to (MP3 format)
+            rate: Speaking rate (ignored)
+            chunk_size: Read size in bytes (default: stream_chunk_size)
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            TTSAPIError: If synthesis or writing the file fails
+        """
+        try:
+            response = self._open_stream(text, voice)
+            return self._stream_to_file(
+                response, output_file, chunk_size or self.stream_chunk_size
+            )
+        except TTSRateLimitError:
+            raise
+        except requests.exceptions.RequestException as e:
+            raise TTSAPIError(f"ElevenLabs TTS streaming failed: {e}") from e
+        except IOError as e:
+            raise TTSAPIError(f"Failed to write audio file: {e}") from e
+
+    def _open_stream(self, text: str, voice: str) -> requests.Response:
+        """
+        Start a streaming synthesis request.
+
+        Args:
+            text: Text to synthesize
+            voice: Voice ID
+
+        Returns:
+            Response whose body has not been read yet; the caller must
+            close it. On error the response is closed before raising.
+
+        Raises:
+            TTSRateLimitError: If the API rate limit is exceeded
+            requests.exceptions.RequestException: If the request fails
+        """
+        self._check_voice(voice)
+        url = self.STREAM_URL_TEMPLATE.format(voice_id=voice)
 
         payload = {
             "text": text,
             "model_id": self.model,
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-            }
+            "voice_settings": self.DEFAULT_VOICE_SETTINGS
         }
 
-        try:
-            response = requests.post(url, json=payload, headers=self.headers, stream=True)
+        response = post_json(
+            self._session, url, payload, headers=self._audio_headers, stream=True
+        )
 
-            # Check for rate limiting
-            if response.status_code == 429:
-                raise TTSRateLimitError("ElevenLabs API rate limit exceeded")
+        # Check for rate limiting
+        if response.status_code == 429:
+            response.close()
+            raise TTSRateLimitError("ElevenLabs API rate limit exceeded")
 
+        if response.status_code == 404:
+            response.close()
+            self._reject_voice(voice)
+
+        try:
             response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+        return response
 
-            # Stream the response
+    def _check_voice(self, voice_id: str) -> None:
+        """
+        Fail fast for a voice ID the API has already rejected.
+
+        Raises:
+            TTSConfigurationError: If the voice ID was previously not found
+        """
+        if voice_id in self._invalid_voices:
+            raise TTSConfigurationError(
+                f"ElevenLabs voice ID '{voice_id}' was previously rejected as not found. "
+                "Call clear_voice_cache() after fixing the voice configuration."
+            )
+
+    def _reject_voice(self, voice_id: str) -> None:
+        """
+        Remember a voice ID the API reported as not found.
+
+        Raises:
+            TTSConfigurationError: Always, reporting the unknown voice ID
+        """
+        self._invalid_voices[voice_id] = None
+        if len(self._invalid_voices) > self.MAX_INVALID_VOICES:
+            self._invalid_voices.popitem(last=False)
+        raise TTSConfigurationError(f"ElevenLabs voice ID '{voice_id}' was not found")
+
+    def clear_voice_cache(self) -> None:
+        """Forget voice IDs previously rejected by the API."""
+        self._invalid_voices.clear()
+
+    @staticmethod
+    def _stream_to_file(
+        response: requests.Response,
+        path: str,
+        chunk_size: int,
+        queue_depth: int = 4
+    ) -> int:
+        """
+        Copy a streaming response body to a file through a bounded queue.
+
+        The calling thread reads from the network and a worker thread
+        writes to disk. At most queue_depth chunks are buffered between
+        them.
+
+        Args:
+            response: Streaming response from _open_stream()
+            path: Destination file path
+            chunk_size: Read size in bytes
+            queue_depth: Maximum chunks buffered between reader and writer
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            OSError: If the file cannot be written
+            requests.exceptions.RequestException: If reading the body fails
+        """
+        chunks = queue.Queue(maxsize=queue_depth)
+        errors = []
+
+        def drain():
+            fd = None
+            try:
+                fd = open_for_write(path)
+            except OSError as e:
+                errors.append(e)
+            # Keep consuming after a failure so the reader never blocks
+            while (chunk := chunks.get()) is not None:
+                if not errors:
+                    try:
+                        write_all(fd, chunk)
+                    except OSError as e:
+                        errors.append(e)
+            if fd is not None:
+                os.close(fd)
+
+        writer = threading.Thread(target=drain, name="elevenlabs-stream-writer", daemon=True)
+        writer.start()
+
+        total = 0
+        try:
             for chunk in response.iter_content(chunk_size=chunk_size):
+                if errors:
+                    break
                 if chunk:
-                    yield chunk
+                    chunks.put(chunk)
+                    total += len(chunk)
+        finally:
+            chunks.put(None)
+            writer.join()
+            response.close()
 
-        except TTSRateLimitError:
-            raise
-        except requests.exceptions.RequestException as e:
-            raise TTSAPIError(f"ElevenLabs TTS streaming failed: {e}") from e
+        if errors:
+            raise errors[0]
+        return total
 
     def list_custom_voices(self) -> list:
         """
@@ -282,26 +655,52 @@ class ElevenLabsTTSProvider(CustomVoiceCapable, StreamingCapable):
         Returns:
             List of voice dictionaries with 'id' and 'name' keys
 
+        Raises:
+            TTSAPIError: If API call fails
+        """
+        return list(self.iter_custom_voices())
+
+    def iter_custom_voices(self) -> Iterator[dict]:
+        """
+        Iterate over available custom voices for this account.
+
+        When the optional ijson package is installed the response is parsed
+        incrementally while it downloads, so memory stays flat for large
+        voice catalogs and stopping early skips the rest of the body.
+        Otherwise the response is decoded in one go.
+
+        Yields:
+            Voice dictionaries with 'id', 'name', 'category' and 'labels' keys
+
         Raises:
             TTSAPIError: If API call fails
         """
         url = f"{self.BASE_URL}/voices"
+        stream = ijson is not None
+        response = None
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._session.get(url, headers=self.headers, stream=stream)
             response.raise_for_status()
-            data = response.json()
 
-            voices = []
-            for voice in data.get('voices', []):
-                voices.append({
+            if stream:
+                response.raw.decode_content = True
+                voices = ijson.items(response.raw, 'voices.item')
+            else:
+                voices = json_loads(response.content).get('voices', [])
+
+            for voice in voices:
+                yield {
                     'id': voice['voice_id'],
                     'name': voice['name'],
                     'category': voice.get('category', 'custom'),
                     'labels': voice.get('labels', {}),
-                })
-
-            return voices
+                }
 
         except requests.exceptions.RequestException as e:
             raise TTSAPIError(f"Failed to list ElevenLabs voices: {e}") from e
+        except (KeyError, ValueError) as e:
+            raise TTSAPIError(f"Failed to parse ElevenLabs voices response: {e}") from e
+        finally:
+            if stream and response is not None:
+                response.close()
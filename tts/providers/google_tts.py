@@ -1,14 +1,45 @@
 """Google Cloud Text-to-Speech provider implementation."""
 
-import base64
+import binascii
+import io
+import wave
 import requests
-from typing import Optional
-from tts.base import TTSProvider, TTSAPIError, TTSConfigurationError
+from dataclasses import replace
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+from xml.sax.saxutils import escape
+from tts.base import (
+    DEFAULT_CACHE_MAX_BYTES,
+    AsyncSynthesisMixin,
+    BatchSynthesisMixin,
+    CachedTTSMixin,
+    TTSProvider,
+    TTSAPIError,
+    TTSConfigurationError,
+    TTSRateLimitError,
+)
+from tts._http import build_session, json_loads, post_json, warm_up, warm_up_in_background
+from tts._io import write_output
 from tts.capabilities import TTSCapabilities
 from tts.features import AudioEffectsCapable
 
+# Request headers shared by every synthesis call
+_HEADERS = {'content-type': 'application/json'}
 
-class GoogleTTSProvider(AudioEffectsCapable):
+# Decode base64 with pybase64's SIMD decoder when installed; otherwise call
+# the C routine directly, as base64.b64decode adds a Python-level wrapper
+# and an extra copy for altchars translation
+try:
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    _b64decode = binascii.a2b_base64
+
+
+class GoogleTTSProvider(
+    CachedTTSMixin,
+    AsyncSynthesisMixin,
+    BatchSynthesisMixin,
+    AudioEffectsCapable,
+):
     """
     Google Cloud Text-to-Speech provider.
 
@@ -19,6 +50,22 @@ class GoogleTTSProvider(AudioEffectsCapable):
     - Speaking rate and pitch control
     """
 
+    # Capabilities for an instance with default settings
+    CAPABILITIES = TTSCapabilities(
+        supports_streaming=False,
+        supports_ssml=True,
+        supports_custom_voices=False,
+        supported_audio_formats=["wav", "mp3", "ogg"],
+        max_text_length=5000,
+        max_requests_per_minute=None,
+        supports_pitch_control=True,
+        supports_rate_control=True,
+        supports_volume_control=True,
+        supports_audio_effects=True,
+        supports_batch_ssml=True,
+        requires_api_key=True,
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -26,6 +73,9 @@ class GoogleTTSProvider(AudioEffectsCapable):
         va_locale: str = "en-US",
         caller_voice: str = "en-US-Journey-D",
         caller_locale: str = "en-US",
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        warmup: bool = False,
         **kwargs
     ):
         """
@@ -37,6 +87,9 @@ class GoogleTTSProvider(AudioEffectsCapable):
             va_locale: Default locale for virtual assistant
             caller_voice: Default voice for caller
             caller_locale: Default locale for caller
+            cache_dir: Directory for cached audio (None disables caching)
+            cache_max_bytes: Maximum total size of cached audio in bytes
+            warmup: Open a connection to the API on a background thread
             **kwargs: Additional configuration (ignored)
 
         Raises:
@@ -50,25 +103,22 @@ class GoogleTTSProvider(AudioEffectsCapable):
 
         self.api_key = api_key
         self.base_url = 'https://texttospeech.googleapis.com/v1beta1/text:synthesize'
+        # Request URL with the key, rebuilt only when the key changes
+        self._url = self._build_url()
         self.va_voice = va_voice
         self.va_locale = va_locale
         self.caller_voice = caller_voice
         self.caller_locale = caller_locale
+        self._init_cache(cache_dir, cache_max_bytes)
+        self._session = build_session()
 
-        # Define capabilities
-        self._capabilities = TTSCapabilities(
-            supports_streaming=False,
-            supports_ssml=True,
-            supports_custom_voices=False,
-            supported_audio_formats=["wav", "mp3", "ogg"],
-            max_text_length=5000,
-            max_requests_per_minute=None,
-            supports_pitch_control=True,
-            supports_rate_control=True,
-            supports_volume_control=True,
-            supports_audio_effects=True,
-            requires_api_key=True,
-        )
+        # Capabilities are shared; copy only when settings change them
+        self._capabilities = self.CAPABILITIES
+        if self.cache_enabled:
+            self._capabilities = replace(self.CAPABILITIES, cache_enabled=True)
+
+        if warmup:
+            warm_up_in_background(self._session, self.base_url)
 
     @property
     def name(self) -> str:
@@ -79,6 +129,36 @@ class GoogleTTSProvider(AudioEffectsCapable):
         """Get provider capabilities."""
         return self._capabilities
 
+    def prewarm(self) -> None:
+        """
+        Open a connection to the API ahead of the first request.
+
+        Raises:
+            TTSAPIError: If the API host cannot be reached
+        """
+        try:
+            warm_up(self._session, self.base_url)
+        except requests.exceptions.RequestException as e:
+            raise TTSAPIError(f"Failed to connect to Google TTS: {e}") from e
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        """Use the provider as a context manager that closes its session."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Release pooled HTTP connections on leaving the with block."""
+        self.close()
+
+    def __del__(self):
+        """Release pooled HTTP connections when the provider is discarded."""
+        self.close()
+
     def configure(self, **kwargs) -> None:
         """
         Configure the provider with additional settings.
@@ -88,6 +168,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
         """
         if 'api_key' in kwargs:
             self.api_key = kwargs['api_key']
+            self._url = self._build_url()
         if 'va_voice' in kwargs:
             self.va_voice = kwargs['va_voice']
         if 'va_locale' in kwargs:
@@ -103,7 +184,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
         voice: str,
         locale: str,
         rate: float = 1.0,
-        output_file: str = None
+        output_file: Union[str, BinaryIO] = None
     ) -> bytes:
         """
         Synthesize text to speech audio using Google TTS.
@@ -113,7 +194,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
             voice: Voice name (e.g., 'en-US-Journey-O')
             locale: Locale code (e.g., 'en-US')
             rate: Speaking rate (1.0 is normal)
-            output_file: Optional path to write WAV file
+            output_file: Optional path or binary file object to write WAV to
 
         Returns:
             Raw audio bytes (LINEAR16 WAV format)
@@ -138,7 +219,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
         locale: str,
         rate: float = 1.0,
         effects_profile: str = None,
-        output_file: str = None
+        output_file: Union[str, BinaryIO] = None
     ) -> bytes:
         """
         Synthesize text with specific audio effects.
@@ -149,7 +230,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
             locale: Locale code
             rate: Speaking rate
             effects_profile: Effects profile ID (e.g., 'telephony-class-application')
-            output_file: Optional path to write WAV file
+            output_file: Optional path or binary file object to write WAV to
 
         Returns:
             Raw audio bytes
@@ -193,7 +274,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
         rate: float,
         pitch: float,
         effects_profile: Optional[str],
-        output_file: Optional[str]
+        output_file: Union[str, BinaryIO, None]
     ) -> bytes:
         """
         Internal method to synthesize text with full control.
@@ -205,7 +286,7 @@ class GoogleTTSProvider(AudioEffectsCapable):
             rate: Speaking rate
             pitch: Pitch adjustment (-20.0 to 20.0)
             effects_profile: Effects profile ID
-            output_file: Optional output file path
+            output_file: Optional output path or binary file object
 
         Returns:
             Raw audio bytes
@@ -213,9 +294,6 @@ class GoogleTTSProvider(AudioEffectsCapable):
         Raises:
             TTSAPIError: If API request fails
         """
-        url = f'{self.base_url}?alt=json&key={self.api_key}'
-        headers = {'content-type': 'application/json'}
-
         # Build audio config
         audio_config = {
             "audioEncoding": "LINEAR16",
@@ -238,27 +316,148 @@ class GoogleTTSProvider(AudioEffectsCapable):
             }
         }
 
-        # Make API request
-        try:
-            response = requests.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            raise TTSAPIError(f"Google TTS API request failed: {e}") from e
+        # Serve repeated requests from the audio cache
+        cache_key = self._cache_key(payload=payload)
+        decoded_data = self._cache_get(cache_key)
 
-        # Parse response
-        try:
-            audio_json = response.json()
-            audio_content = audio_json['audioContent']
-            decoded_data = base64.b64decode(audio_content, ' /')
-        except (KeyError, ValueError) as e:
-            raise TTSAPIError(f"Failed to parse Google TTS API response: {e}") from e
+        if decoded_data is None:
+            decoded_data = self._decode_audio(self._post_synthesis(payload))
+
+            self._cache_put(cache_key, decoded_data)
 
         # Write to file if requested
         if output_file:
             try:
-                with open(output_file, 'wb') as f:
-                    f.write(decoded_data)
+                write_output(output_file, decoded_data)
             except IOError as e:
                 raise TTSAPIError(f"Failed to write audio file: {e}") from e
 
         return decoded_data
+
+    def synthesize_batch_ssml(
+        self,
+        phrases: List[str],
+        voice: str,
+        locale: str,
+        rate: float = 1.0
+    ) -> List[bytes]:
+        """
+        Synthesize several short phrases with a single API request.
+
+        The phrases are joined into one SSML document with a <mark> before
+        each phrase. The returned audio is then cut at the mark timepoints
+        reported by the API. This costs one round trip instead of one per
+        phrase.
+
+        Args:
+            phrases: Plain-text phrases to synthesize
+            voice: Voice name
+            locale: Locale code
+            rate: Speaking rate
+
+        Returns:
+            One WAV clip per phrase, in input order
+
+        Raises:
+            TTSAPIError: If the request fails or the response lacks timepoints
+        """
+        if not phrases:
+            return []
+
+        ssml = '<speak>' + ''.join(
+            f'<mark name="p{i}"/>{escape(phrase)}' for i, phrase in enumerate(phrases)
+        ) + '</speak>'
+
+        payload = {
+            "audioConfig": {
+                "audioEncoding": "LINEAR16",
+                "pitch": 0,
+                "speakingRate": rate,
+                "effectsProfileId": ["telephony-class-application"],
+            },
+            "input": {
+                "ssml": ssml
+            },
+            "voice": {
+                "languageCode": locale,
+                "name": voice
+            },
+            "enableTimePointing": ["SSML_MARK"],
+        }
+
+        audio_json = self._post_synthesis(payload)
+        audio = self._decode_audio(audio_json)
+
+        try:
+            marks = {tp['markName']: tp['timeSeconds'] for tp in audio_json.get('timepoints', [])}
+            starts = [marks[f'p{i}'] for i in range(len(phrases))]
+        except KeyError as e:
+            raise TTSAPIError(f"Google TTS response is missing timepoint {e}") from e
+
+        try:
+            with wave.open(io.BytesIO(audio)) as wav:
+                params = wav.getparams()
+                frames = memoryview(wav.readframes(params.nframes))
+        except (wave.Error, EOFError) as e:
+            raise TTSAPIError(f"Failed to parse Google TTS audio: {e}") from e
+
+        # Cut at sample boundaries; the first clip also keeps any lead-in
+        frame_size = params.sampwidth * params.nchannels
+        cuts = [round(t * params.framerate) * frame_size for t in starts[1:]]
+        bounds = [0, *cuts, len(frames)]
+
+        clips = []
+        for start, end in zip(bounds, bounds[1:]):
+            buf = io.BytesIO()
+            with wave.open(buf, 'wb') as out:
+                out.setparams(params)
+                out.writeframes(frames[start:end])
+            clips.append(buf.getvalue())
+        return clips
+
+    def _build_url(self) -> str:
+        """Build the synthesis request URL for the current API key."""
+        return f'{self.base_url}?alt=json&key={self.api_key}'
+
+    def _post_synthesis(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a synthesis request and parse the JSON response.
+
+        Args:
+            payload: Request body
+
+        Returns:
+            Parsed response
+
+        Raises:
+            TTSRateLimitError: If the API rejects the request with 429
+            TTSAPIError: If the request fails or the response is not JSON
+        """
+        try:
+            response = post_json(self._session, self._url, payload, headers=_HEADERS)
+
+            # Check for rate limiting
+            if response.status_code == 429:
+                raise TTSRateLimitError("Google TTS API rate limit exceeded")
+
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise TTSAPIError(f"Google TTS API request failed: {e}") from e
+
+        try:
+            return json_loads(response.content)
+        except ValueError as e:
+            raise TTSAPIError(f"Failed to parse Google TTS API response: {e}") from e
+
+    @staticmethod
+    def _decode_audio(audio_json: Dict[str, Any]) -> bytes:
+        """
+        Decode the base64 audio content of a synthesis response.
+
+        Raises:
+            TTSAPIError: If the audio content is missing or malformed
+        """
+        try:
+            return _b64decode(audio_json['audioContent'])
+        except (KeyError, ValueError) as e:
+            raise TTSAPIError(f"Failed to parse Google TTS API response: {e}") from e